@@ -0,0 +1,65 @@
+"""
+Benchmark raw_content compression in the Silo.
+
+Loads the bundled Hip_TRTIIH_SP_2 dataset without compression and with each
+codec, then reports resident memory (Silo.memory_report) against the time
+to read every page's raw_content with a cold and a warm decompressed cache.
+
+Usage:
+    python devtools/benchmark_compression.py [path/to/final_output.json]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path so `src` imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.silo import Silo
+
+DEFAULT_DATA_PATH = Path(__file__).parent.parent / "data" / "Hip_TRTIIH_SP_2_20250703_121853" / "final_output.json"
+ROUNDS = 20
+
+
+def read_all_raw_content(silo: Silo) -> float:
+    """Read raw_content of every page once and return the seconds taken."""
+    started = time.perf_counter()
+    for page in silo.iter_pages():
+        page.get("raw_content")
+    return time.perf_counter() - started
+
+
+def run(data_path: str, compression, cache_bytes: int):
+    """Benchmark one configuration and print a result row."""
+    silo = Silo(compression=compression, decompressed_cache_bytes=cache_bytes)
+    started = time.perf_counter()
+    silo.load_document("hip", data_path)
+    load_ms = (time.perf_counter() - started) * 1000
+    
+    cold = []
+    for _ in range(ROUNDS):
+        silo.decompressed_cache.clear()
+        cold.append(read_all_raw_content(silo))
+    warm = [read_all_raw_content(silo) for _ in range(ROUNDS)]
+    
+    report = silo.memory_report()
+    usage = report["documents"]["hip"]
+    pages = silo.get_document_info("hip").page_count
+    print(f"{str(compression):<6} {cache_bytes:>9} {load_ms:>8.1f} "
+          f"{usage['raw_content_bytes']:>12} {usage['total_bytes'] + report['decompressed_cache_bytes']:>12} "
+          f"{min(cold) / pages * 1e6:>13.1f} {min(warm) / pages * 1e6:>13.1f}")
+
+
+def main():
+    data_path = sys.argv[1] if len(sys.argv) > 1 else str(DEFAULT_DATA_PATH)
+    print(f"Dataset: {data_path}")
+    print(f"{'codec':<6} {'cache':>9} {'load ms':>8} {'raw bytes':>12} {'resident':>12} "
+          f"{'cold us/page':>13} {'warm us/page':>13}")
+    for compression in (None, "zlib", "lzma"):
+        for cache_bytes in ((1 << 20,) if compression is None else (0, 1 << 20)):
+            run(data_path, compression, cache_bytes)
+
+
+if __name__ == "__main__":
+    main()
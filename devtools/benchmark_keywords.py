@@ -0,0 +1,149 @@
+"""
+Benchmark keyword extraction in KeywordDiscovery.
+
+Loads the bundled datasets and compares the compiled single-pass tokenizer
+(every page text field and every table row) with the previous extraction,
+which split page "content" on whitespace in Python and sampled only the
+first 5 rows of each table. Both build the same per-location postings.
+Reports build time, vocabulary size, keyword occurrences indexed and the
+cost per thousand occurrences for each.
+
+Then syncs a KeywordDiscovery over COPIES copies of the datasets, serially
+and with worker processes, to show what parallel tokenizing gains on this
+machine (it needs more than one CPU to gain anything).
+
+Usage:
+    python devtools/benchmark_keywords.py [path/to/final_output.json ...]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add the repository root to the path so `src` imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.silo import Silo
+from src.toolshed.discovery.keyword_discovery import KeywordDiscovery, extract_document_postings
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_DATA_PATHS = [
+    DATA_DIR / "Hip_TRTIIH_SP_2_20250703_121853" / "final_output.json",
+    DATA_DIR / "pb&j_20250626_173624" / "final_output.json",
+]
+ROUNDS = 50
+COPIES = 10
+SYNC_WORKERS = (1, 2, 4)
+
+
+def legacy_text(text, counts):
+    """Previous per-word extraction: split, strip punctuation, keep alphanumerics."""
+    if not text:
+        return
+    words = text.lower().split()
+    words = [word.strip('.,!?;:()[]{}"\'') for word in words]
+    counts.update(word for word in words if len(word) > 2 and word.isalnum())
+
+
+def legacy_metadata(metadata, counts):
+    for value in (metadata or {}).values():
+        if isinstance(value, str):
+            legacy_text(value, counts)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, str):
+                    legacy_text(item, counts)
+
+
+def legacy_extract(pages):
+    """Previous extraction: page 'content' and metadata, table headers and the first 5 rows."""
+    doc_postings = {}
+    
+    def add_postings(counts, location):
+        for keyword, count in counts.items():
+            doc_postings.setdefault(keyword, []).append((location, count))
+    
+    for page in pages:
+        page_id = page["page_id"]
+        counts = Counter()
+        legacy_text(page.get("content", ""), counts)
+        if "metadata" in page:
+            legacy_metadata(page["metadata"], counts)
+        add_postings(counts, (page_id, None, None))
+        for table in page.get("tables", []):
+            table_id = table.get("table_id")
+            counts = Counter()
+            legacy_text(table.get("title", ""), counts)
+            legacy_text(table.get("description", ""), counts)
+            if "metadata" in table:
+                legacy_metadata(table["metadata"], counts)
+            add_postings(counts, (page_id, table_id, None))
+            for row_index, row in enumerate(table.get("rows", [])[:5]):
+                counts = Counter()
+                if isinstance(row, dict):
+                    for value in row.values():
+                        if isinstance(value, str):
+                            legacy_text(value, counts)
+                add_postings(counts, (page_id, table_id, row_index))
+    return doc_postings
+
+
+def tokens_indexed(builds) -> int:
+    """Total keyword occurrences recorded across all postings."""
+    return sum(count for doc_postings in builds for postings in doc_postings.values() for _, count in postings)
+
+
+def best_of(function) -> float:
+    """Run a function ROUNDS times and return the fastest run in milliseconds."""
+    times = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+def sync_ms(data_paths, workers: int) -> float:
+    """Time a full keyword index sync over COPIES copies of the datasets."""
+    silo = Silo()
+    for copy in range(COPIES):
+        for position, data_path in enumerate(data_paths):
+            silo.load_document(f"copy{copy}_doc{position}", data_path)
+    discovery = KeywordDiscovery(silo, workers=workers)
+    started = time.perf_counter()
+    discovery.keyword_count()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    data_paths = sys.argv[1:] or [str(path) for path in DEFAULT_DATA_PATHS]
+    silo = Silo()
+    for position, data_path in enumerate(data_paths):
+        silo.load_document(f"doc{position}", data_path)
+    doc_ids = silo.get_document_ids()
+    
+    def compiled():
+        return [extract_document_postings(silo.iter_pages(doc_id)) for doc_id in doc_ids]
+    
+    def legacy():
+        return [legacy_extract(silo.iter_pages(doc_id)) for doc_id in doc_ids]
+    
+    rows = sum(len(table.get("rows", [])) for table in silo.iter_tables())
+    print(f"Documents: {len(doc_ids)}, pages: {sum(1 for _ in silo.iter_pages())}, table rows: {rows}")
+    print(f"{'extraction':<28} {'ms/build':>9} {'vocabulary':>11} {'tokens':>8} {'us/1k tok':>11}")
+    for name, function in (("legacy (content, 5 rows)", legacy), ("compiled (all fields/rows)", compiled)):
+        builds = function()
+        build_ms = best_of(function)
+        tokens = tokens_indexed(builds)
+        print(f"{name:<28} {build_ms:>9.2f} {len(set().union(*builds)):>11} {tokens:>8} {build_ms * 1000 / max(tokens, 1):>11.2f}")
+    
+    print(f"\nSync of {COPIES * len(data_paths)} documents, CPUs: {os.cpu_count()}")
+    print(f"{'workers':<28} {'ms/sync':>9}")
+    for workers in SYNC_WORKERS:
+        print(f"{workers:<28} {sync_ms(data_paths, workers):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
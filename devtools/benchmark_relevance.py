@@ -0,0 +1,129 @@
+"""
+Benchmark RelevanceFinder ranking.
+
+Loads the bundled Hip_TRTIIH_SP_2 dataset under several document IDs and
+compares BM25F ranking over the inverted indexes with the previous
+approach: substring-testing every query token against every field of every
+cached table and page. The legacy scan is given the same fields the index
+covers (raw_content, column names from the row keys, sample values), since
+the old caches read fields that final_output.json does not carry.
+
+Usage:
+    python devtools/benchmark_relevance.py [copies]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add the repository root to the path so `src` imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.columnar import column_names
+from src.silo import Silo
+from src.toolshed.exploration import RelevanceFinder
+from src.toolshed.exploration.bm25 import tokenize
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "Hip_TRTIIH_SP_2_20250703_121853" / "final_output.json"
+QUERIES = ["acetabular shell insert", "drill bit size", "trial head", "ceramic liner compatibility"]
+ROUNDS = 10
+
+
+def legacy_caches(silo: Silo):
+    """Build the legacy lowercased table and page caches."""
+    tables, pages = [], []
+    for page in silo.iter_pages():
+        titles = []
+        for table in page.get("tables", []):
+            names = column_names(table)
+            values = [str(row[name]).lower() for row in table.get("rows", [])[:3] for name in names if name in row]
+            tables.append({
+                "category": str(table.get("metadata", {}).get("technical_category", "Unknown")).lower(),
+                "column_names": [name.lower() for name in names],
+                "sample_values": values,
+                "description": table.get("description", "").lower()
+            })
+            titles.append(table.get("title", "").lower())
+        content = page.get("raw_content", "").lower()
+        pages.append({"content": content, "keywords": set(tokenize(content)), "table_titles": titles})
+    return tables, pages
+
+
+def legacy_score(criteria, tokens):
+    """Previous scoring: best of (share of tokens matched x weight) over the criteria, with details."""
+    best, relation, details = 0.0, "", []
+    for name, weight, matches in criteria:
+        matched = sum(1 for token in tokens if matches(token))
+        if matched:
+            score = min(matched / len(tokens), 1.0) * weight
+            if score > best:
+                best, relation = score, name
+                details.append(f"{name} matches: {matched} tokens")
+    return best, relation, "; ".join(details)
+
+
+def legacy_query(tables, pages, query: str):
+    """Score every cached table and page by substring matches, as the old RelevanceFinder did."""
+    tokens = tokenize(query)
+    table_results, page_results = [], []
+    for table in tables:
+        score, relation, details = legacy_score([
+            ("category", 0.8, lambda token: token in table["category"]),
+            ("column", 0.6, lambda token: any(token in column for column in table["column_names"])),
+            ("values", 0.4, lambda token: any(token in value for value in table["sample_values"])),
+            ("description", 0.3, lambda token: token in table["description"]),
+        ], tokens)
+        if score > 0:
+            table_results.append({"relation": relation, "relevance_score": score, "match_details": details})
+    for page in pages:
+        score, relation, details = legacy_score([
+            ("content", 0.7, lambda token: token in page["content"]),
+            ("table_titles", 0.5, lambda token: any(token in title for title in page["table_titles"])),
+            ("keywords", 0.3, lambda token: token in page["keywords"]),
+        ], tokens)
+        if score > 0:
+            page_results.append({"relation": relation, "relevance_score": score, "match_details": details})
+    table_results.sort(key=lambda result: result["relevance_score"], reverse=True)
+    page_results.sort(key=lambda result: result["relevance_score"], reverse=True)
+    return table_results, page_results
+
+
+def best_of(function) -> float:
+    """Run a function ROUNDS times and return the fastest run in milliseconds."""
+    times = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    silo = Silo()
+    for copy in range(copies):
+        silo.load_document(f"doc{copy}", str(DATA_PATH))
+    finder = RelevanceFinder(silo)
+    
+    started = time.perf_counter()
+    finder.find_relevant_tables("warm up")
+    index_ms = (time.perf_counter() - started) * 1000
+    tables, pages = legacy_caches(silo)
+    
+    def indexed():
+        for query in QUERIES:
+            finder.find_relevant_tables(query)
+            finder.find_relevant_pages(query)
+    
+    def legacy():
+        for query in QUERIES:
+            legacy_query(tables, pages, query)
+    
+    print(f"Documents: {copies}, tables: {len(tables)}, pages: {len(pages)}, index build: {index_ms:.1f} ms")
+    print(f"{'ranking':<22} {'ms/query':>9}")
+    print(f"{'legacy substring scan':<22} {best_of(legacy) / len(QUERIES):>9.2f}")
+    print(f"{'BM25F inverted index':<22} {best_of(indexed) / len(QUERIES):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Archives - Reading Pipeline Outputs Straight from .zip Files
+
+The PB&J pipeline delivers each run as a .zip of its output directory.
+These helpers let the rest of the farm address files inside such an
+archive with ordinary-looking paths and read them without extracting:
+
+    data/Hip_TRTIIH_SP_2_20250703_121853.zip/Hip_TRTIIH_SP_2_20250703_121853/final_output.json
+
+Any path component ending in ".zip" that names an existing file is treated
+as an archive, and the rest of the path as a member inside it. Members are
+streamed from the archive, so nothing is written to disk. macOS resource
+fork entries (__MACOSX/) are ignored.
+
+Example Usage:
+    path = resolve_source("data/example_pbj_output.zip")
+    with open_source(path) as f:
+        data = json.load(f)
+"""
+
+import os
+import zipfile
+from typing import IO, List, Optional, Tuple
+
+
+ARCHIVE_SUFFIX = ".zip"
+FINAL_OUTPUT_NAME = "final_output.json"
+
+# Archive entries that are never pipeline output
+_IGNORED_PREFIXES = ("__MACOSX/",)
+
+
+def split_archive_path(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a path into an archive file and a member path inside it.
+    
+    Args:
+        path: Filesystem path, possibly running through a .zip file
+    
+    Returns:
+        Tuple of (archive path, member path), with member "" for the archive
+        itself, or None if the path does not go through an archive
+    """
+    parts = os.path.normpath(str(path)).split(os.sep)
+    for position, part in enumerate(parts):
+        if part.lower().endswith(ARCHIVE_SUFFIX):
+            archive = os.sep.join(parts[:position + 1]) or os.sep
+            if os.path.isfile(archive):
+                return archive, "/".join(parts[position + 1:])
+    return None
+
+
+def is_archive_path(path: str) -> bool:
+    """Whether a path is an archive or a member inside one."""
+    return split_archive_path(path) is not None
+
+
+def archive_members(archive: str, name: str, prefix: str = "") -> List[zipfile.ZipInfo]:
+    """
+    List the file members of an archive with a given base name.
+    
+    Args:
+        archive: Path to the .zip file
+        name: Member base name to look for (e.g. "final_output.json")
+        prefix: Only consider members under this directory
+    
+    Returns:
+        Matching ZipInfo entries, shallowest first
+    """
+    prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+    with zipfile.ZipFile(archive) as zf:
+        members = [
+            info for info in zf.infolist()
+            if not info.is_dir()
+            and info.filename.startswith(prefix)
+            and not info.filename.startswith(_IGNORED_PREFIXES)
+            and info.filename.rsplit("/", 1)[-1] == name
+        ]
+    return sorted(members, key=lambda info: (info.filename.count("/"), info.filename))
+
+
+def resolve_source(path: str, name: str = FINAL_OUTPUT_NAME) -> str:
+    """
+    Resolve a path that may name an archive (or a directory inside one) to a file.
+    
+    Plain paths and paths that already name an archive member file are
+    returned unchanged.
+    
+    Args:
+        path: Path to a file, an archive, or a directory inside an archive
+        name: File to look for when the path names an archive or directory
+    
+    Returns:
+        Path to the file
+    
+    Raises:
+        FileNotFoundError: If the archive holds no such file
+    """
+    split = split_archive_path(path)
+    if split is None:
+        return str(path)
+    archive, member = split
+    if member and not member.endswith("/"):
+        with zipfile.ZipFile(archive) as zf:
+            names = set(zf.namelist())
+        if member in names:
+            return str(path)
+    members = archive_members(archive, name, member)
+    if not members:
+        raise FileNotFoundError(f"No {name} in archive {archive}" + (f" under {member}" if member else ""))
+    return os.path.join(archive, *members[0].filename.split("/"))
+
+
+def open_source(path: str) -> IO[bytes]:
+    """
+    Open a file or archive member for binary reading.
+    
+    Archive members are decompressed while being read. Seeking in a
+    compressed member is supported but re-reads it from the start.
+    
+    Args:
+        path: Path to a file or an archive member
+    
+    Returns:
+        Readable binary file object (use as a context manager)
+    """
+    split = split_archive_path(path)
+    if split is None:
+        return open(path, 'rb')
+    archive, member = split
+    zf = zipfile.ZipFile(archive)
+    try:
+        # The member stays readable after the ZipFile itself is closed
+        return zf.open(member)
+    finally:
+        zf.close()
+
+
+def source_stamp(path: str) -> Tuple[int, int]:
+    """
+    Get a change stamp for a file or archive member.
+    
+    Files use (size, mtime_ns). Archive members use (size, CRC-32) from the
+    archive's central directory, so rewriting an archive with the same
+    member content keeps the stamp.
+    
+    Args:
+        path: Path to a file or an archive member
+    
+    Returns:
+        Tuple of two integers that changes when the content changes
+    """
+    split = split_archive_path(path)
+    if split is None:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+    archive, member = split
+    with zipfile.ZipFile(archive) as zf:
+        info = zf.getinfo(member)
+    return info.file_size, info.CRC
+
+
+def list_source_directory(path: str) -> List[Tuple[str, Tuple[int, int]]]:
+    """
+    List the files directly inside a directory or an archive directory.
+    
+    Args:
+        path: Directory path, possibly inside an archive
+    
+    Returns:
+        List of (file name, stamp) pairs; stamps as in source_stamp()
+    
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    split = split_archive_path(path)
+    if split is None:
+        files = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files.append((entry.name, (stat.st_size, stat.st_mtime_ns)))
+        return files
+    
+    archive, member = split
+    prefix = f"{member.strip('/')}/" if member.strip("/") else ""
+    with zipfile.ZipFile(archive) as zf:
+        files = [
+            (info.filename[len(prefix):], (info.file_size, info.CRC))
+            for info in zf.infolist()
+            if not info.is_dir()
+            and info.filename.startswith(prefix)
+            and "/" not in info.filename[len(prefix):]
+        ]
+    if not files:
+        raise FileNotFoundError(f"No such directory in archive {archive}: {member}")
+    return files
@@ -17,10 +17,12 @@ Key Features:
 import json
 import logging
 import os
+from collections import Counter
 from typing import Dict, List, Optional, Any, Union, Callable
 from dataclasses import dataclass
 
 from src.silo import Silo
+from src.config import ConfigManager, DatasetChanges
 from src.toolshed.discovery import PageDiscovery, KeywordDiscovery, TableDiscovery
 from src.toolshed.exploration import TableExplorer, RelevanceFinder
 from src.toolshed.retrieval import TableRetriever, RowRetriever, PageRetriever
@@ -30,6 +32,12 @@ from src.models.search import SearchResult, SemanticSearchResult
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Number of most distinctive keywords sent to the LLM in the discovery phase
+DISCOVERY_KEYWORD_COUNT = 50
+
+# Number of leading page and table catalog entries kept in the discovery phase
+DISCOVERY_CATALOG_LIMIT = 10
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -72,6 +80,7 @@ class ToolDefinition:
     name: str
     description: str
     function: Callable
+    phase: str  # "discovery", "exploration" or "retrieval"
     parameters: Dict[str, Any]  # JSON Schema for parameters
 
 
@@ -102,6 +111,7 @@ class Barn:
         prompt_template (str): Template for LLM prompts
         max_context_length (int): Maximum context length for LLM
         confidence_threshold (float): Minimum confidence for responses
+        streaming (bool): Whether documents are loaded with only page headers resident
         tools (Dict[str, ToolDefinition]): Registry of available tools
         
         # Phase-based tools
@@ -115,7 +125,10 @@ class Barn:
                  llm_client: Optional[Any] = None,
                  prompt_template: Optional[str] = None,
                  max_context_length: int = 4000,
-                 confidence_threshold: float = 0.3):
+                 confidence_threshold: float = 0.3,
+                 memory_budget: Optional[int] = None,
+                 compression: Optional[str] = None,
+                 streaming: bool = False):
         """
         Initialize the Barn RAG agent.
         
@@ -125,9 +138,14 @@ class Barn:
             prompt_template: Custom prompt template
             max_context_length: Maximum context length for LLM
             confidence_threshold: Minimum confidence for responses
+            memory_budget: Evict least recently used document bodies above this
+                           many bytes (None keeps every document resident)
+            compression: Compress page raw_content with "zlib" or "lzma" (None = off)
+            streaming: Load documents incrementally, reading page bodies on demand
         """
         # Initialize data storage
-        self.silo = Silo()
+        self.silo = Silo(memory_budget=memory_budget, compression=compression)
+        self.streaming = streaming
         if data_path:
             # Load the document with a default ID
             self.load_document("default", data_path)
@@ -181,11 +199,25 @@ class Barn:
         
         self.tools["view_pages"] = ToolDefinition(
             name="view_pages",
-            description="Get overview of all available pages with titles and numbers",
+            description="Get overview of available pages with titles and numbers, ordered by page number and paginated by offset/limit",
             function=self.page_discovery.view_pages,
+            phase="discovery",
             parameters={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of pages to skip (default 0)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of pages to return (default all)"
+                    },
+                    "doc_id": {
+                        "type": "string",
+                        "description": "Only list pages of this document"
+                    }
+                },
                 "required": []
             }
         )
@@ -194,6 +226,7 @@ class Barn:
             name="view_keywords",
             description="Get overview of all available keywords in the dataset",
             function=self.keyword_discovery.view_keywords,
+            phase="discovery",
             parameters={
                 "type": "object",
                 "properties": {},
@@ -201,13 +234,139 @@ class Barn:
             }
         )
         
+        self.tools["search_keywords"] = ToolDefinition(
+            name="search_keywords",
+            description="Complete a keyword prefix, returning the most widespread matching keywords with their document counts",
+            function=self.keyword_discovery.search_keywords,
+            phase="discovery",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "prefix": {
+                        "type": "string",
+                        "description": "Start of the keyword to complete"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of completions (default 10)"
+                    }
+                },
+                "required": ["prefix"]
+            }
+        )
+        
+        self.tools["top_keywords"] = ToolDefinition(
+            name="top_keywords",
+            description="Get the most distinctive keywords (tf-idf over pages) of the corpus or of one document",
+            function=self.keyword_discovery.top_keywords,
+            phase="discovery",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "k": {
+                        "type": "integer",
+                        "description": "Number of keywords to return (default 50)"
+                    },
+                    "doc_id": {
+                        "type": "string",
+                        "description": "Only rank keywords of this document"
+                    }
+                },
+                "required": []
+            }
+        )
+        
+        self.tools["locate_keyword"] = ToolDefinition(
+            name="locate_keyword",
+            description="Find the pages, tables and rows where a keyword occurs, with occurrence counts",
+            function=self.keyword_discovery.locate_keyword,
+            phase="discovery",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "keyword": {
+                        "type": "string",
+                        "description": "Keyword to locate"
+                    }
+                },
+                "required": ["keyword"]
+            }
+        )
+        
         self.tools["view_tables"] = ToolDefinition(
             name="view_tables",
-            description="Get overview of all available tables with categories and metadata",
+            description="Get overview of available tables with categories and metadata, ordered by page and paginated by offset/limit",
             function=self.table_discovery.view_tables,
+            phase="discovery",
             parameters={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of tables to skip (default 0)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of tables to return (default all)"
+                    },
+                    "doc_id": {
+                        "type": "string",
+                        "description": "Only list tables of this document"
+                    }
+                },
+                "required": []
+            }
+        )
+        
+        self.tools["filter_tables"] = ToolDefinition(
+            name="filter_tables",
+            description="Narrow tables by category, document, page range and row/column counts; returns matches with facet counts",
+            function=self.table_discovery.filter_tables,
+            phase="discovery",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "category": {
+                        "type": "string",
+                        "description": "Technical category of the table"
+                    },
+                    "doc_id": {
+                        "type": "string",
+                        "description": "Document the table belongs to"
+                    },
+                    "page_min": {
+                        "type": "integer",
+                        "description": "Lowest page number"
+                    },
+                    "page_max": {
+                        "type": "integer",
+                        "description": "Highest page number"
+                    },
+                    "min_rows": {
+                        "type": "integer",
+                        "description": "Fewest rows"
+                    },
+                    "max_rows": {
+                        "type": "integer",
+                        "description": "Most rows"
+                    },
+                    "min_columns": {
+                        "type": "integer",
+                        "description": "Fewest columns"
+                    },
+                    "max_columns": {
+                        "type": "integer",
+                        "description": "Most columns"
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Number of matching tables to skip (default 0)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of tables to return (default all)"
+                    }
+                },
                 "required": []
             }
         )
@@ -218,6 +377,7 @@ class Barn:
             name="table_summary",
             description="Get detailed summary of a specific table including metadata, columns, and sample data",
             function=self.table_explorer.table_summary,
+            phase="exploration",
             parameters={
                 "type": "object",
                 "properties": {
@@ -234,6 +394,7 @@ class Barn:
             name="find_relevant_tables",
             description="Find tables relevant to the search query using multiple criteria",
             function=self.relevance_finder.find_relevant_tables,
+            phase="exploration",
             parameters={
                 "type": "object",
                 "properties": {
@@ -250,6 +411,7 @@ class Barn:
             name="find_relevant_pages",
             description="Find pages relevant to the search query using multiple criteria",
             function=self.relevance_finder.find_relevant_pages,
+            phase="exploration",
             parameters={
                 "type": "object",
                 "properties": {
@@ -268,6 +430,7 @@ class Barn:
             name="get_table_data",
             description="Get table data with optional column filtering",
             function=self.table_retriever.get_table_data,
+            phase="retrieval",
             parameters={
                 "type": "object",
                 "properties": {
@@ -289,6 +452,7 @@ class Barn:
             name="get_row_data",
             description="Get rows where the specified column matches the target value",
             function=self.row_retriever.get_row_data,
+            phase="retrieval",
             parameters={
                 "type": "object",
                 "properties": {
@@ -309,10 +473,40 @@ class Barn:
             }
         )
         
+        self.tools["get_rows_in_range"] = ToolDefinition(
+            name="get_rows_in_range",
+            description="Get rows whose numeric value in a column lies between minimum and maximum (inclusive); currency and unit suffixes are ignored",
+            function=self.row_retriever.get_rows_in_range,
+            phase="retrieval",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "table_name": {
+                        "type": "string",
+                        "description": "Name/title of the table to search"
+                    },
+                    "column": {
+                        "type": "string",
+                        "description": "Numeric column to compare"
+                    },
+                    "minimum": {
+                        "type": "number",
+                        "description": "Inclusive lower bound (omit for none)"
+                    },
+                    "maximum": {
+                        "type": "number",
+                        "description": "Inclusive upper bound (omit for none)"
+                    }
+                },
+                "required": ["table_name", "column"]
+            }
+        )
+        
         self.tools["get_page_content"] = ToolDefinition(
             name="get_page_content",
             description="Get page content by title or number",
             function=self.page_retriever.get_page_content,
+            phase="retrieval",
             parameters={
                 "type": "object",
                 "properties": {
@@ -336,19 +530,54 @@ class Barn:
         Returns:
             True if loaded successfully, False otherwise
         """
-        return self.silo.load_document(doc_id, data_path)
+        return self.silo.load_document(doc_id, data_path, streaming=self.streaming)
     
-    def load_documents(self, doc_mappings: Dict[str, str]) -> Dict[str, bool]:
+    def load_documents(self, doc_mappings: Dict[str, str], workers: int = 1) -> Dict[str, bool]:
         """
         Load multiple documents at once.
         
         Args:
             doc_mappings: {doc_id: data_path} mapping
+            workers: Number of worker processes used for parsing (1 = serial)
             
         Returns:
             {doc_id: success_status} mapping
         """
-        return self.silo.load_documents(doc_mappings)
+        return self.silo.load_documents(doc_mappings, streaming=self.streaming, workers=workers)
+    
+    def follow_datasets(self, config_manager: ConfigManager):
+        """
+        Keep the silo in step with a ConfigManager's datasets.
+        
+        Loads every dataset not yet in the silo under its document_id, then
+        applies the changes found by each config_manager.refresh_datasets().
+        
+        Args:
+            config_manager: Configuration manager to follow
+        """
+        for dataset in config_manager.config.datasets.values():
+            if dataset.document_id not in self.silo.document_info:
+                self.load_document(dataset.document_id, str(dataset.path))
+        config_manager.subscribe(self.apply_dataset_changes)
+    
+    def apply_dataset_changes(self, changes: DatasetChanges):
+        """
+        Load, reload or remove only the documents of changed datasets.
+        
+        Modified datasets go through Silo.reload_document(), so only their
+        changed pages are swapped in and tool caches rebuild just those
+        documents.
+        
+        Args:
+            changes: Changes reported by ConfigManager.refresh_datasets()
+        """
+        for dataset in changes.removed.values():
+            self.silo.remove_document(dataset.document_id)
+        for dataset in changes.modified.values():
+            if self.silo.reload_document(dataset.document_id) is None:
+                self.load_document(dataset.document_id, str(dataset.path))
+        for dataset in changes.added.values():
+            self.load_document(dataset.document_id, str(dataset.path))
     
     def is_ready(self) -> bool:
         """Check if the farm is ready (has data loaded)."""
@@ -380,9 +609,14 @@ class Barn:
         logger.info("Phase 1: Discovery")
         try:
             context_data["discovery_data"] = {
-                "pages": self.page_discovery.view_pages(),
-                "keywords": self.keyword_discovery.view_keywords(),
-                "tables": self.table_discovery.view_tables()
+                "pages": self.page_discovery.view_pages(limit=DISCOVERY_CATALOG_LIMIT),
+                "page_count": self.page_discovery.page_count(),
+                "keywords": [
+                    entry["keyword"] for entry in self.keyword_discovery.top_keywords(DISCOVERY_KEYWORD_COUNT)
+                ],
+                "keyword_count": self.keyword_discovery.keyword_count(),
+                "tables": self.table_discovery.view_tables(limit=DISCOVERY_CATALOG_LIMIT),
+                "table_count": self.table_discovery.table_count()
             }
             context_data["tools_used"].append("discovery")
         except Exception as e:
@@ -460,8 +694,8 @@ class Barn:
             sources=self._extract_sources(context_data),
             metadata={
                 "phases_completed": len(context_data["tools_used"]),
-                "total_pages": len(context_data["discovery_data"].get("pages", [])),
-                "total_tables": len(context_data["discovery_data"].get("tables", [])),
+                "total_pages": context_data["discovery_data"].get("page_count", 0),
+                "total_tables": context_data["discovery_data"].get("table_count", 0),
                 "relevant_tables_found": len(context_data["exploration_data"].get("relevant_tables", [])),
                 "relevant_pages_found": len(context_data["exploration_data"].get("relevant_pages", []))
             }
@@ -510,20 +744,15 @@ class Barn:
         if not self.is_ready():
             return FarmStats(0, 0, 0, 0, 0, 0, 0)
         
-        discovery_data = {
-            "pages": self.page_discovery.view_pages(),
-            "keywords": self.keyword_discovery.view_keywords(),
-            "tables": self.table_discovery.view_tables()
-        }
-        
+        phase_counts = Counter(tool_def.phase for tool_def in self.tools.values())
         return FarmStats(
             total_documents=len(self.silo.get_document_ids()),
-            total_pages=len(discovery_data["pages"]),
-            total_tables=len(discovery_data["tables"]),
-            total_keywords=len(discovery_data["keywords"]),
-            discovery_tools=3,
-            exploration_tools=2,
-            retrieval_tools=3
+            total_pages=self.page_discovery.page_count(),
+            total_tables=self.table_discovery.table_count(),
+            total_keywords=self.keyword_discovery.keyword_count(),
+            discovery_tools=phase_counts["discovery"],
+            exploration_tools=phase_counts["exploration"],
+            retrieval_tools=phase_counts["retrieval"]
         )
     
     def set_llm_client(self, api_key: str, model: str = "gpt-3.5-turbo"):
@@ -623,22 +852,24 @@ Note: This is a fallback response. For better answers, configure an LLM client."
             discovery = context_data["discovery_data"]
             
             if discovery.get("pages"):
-                lines.append(f"Pages available: {len(discovery['pages'])}")
+                page_count = discovery.get("page_count", len(discovery["pages"]))
+                lines.append(f"Pages available: {page_count}")
                 for page in discovery["pages"][:3]:  # Show first 3
                     lines.append(f"  - Page {page['page_number']}: {page['page_title']}")
-                if len(discovery["pages"]) > 3:
-                    lines.append(f"  ... and {len(discovery['pages']) - 3} more pages")
+                if page_count > 3:
+                    lines.append(f"  ... and {page_count - 3} more pages")
             
             if discovery.get("tables"):
-                lines.append(f"Tables available: {len(discovery['tables'])}")
+                table_count = discovery.get("table_count", len(discovery["tables"]))
+                lines.append(f"Tables available: {table_count}")
                 for table in discovery["tables"][:3]:  # Show first 3
                     lines.append(f"  - {table['table_title']} (Category: {table['category']})")
-                if len(discovery["tables"]) > 3:
-                    lines.append(f"  ... and {len(discovery['tables']) - 3} more tables")
+                if table_count > 3:
+                    lines.append(f"  ... and {table_count - 3} more tables")
             
             if discovery.get("keywords"):
-                lines.append(f"Keywords available: {len(discovery['keywords'])}")
-                lines.append(f"  Sample: {', '.join(discovery['keywords'][:10])}")
+                lines.append(f"Keywords available: {discovery.get('keyword_count', len(discovery['keywords']))}")
+                lines.append(f"  Most distinctive: {', '.join(discovery['keywords'])}")
         
         # Exploration data
         if context_data.get("exploration_data"):
@@ -0,0 +1,489 @@
+"""
+Columnar - Typed Column Storage for Silo Tables
+
+PB&J tables arrive as lists of row dictionaries, so every row repeats every
+column name and every filter does a per-row dict lookup plus str().lower().
+This module stores a table as one typed column per name instead and keeps
+the row-dictionary API available as a lazy sequence on top.
+
+Column storage:
+- int columns:      array('q')
+- float columns:    array('d')
+- mixed int/float:  array('d') plus a mask restoring values that were ints
+- text/bool/other:  plain list of the original values
+
+Text columns also carry a precomputed lowercased view for case-insensitive
+matching, and columns declared numeric in the table's metadata 'data_types'
+get a parsed float view (e.g. "+$2.00" -> 2.0) using the 'units' metadata
+to strip unit suffixes. The numeric view lets a numeric target match by
+value ("2" finds "+$2.00" and 2.0) and serves range filters.
+
+Example Usage:
+    table = ColumnarTable.from_rows(rows, metadata)
+    rows_view = RowSequence(table)
+    rows_view[0]                       # {"Sandwich Size": "Small", ...}
+    table.match("Sandwich Size", "small")  # [0]
+    rows_in_range(rows_view, "Bacon (Oz)", 1, 2.5)
+"""
+
+import math
+import re
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+# Metadata data_types that mark a column as numeric
+NUMERIC_DATA_TYPES = {"numeric", "number", "integer", "int", "float", "decimal", "currency", "percentage"}
+
+_NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def parse_number(value: Any, unit: str = "") -> float:
+    """
+    Parse a cell value as a number.
+    
+    Strips thousands separators and the column unit, then reads the first
+    number in the text, so "+$2.00*" and "1,250 mm" parse as 2.0 and 1250.0.
+    
+    Args:
+        value: Cell value
+        unit: Unit from the table metadata, if any
+    
+    Returns:
+        Parsed float, or NaN if the value holds no number
+    """
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return math.nan
+    text = value.replace(",", "")
+    if unit and unit not in ("NA", "N/A"):
+        text = text.replace(unit, "")
+    match = _NUMBER_PATTERN.search(text)
+    return float(match.group()) if match else math.nan
+
+
+def _target_number(target: Any) -> Optional[float]:
+    """Get a match target's value if the whole target is a number ("2", "1,250", 2.5)."""
+    if isinstance(target, bool):
+        return None
+    if isinstance(target, (int, float)):
+        return None if math.isnan(target) else float(target)
+    if isinstance(target, str) and _NUMBER_PATTERN.fullmatch(target.replace(",", "").strip()):
+        return float(target.replace(",", ""))
+    return None
+
+
+class Column:
+    """
+    One typed table column.
+    
+    Attributes:
+        name: Column name
+        kind: "int", "float", "number" (mixed int/float), "text" or "object"
+        data_type: Declared data type from table metadata ("" if none)
+        unit: Declared unit from table metadata ("" if none)
+    """
+    
+    __slots__ = ("name", "kind", "data_type", "unit", "_values", "_int_mask", "_lowered", "_numbers")
+    
+    def __init__(self, name: str, values: List[Any], data_type: str = "", unit: str = ""):
+        """
+        Build a column, choosing the most compact exact representation.
+        
+        Args:
+            name: Column name
+            values: Cell values in row order
+            data_type: Declared data type from table metadata
+            unit: Declared unit from table metadata
+        """
+        self.name = name
+        self.data_type = data_type
+        self.unit = unit
+        self._int_mask: Optional[bytes] = None
+        self._lowered: Optional[List[str]] = None
+        self._numbers: Optional[array] = None
+        
+        types = {type(value) for value in values}
+        if types == {int} and all(-2 ** 63 <= value < 2 ** 63 for value in values):
+            self.kind = "int"
+            self._values = array("q", values)
+        elif types == {float}:
+            self.kind = "float"
+            self._values = array("d", values)
+        elif types == {int, float} and all(abs(value) <= 2 ** 53 for value in values if type(value) is int):
+            self.kind = "number"
+            self._values = array("d", values)
+            self._int_mask = bytes(type(value) is int for value in values)
+        elif types == {str}:
+            self.kind = "text"
+            self._values = values
+            self._lowered = [value.lower() for value in values]
+        else:
+            self.kind = "object"
+            self._values = values
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def __getitem__(self, index: int) -> Any:
+        value = self._values[index]
+        if self._int_mask is not None and self._int_mask[index]:
+            return int(value)
+        return value
+    
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(len(self._values)))
+    
+    @property
+    def is_numeric(self) -> bool:
+        """Whether the column holds numbers or is declared numeric in metadata."""
+        return self.kind in ("int", "float", "number") or self.data_type.lower() in NUMERIC_DATA_TYPES
+    
+    def lowered(self) -> List[str]:
+        """
+        Lowercased string form of every cell, as str(value).lower().
+        
+        Precomputed for text columns and computed once on first use otherwise.
+        """
+        if self._lowered is None:
+            self._lowered = [str(value).lower() for value in self]
+        return self._lowered
+    
+    def numbers(self) -> Optional[array]:
+        """
+        Numeric view of the column as array('d'), NaN where a cell has no number.
+        
+        Returns:
+            Parsed float array, or None if the column is not numeric
+        """
+        if not self.is_numeric:
+            return None
+        if self._numbers is None:
+            if self.kind in ("float", "number"):
+                self._numbers = self._values
+            else:
+                self._numbers = array("d", (parse_number(value, self.unit) for value in self))
+        return self._numbers
+
+
+class ColumnarTable:
+    """
+    A table stored column by column.
+    
+    Attributes:
+        names: Column names in row-key order
+        columns: Dictionary mapping column names to Column objects
+        row_count: Number of rows
+    """
+    
+    __slots__ = ("names", "columns", "row_count")
+    
+    def __init__(self, columns: List[Column], row_count: int):
+        self.names = [column.name for column in columns]
+        self.columns: Dict[str, Column] = {column.name: column for column in columns}
+        self.row_count = row_count
+    
+    @classmethod
+    def from_rows(cls, rows: List[Any], metadata: Optional[Dict[str, Any]] = None) -> Optional["ColumnarTable"]:
+        """
+        Convert row dictionaries to columnar form.
+        
+        Only rectangular tables (non-empty, every row a dict with the same
+        keys in the same order) are converted.
+        
+        Args:
+            rows: Row dictionaries
+            metadata: Table metadata with optional 'data_types' and 'units'
+                      lists aligned with the column order
+        
+        Returns:
+            ColumnarTable, or None if the rows are not rectangular
+        """
+        if not rows or not isinstance(rows[0], dict):
+            return None
+        names = list(rows[0].keys())
+        if not all(type(row) is dict and list(row.keys()) == names for row in rows):
+            return None
+        
+        metadata = metadata or {}
+        data_types = metadata.get("data_types") or []
+        units = metadata.get("units") or []
+        if len(data_types) != len(names):
+            data_types = []
+        if len(units) != len(names):
+            units = []
+        
+        columns = [
+            Column(
+                name,
+                [row[name] for row in rows],
+                data_type=str(data_types[position]) if data_types else "",
+                unit=str(units[position]) if units else ""
+            )
+            for position, name in enumerate(names)
+        ]
+        return cls(columns, len(rows))
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """Build the row dictionary for one row."""
+        return {name: column[index] for name, column in self.columns.items()}
+    
+    def match(self, column: str, target: Any) -> List[int]:
+        """
+        Find rows whose cell equals the target, case-insensitively.
+        
+        Uses the same comparison as str(cell).lower() == str(target).lower().
+        On a numeric column a numeric target also matches cells of equal
+        value, so "2" finds 2.0 and "+$2.00".
+        
+        Args:
+            column: Column name
+            target: Value to match
+        
+        Returns:
+            Row indexes of matching rows
+        """
+        target_lower = str(target).lower()
+        col = self.columns[column]
+        target_number = _target_number(target)
+        numbers = col.numbers() if target_number is not None else None
+        if numbers is None:
+            return [index for index, value in enumerate(col.lowered()) if value == target_lower]
+        return [
+            index for index, (value, number) in enumerate(zip(col.lowered(), numbers))
+            if number == target_number or value == target_lower
+        ]
+    
+    def between(self, column: str, minimum: Optional[float] = None, maximum: Optional[float] = None) -> List[int]:
+        """
+        Find rows whose cell value lies in an inclusive range.
+        
+        Numeric columns are compared on their parsed float view; other
+        columns parse each cell with parse_number(). Cells holding no
+        number never match.
+        
+        Args:
+            column: Column name
+            minimum: Lower bound (None for open)
+            maximum: Upper bound (None for open)
+        
+        Returns:
+            Row indexes of matching rows
+        """
+        col = self.columns[column]
+        numbers = col.numbers()
+        if numbers is None:
+            numbers = [parse_number(value, col.unit) for value in col]
+        low = -math.inf if minimum is None else minimum
+        high = math.inf if maximum is None else maximum
+        return [index for index, number in enumerate(numbers) if low <= number <= high]
+
+
+class RowSequence(Sequence):
+    """
+    Lazy, read-only sequence of row dictionaries over a ColumnarTable.
+    
+    Each access builds a fresh plain dict, so callers can keep treating rows
+    as dictionaries (including JSON-serializing them) while the table itself
+    is stored column by column.
+    
+    Attributes:
+        table: Underlying ColumnarTable
+    """
+    
+    __slots__ = ("table",)
+    
+    def __init__(self, table: ColumnarTable):
+        self.table = table
+    
+    def __len__(self) -> int:
+        return self.table.row_count
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self.table.row(i) for i in range(*index.indices(self.table.row_count))]
+        if index < 0:
+            index += self.table.row_count
+        if not 0 <= index < self.table.row_count:
+            raise IndexError("row index out of range")
+        return self.table.row(index)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.table.row(index) for index in range(self.table.row_count))
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RowSequence, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"RowSequence({self.table.row_count} rows x {len(self.table.names)} columns)"
+
+
+def columnarize_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert every rectangular table on a page to columnar storage in place.
+    
+    Args:
+        page: Page dictionary whose tables hold row dictionaries
+    
+    Returns:
+        The same page dictionary
+    """
+    for table in page.get("tables", []):
+        rows = table.get("rows")
+        if isinstance(rows, list):
+            columnar = ColumnarTable.from_rows(rows, table.get("metadata"))
+            if columnar is not None:
+                table["rows"] = RowSequence(columnar)
+    return page
+
+
+def plain_rows(rows: Any) -> List[Any]:
+    """
+    Get rows as a plain list of dictionaries.
+    
+    Args:
+        rows: List of rows or RowSequence
+    
+    Returns:
+        A list (the same object if it already is one)
+    """
+    return list(rows) if isinstance(rows, RowSequence) else rows
+
+
+def match_rows(rows: Any, column: str, target: Any) -> List[Dict[str, Any]]:
+    """
+    Get rows whose cell in `column` equals `target`, case-insensitively.
+    
+    Args:
+        rows: List of rows or RowSequence
+        column: Column name
+        target: Value to match
+    
+    Returns:
+        Matching row dictionaries
+    """
+    return filter_rows(rows, {column: target})
+
+
+def filter_rows(rows: Any, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Get rows matching every {column: target} criterion, case-insensitively.
+    
+    Columnar tables are filtered on the columns' lowercased views and only
+    the matching rows are built as dictionaries; plain row lists fall back
+    to a per-row str(value).lower() comparison.
+    
+    Args:
+        rows: List of rows or RowSequence
+        criteria: Dictionary of {column: target_value} pairs
+    
+    Returns:
+        Matching row dictionaries
+    """
+    if isinstance(rows, RowSequence) and all(column in rows.table.columns for column in criteria):
+        table = rows.table
+        matches: Optional[set] = None
+        for column, target in criteria.items():
+            indexes = set(table.match(column, target))
+            matches = indexes if matches is None else matches & indexes
+            if not matches:
+                return []
+        if matches is None:
+            return list(rows)
+        return [table.row(index) for index in sorted(matches)]
+    
+    targets = {column: str(target).lower() for column, target in criteria.items()}
+    return [
+        row for row in rows
+        if isinstance(row, dict)
+        and all(column in row and str(row[column]).lower() == target for column, target in targets.items())
+    ]
+
+
+def rows_in_range(rows: Any, column: str, minimum: Optional[float] = None,
+                  maximum: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Get rows whose `column` value lies between minimum and maximum (inclusive).
+    
+    Columnar tables are filtered on the column's numeric view, which parses
+    currency and unit suffixes ("+$2.00" -> 2.0); plain row lists parse each
+    cell with parse_number().
+    
+    Args:
+        rows: List of rows or RowSequence
+        column: Column name
+        minimum: Lower bound (None for open)
+        maximum: Upper bound (None for open)
+    
+    Returns:
+        Matching row dictionaries
+    """
+    if isinstance(rows, RowSequence) and column in rows.table.columns:
+        return [rows.table.row(index) for index in rows.table.between(column, minimum, maximum)]
+    
+    low = -math.inf if minimum is None else minimum
+    high = math.inf if maximum is None else maximum
+    return [
+        row for row in rows
+        if isinstance(row, dict) and column in row and low <= parse_number(row[column]) <= high
+    ]
+
+
+def column_names(table: Any) -> List[str]:
+    """
+    Get a table's column names.
+    
+    Uses the declared 'columns' list when present and otherwise the row keys
+    (final_output.json tables carry no 'columns' key).
+    
+    Args:
+        table: Table mapping
+    
+    Returns:
+        Column names in order
+    """
+    declared = table.get("columns")
+    if declared:
+        return [col.get("name", "Unknown") if isinstance(col, dict) else str(col) for col in declared]
+    rows = table.get("rows", [])
+    if isinstance(rows, RowSequence):
+        return list(rows.table.names)
+    if rows and isinstance(rows[0], dict):
+        return list(rows[0].keys())
+    return []
+
+
+def numeric_columns(table: Any) -> Dict[str, str]:
+    """
+    Get a table's numeric columns and their units.
+    
+    Columnar tables report the columns holding numbers or declared numeric;
+    row-list tables fall back to the metadata 'data_types' and 'units'.
+    
+    Args:
+        table: Table mapping
+    
+    Returns:
+        Dictionary mapping numeric column names to their unit ("" if none)
+    """
+    rows = table.get("rows", [])
+    if isinstance(rows, RowSequence):
+        return {name: column.unit for name, column in rows.table.columns.items() if column.is_numeric}
+    
+    names = column_names(table)
+    metadata = table.get("metadata") or {}
+    data_types = metadata.get("data_types") or []
+    units = metadata.get("units") or []
+    if len(data_types) != len(names):
+        return {}
+    return {
+        name: str(units[position]) if len(units) == len(names) else ""
+        for position, name in enumerate(names)
+        if str(data_types[position]).lower() in NUMERIC_DATA_TYPES
+    }
@@ -0,0 +1,186 @@
+"""
+Compression - Compressed Page Content for the Silo
+
+A page's raw_content (its full markdown, mermaid blocks included) is the
+largest field it holds, and most queries never read it. CompressedPage
+keeps that field compressed with zlib or lzma and decompresses it on
+access. Recently decompressed texts are kept in a DecompressedCache, an
+LRU bounded by the total size of the texts it holds, so repeated reads of
+hot pages do not pay for decompression again.
+
+Example Usage:
+    cache = DecompressedCache(max_bytes=1 << 20)
+    page = CompressedPage(page_dict, "zlib", cache)
+    page["raw_content"]   # decompressed once, then served from the cache
+"""
+
+import lzma
+import sys
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import count
+from typing import Any, Dict, Iterator, Optional
+
+
+# Fields stored compressed
+COMPRESSED_FIELDS = ("raw_content",)
+
+# Supported codecs: name -> (compress, decompress)
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+# Default size bound of the decompressed-text LRU
+DEFAULT_CACHE_BYTES = 1 << 20
+
+
+class DecompressedCache:
+    """
+    Size-bounded LRU of decompressed texts.
+    
+    Attributes:
+        max_bytes: Upper bound on the summed sys.getsizeof() of cached texts
+        size_bytes: Current summed size of cached texts
+        hits: Lookups served from the cache
+        misses: Lookups that had to decompress
+        evictions: Texts dropped to stay within max_bytes
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_bytes: Upper bound on the size of cached texts (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[int, str]" = OrderedDict()
+        self._keys = count()
+    
+    def new_key(self) -> int:
+        """Get a key that no other entry will ever use."""
+        return next(self._keys)
+    
+    def get(self, key: int) -> Optional[str]:
+        """Get a cached text and mark it most recently used, or None."""
+        text = self._entries.get(key)
+        if text is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return text
+    
+    def put(self, key: int, text: str):
+        """Cache a text, evicting least recently used texts beyond max_bytes."""
+        size = sys.getsizeof(text)
+        if size > self.max_bytes:
+            return
+        self.discard(key)
+        self._entries[key] = text
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= sys.getsizeof(evicted)
+            self.evictions += 1
+    
+    def discard(self, key: int):
+        """Drop a cached text if present."""
+        text = self._entries.pop(key, None)
+        if text is not None:
+            self.size_bytes -= sys.getsizeof(text)
+    
+    def clear(self):
+        """Drop every cached text (counters are kept)."""
+        self._entries.clear()
+        self.size_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache size and counters."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+
+class CompressedPage(Mapping):
+    """
+    Read-only page mapping whose large text fields are stored compressed.
+    
+    Behaves like the page dictionary it was built from; reading a
+    compressed field decompresses it through the shared DecompressedCache.
+    
+    Attributes:
+        codec: Codec name ("zlib" or "lzma")
+        compressed: Dictionary mapping field names to compressed UTF-8 bytes
+    """
+    
+    __slots__ = ("_fields", "_keys", "codec", "compressed", "_cache", "_cache_keys")
+    
+    def __init__(self, page: Mapping, codec: str, cache: DecompressedCache):
+        """
+        Compress a page.
+        
+        Args:
+            page: Page dictionary
+            codec: Codec name ("zlib" or "lzma")
+            cache: Shared cache for decompressed texts
+        
+        Raises:
+            ValueError: If the codec is not supported
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unsupported codec {codec!r}; expected one of {sorted(CODECS)}")
+        compress = CODECS[codec][0]
+        self.codec = codec
+        self._keys = tuple(page.keys())
+        self.compressed = {
+            key: compress(page[key].encode("utf-8"))
+            for key in COMPRESSED_FIELDS if isinstance(page.get(key), str)
+        }
+        self._fields = {key: value for key, value in page.items() if key not in self.compressed}
+        self._cache = cache
+        self._cache_keys = {key: cache.new_key() for key in self.compressed}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return self._fields[key]
+        if key not in self.compressed:
+            raise KeyError(key)
+        cache_key = self._cache_keys[key]
+        text = self._cache.get(cache_key)
+        if text is None:
+            text = CODECS[self.codec][1](self.compressed[key]).decode("utf-8")
+            self._cache.put(cache_key, text)
+        return text
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields or key in self.compressed
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __repr__(self) -> str:
+        return f"CompressedPage({self._fields.get('page_id')!r}, {self.codec})"
+    
+    def stored(self, key: str) -> Any:
+        """Get a field as stored: compressed bytes for compressed fields, otherwise the value."""
+        if key in self.compressed:
+            return self.compressed[key]
+        return self._fields.get(key)
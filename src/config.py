@@ -7,13 +7,31 @@ a centralized way to manage system settings without hardcoding.
 
 import os
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from dataclasses import dataclass, asdict, field
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from src.archives import ARCHIVE_SUFFIX, FINAL_OUTPUT_NAME, archive_members, source_stamp
+from src.loaders import read_top_level_fields
+from src.document_cache import HEADER_FIELDS, DocumentCache, shared_document_cache
+
 logger = logging.getLogger(__name__)
 
+# Discovery manifest keyed by final_output.json path; kept per data root in
+# the user cache directory, or in the data root if that is not writable
+DISCOVERY_MANIFEST_NAME = "discovery_manifest.json"
+DISCOVERY_CACHE_DIRNAME = "farm"
+DISCOVERY_MANIFEST_VERSION = 1
+
+# Default number of concurrent directory listings and metadata reads
+DEFAULT_SCAN_WORKERS = 8
+
+# Folders never searched for nested datasets
+_SKIPPED_DIR_PREFIXES = (".", "__")
+
 @dataclass
 class DatasetConfig:
     """Configuration for a single dataset."""
@@ -38,15 +56,109 @@ class SystemConfig:
         if self.llm_config is None:
             self.llm_config = {}
 
+def _stat_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Get (size, mtime_ns) of a file or directory, or None if it is gone."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def default_manifest_path(data_root: Path) -> Path:
+    """
+    Get the default discovery manifest location for a data root.
+    
+    Manifests live under $XDG_CACHE_HOME (default ~/.cache), one per
+    resolved data root, so discovery never writes into the tree it scans.
+    
+    Args:
+        data_root: Root directory for data
+        
+    Returns:
+        Path of the manifest file (its directory may not exist yet)
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    key = hashlib.blake2b(str(Path(data_root).resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return cache_home / DISCOVERY_CACHE_DIRNAME / f"{Path(data_root).name}_{key}_{DISCOVERY_MANIFEST_NAME}"
+
+def _scan_directory(directory: Path) -> Tuple[Optional[Tuple[int, int]], bool, List[Path], List[Path]]:
+    """
+    List a directory once with os.scandir.
+    
+    The directory is stamped before it is listed, so an entry added while
+    listing always changes the stamp seen by the next poll.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Tuple of (stamp, whether it holds a final_output.json, subdirectories, .zip archives)
+    """
+    stamp = _stat_stamp(directory)
+    has_final_output = False
+    subdirs: List[Path] = []
+    archives: List[Path] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    subdirs.append(Path(entry.path))
+                elif entry.name == FINAL_OUTPUT_NAME:
+                    has_final_output = True
+                elif entry.name.lower().endswith(ARCHIVE_SUFFIX) and entry.is_file():
+                    archives.append(Path(entry.path))
+    except OSError as e:
+        logger.error(f"Error scanning {directory}: {e}")
+    return stamp, has_final_output, subdirs, archives
+
+@dataclass
+class DatasetChanges:
+    """
+    Datasets added, removed or modified by a refresh.
+    
+    A dataset whose final_output.json moved (e.g. from an extracted folder
+    into an archive) is reported as removed and added.
+    """
+    added: Dict[str, DatasetConfig] = field(default_factory=dict)
+    removed: Dict[str, DatasetConfig] = field(default_factory=dict)
+    modified: Dict[str, DatasetConfig] = field(default_factory=dict)
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
 class DataDiscovery:
-    """Handles automatic discovery of available datasets."""
+    """
+    Handles automatic discovery of available datasets.
+    
+    Discovery results are cached in a manifest, kept outside the data root
+    by default (see default_manifest_path()), keyed by each
+    final_output.json path and its size and mtime (size and CRC for archive
+    members). Unchanged files are not opened at all; new or changed files
+    are read only up to their document_info and document_summary, which
+    the pipeline writes ahead of the pages, unless the process-wide
+    DocumentCache already recorded them when the file was parsed.
     
-    def __init__(self, data_root: Optional[Path] = None):
+    Each discovery also records a snapshot of the stamps of every directory
+    it listed, every archive and every dataset file, so has_changes() can
+    tell whether a new discovery would find anything different with one
+    stat per entry.
+    """
+    
+    def __init__(self, data_root: Optional[Path] = None, manifest_path: Optional[Path] = None,
+                 max_workers: int = DEFAULT_SCAN_WORKERS, recursive: bool = False,
+                 document_cache: Optional[DocumentCache] = None):
         """
         Initialize data discovery.
         
         Args:
             data_root: Root directory for data. Defaults to project_root/data
+            manifest_path: Where to cache the discovery manifest. Defaults to
+                          default_manifest_path(data_root), falling back to
+                          data_root/discovery_manifest.json if that is not writable
+            max_workers: Most directory listings and metadata reads in flight at once
+            recursive: Also look for datasets in nested folders (e.g. data/<site>/<run>/)
+            document_cache: Headers of already parsed documents
+                            (default: the process-wide shared_document_cache())
         """
         if data_root is None:
             # Find project root (assuming we're in src/)
@@ -55,12 +167,33 @@ class DataDiscovery:
             data_root = project_root / "data"
         
         self.data_root = data_root
+        self.manifest_path = manifest_path if manifest_path is not None else default_manifest_path(data_root)
+        # Only the default location falls back to the data root
+        self._fallback_manifest_path = Path(data_root) / DISCOVERY_MANIFEST_NAME if manifest_path is None else None
+        self.max_workers = max(1, max_workers)
+        self.recursive = recursive
+        self.document_cache = document_cache if document_cache is not None else shared_document_cache()
+        self._manifest: Optional[Dict[str, Any]] = None  # {path: entry}, read on first discovery
+        self._entries: Dict[str, Any] = {}  # entries seen by the discovery in progress
+        self._snapshot: Optional[Dict[Path, Optional[Tuple[int, int]]]] = None  # {path: stamp} at last discovery
         logger.info(f"Data discovery initialized with root: {data_root}")
     
     def discover_datasets(self) -> Dict[str, DatasetConfig]:
         """
         Discover all available datasets in the data directory.
         
+        Datasets are directories holding a final_output.json, or pipeline
+        .zip archives holding one (read in place, without extracting).
+        When a dataset exists both extracted and archived, the extracted
+        copy is used.
+        
+        Directories are listed with os.scandir and dataset metadata is read
+        on a thread pool of at most `max_workers` threads, which hides the
+        per-file latency of network mounts. With `recursive`, folders that
+        are not datasets themselves are searched level by level for nested
+        datasets and archives. Results are merged in path order, so they do
+        not depend on which read finishes first.
+        
         Returns:
             Dictionary mapping dataset names to DatasetConfig objects
         """
@@ -70,37 +203,171 @@ class DataDiscovery:
             logger.warning(f"Data root directory does not exist: {self.data_root}")
             return datasets
         
-        # Look for directories that contain final_output.json
-        for item in self.data_root.iterdir():
-            if item.is_dir():
-                final_output_path = item / "final_output.json"
-                if final_output_path.exists():
-                    try:
-                        dataset_config = self._load_dataset_config(item, final_output_path)
-                        if dataset_config:
-                            datasets[dataset_config.name] = dataset_config
-                            logger.info(f"Discovered dataset: {dataset_config.name}")
-                    except Exception as e:
-                        logger.error(f"Error loading dataset from {item}: {e}")
+        if self._manifest is None:
+            self._manifest = self._read_manifest()
+        self._entries = {}
+        
+        snapshot: Dict[Path, Optional[Tuple[int, int]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            dataset_dirs, archives = self._scan_tree(pool, snapshot)
+            for archive in archives:
+                snapshot[archive] = _stat_stamp(archive)
+            
+            # Look for directories that contain final_output.json
+            configs = pool.map(lambda item: self._load_dataset_config(item, item / FINAL_OUTPUT_NAME), dataset_dirs)
+            for dataset_config in configs:
+                if dataset_config:
+                    datasets[dataset_config.name] = dataset_config
+                    logger.info(f"Discovered dataset: {dataset_config.name}")
+            
+            # Then look inside .zip archives for datasets not already extracted
+            for archive, archived in zip(archives, pool.map(self._read_archive, archives)):
+                self._add_archived(archive, archived, datasets)
+        
+        # Persist the manifest, dropping entries for files that are gone
+        if self._entries != self._manifest:
+            self._manifest = self._entries
+            written = self._write_manifest()
+            # Writing it changed its directory's mtime; that is not a dataset change
+            if written is not None and written.parent in snapshot:
+                snapshot[written.parent] = _stat_stamp(written.parent)
+        
+        for dataset_dir in dataset_dirs:
+            final_output_path = dataset_dir / FINAL_OUTPUT_NAME
+            entry = self._entries.get(str(final_output_path))
+            snapshot[final_output_path] = tuple(entry["stamp"]) if entry else _stat_stamp(final_output_path)
+        self._snapshot = snapshot
         
         logger.info(f"Discovered {len(datasets)} datasets")
         return datasets
     
+    def has_changes(self) -> bool:
+        """
+        Check whether datasets may have been added, removed or modified.
+        
+        Compares the stamps recorded by the last discover_datasets() with
+        the current ones (statted on the thread pool). A directory's mtime
+        changes when entries are added to or removed from it; a dataset
+        file's stamp changes when it is rewritten in place.
+        
+        Returns:
+            True if anything changed or no discovery has run yet
+        """
+        if self._snapshot is None:
+            return True
+        paths = list(self._snapshot)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            stamps = pool.map(_stat_stamp, paths)
+            return any(stamp != self._snapshot[path] for path, stamp in zip(paths, stamps))
+    
+    def dataset_stamp(self, dataset: DatasetConfig) -> Optional[Tuple[int, int]]:
+        """Get the stamp a dataset's final_output.json had when it was last discovered."""
+        entry = (self._manifest or {}).get(str(dataset.path))
+        return tuple(entry["stamp"]) if entry else None
+    
+    def _scan_tree(self, pool: ThreadPoolExecutor,
+                   snapshot: Dict[Path, Optional[Tuple[int, int]]]) -> Tuple[List[Path], List[Path]]:
+        """
+        Find dataset directories and archives under the data root.
+        
+        Lists one directory level at a time, all directories of a level
+        concurrently. A dataset directory is never descended into.
+        
+        Args:
+            pool: Thread pool for the directory listings
+            snapshot: Updated in place with the stamp of every listed directory
+            
+        Returns:
+            Tuple of (dataset directories, archive files), each sorted by path
+        """
+        dataset_dirs: List[Path] = []
+        archives: List[Path] = []
+        level = [self.data_root]
+        depth = 0
+        while level:
+            next_level = []
+            for directory, (stamp, has_final_output, subdirs, dir_archives) in zip(level, pool.map(_scan_directory, level)):
+                snapshot[directory] = stamp
+                if depth > 0 and has_final_output:
+                    dataset_dirs.append(directory)
+                elif depth == 0 or self.recursive:
+                    archives.extend(dir_archives)
+                    # Hidden and tooling folders are only skipped below the top level
+                    next_level.extend(subdir for subdir in subdirs
+                                      if depth == 0 or not subdir.name.startswith(_SKIPPED_DIR_PREFIXES))
+            level = next_level
+            depth += 1
+        return sorted(dataset_dirs), sorted(archives)
+    
+    def _read_archive(self, archive: Path) -> List[DatasetConfig]:
+        """
+        Read the datasets found inside a .zip archive.
+        
+        Each final_output.json member becomes a dataset whose path runs
+        through the archive (e.g. data/run.zip/run/final_output.json), which
+        Silo.load_document() reads without extracting.
+        
+        Args:
+            archive: Path to the .zip file
+            
+        Returns:
+            DatasetConfig objects in member order (empty if unreadable)
+        """
+        try:
+            members = archive_members(str(archive), FINAL_OUTPUT_NAME)
+        except Exception as e:
+            logger.error(f"Error reading archive {archive}: {e}")
+            return []
+        
+        configs = []
+        for member in members:
+            final_output_path = archive.joinpath(*member.filename.split("/"))
+            dataset_config = self._load_dataset_config(final_output_path.parent, final_output_path)
+            if dataset_config:
+                configs.append(dataset_config)
+        return configs
+    
+    @staticmethod
+    def _add_archived(archive: Path, configs: List[DatasetConfig], datasets: Dict[str, DatasetConfig]):
+        """
+        Add an archive's datasets unless an extracted copy was already found.
+        
+        Args:
+            archive: Path to the .zip file
+            configs: Datasets read from the archive
+            datasets: Discovered datasets, updated in place
+        """
+        for dataset_config in configs:
+            if dataset_config.name in datasets:
+                logger.info(f"Skipping archived dataset {dataset_config.name}: extracted copy already discovered")
+                continue
+            datasets[dataset_config.name] = dataset_config
+            logger.info(f"Discovered dataset: {dataset_config.name} (in {archive.name})")
+    
     def _load_dataset_config(self, dataset_dir: Path, final_output_path: Path) -> Optional[DatasetConfig]:
         """
         Load configuration for a single dataset.
         
         Args:
-            dataset_dir: Directory containing the dataset
-            final_output_path: Path to final_output.json
+            dataset_dir: Directory containing the dataset (possibly inside an archive)
+            final_output_path: Path to final_output.json (possibly an archive member)
             
         Returns:
             DatasetConfig object or None if loading fails
         """
         try:
-            # Load final_output.json to get document info
-            with open(final_output_path, 'r') as f:
-                data = json.load(f)
+            key = str(final_output_path)
+            stamp = list(source_stamp(key))
+            entry = self._manifest.get(key) if self._manifest else None
+            if entry and entry["stamp"] == stamp:
+                self._entries[key] = entry
+                return DatasetConfig(path=final_output_path, **entry["config"])
+            
+            # Use the header of a document this process already parsed, or read
+            # just the header objects of final_output.json to get document info
+            data = self.document_cache.get(key, tuple(stamp))
+            if data is None:
+                data = read_top_level_fields(key, HEADER_FIELDS)
             
             document_info = data.get('document_info', {})
             document_summary = data.get('document_summary', {})
@@ -120,7 +387,7 @@ class DataDiscovery:
             # Generate description
             description = self._generate_description(document_summary, page_count, table_count)
             
-            return DatasetConfig(
+            dataset_config = DatasetConfig(
                 name=name,
                 path=final_output_path,
                 document_id=document_id,
@@ -130,11 +397,56 @@ class DataDiscovery:
                 table_count=table_count,
                 keyword_count=keyword_count
             )
+            config_fields = asdict(dataset_config)
+            del config_fields["path"]
+            self._entries[key] = {"stamp": stamp, "config": config_fields}
+            return dataset_config
             
         except Exception as e:
             logger.error(f"Error loading dataset config from {final_output_path}: {e}")
             return None
     
+    def _manifest_paths(self) -> List[Path]:
+        """Get the manifest locations to use, preferred first."""
+        paths = [Path(self.manifest_path)]
+        if self._fallback_manifest_path is not None:
+            paths.append(self._fallback_manifest_path)
+        return paths
+    
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Read the discovery manifest, returning an empty one if missing or unusable."""
+        for path in self._manifest_paths():
+            try:
+                with open(path, 'r') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if manifest.get("version") == DISCOVERY_MANIFEST_VERSION:
+                return manifest.get("datasets", {})
+        return {}
+    
+    def _write_manifest(self) -> Optional[Path]:
+        """
+        Persist the discovery manifest atomically.
+        
+        Tries each manifest location in turn; an unwritable location is
+        only logged.
+        
+        Returns:
+            Path the manifest was written to, or None if none was writable
+        """
+        for path in self._manifest_paths():
+            tmp_path = f"{path}.tmp"
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'w') as f:
+                    json.dump({"version": DISCOVERY_MANIFEST_VERSION, "datasets": self._manifest}, f)
+                os.replace(tmp_path, path)
+                return path
+            except OSError as e:
+                logger.warning(f"Could not write discovery manifest {path}: {e}")
+        return None
+    
     def _generate_dataset_name(self, document_id: str, document_summary: Dict[str, Any]) -> str:
         """Generate a human-readable name for the dataset."""
         # Try to extract a meaningful name from page titles
@@ -200,21 +512,37 @@ class DataDiscovery:
 class ConfigManager:
     """Main configuration manager for the system."""
     
-    def __init__(self, data_root: Optional[Path] = None):
+    def __init__(self, data_root: Optional[Path] = None,
+                 max_workers: int = DEFAULT_SCAN_WORKERS, recursive: bool = False,
+                 manifest_path: Optional[Path] = None):
         """
         Initialize the configuration manager.
         
         Args:
             data_root: Root directory for data
+            max_workers: Concurrency limit for dataset discovery
+            recursive: Discover datasets in nested folders of the data root
+            manifest_path: Where to cache the discovery manifest (see DataDiscovery)
         """
-        self.discovery = DataDiscovery(data_root)
+        self.discovery = DataDiscovery(data_root, manifest_path=manifest_path,
+                                       max_workers=max_workers, recursive=recursive)
+        self._listeners: List[Callable[[DatasetChanges], None]] = []
         self.config = self._load_config()
     
     def _load_config(self) -> SystemConfig:
         """Load the system configuration."""
         datasets = self.discovery.discover_datasets()
         
-        # Set default dataset (first one found, or None)
+        return SystemConfig(
+            datasets=datasets,
+            default_dataset=self._choose_default(datasets),
+            data_root=self.discovery.data_root,
+            llm_config={}
+        )
+    
+    @staticmethod
+    def _choose_default(datasets: Dict[str, DatasetConfig]) -> Optional[str]:
+        """Pick the default dataset (first one found, or None)."""
         default_dataset = None
         if datasets:
             # Prefer medical datasets as default, then any available
@@ -224,13 +552,32 @@ class ConfigManager:
                     break
             if not default_dataset:
                 default_dataset = list(datasets.keys())[0]
+        return default_dataset
+    
+    def subscribe(self, listener: Callable[[DatasetChanges], None]):
+        """
+        Register a listener for dataset changes found by refresh_datasets().
         
-        return SystemConfig(
-            datasets=datasets,
-            default_dataset=default_dataset,
-            data_root=self.discovery.data_root,
-            llm_config={}
-        )
+        Listeners are called synchronously with the DatasetChanges after
+        config.datasets has been updated.
+        
+        Args:
+            listener: Callable receiving a DatasetChanges
+            
+        Example:
+            manager.subscribe(barn.apply_dataset_changes)
+        """
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[DatasetChanges], None]):
+        """
+        Remove a previously registered listener.
+        
+        Args:
+            listener: Callable passed to subscribe()
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
     
     def get_dataset_config(self, dataset_name: Optional[str] = None) -> Optional[DatasetConfig]:
         """
@@ -254,6 +601,9 @@ class ConfigManager:
         """
         Get the path to a dataset's final_output.json.
         
+        For archived datasets the path runs through the .zip file; pass it
+        to Silo.load_document() rather than opening it directly.
+        
         Args:
             dataset_name: Name of the dataset. If None, returns default dataset.
             
@@ -284,11 +634,60 @@ class ConfigManager:
             })
         return datasets
     
-    def refresh_datasets(self):
-        """Refresh the dataset discovery."""
+    def refresh_datasets(self, force: bool = False) -> DatasetChanges:
+        """
+        Refresh the dataset discovery incrementally.
+        
+        First polls the directory and file stamps recorded by the last
+        discovery; if none changed, nothing else is done. Otherwise the data
+        root is rediscovered (unchanged files are served from the discovery
+        manifest) and the result is compared with the current datasets.
+        config.datasets is updated in place and subscribers are notified of
+        the datasets that were added, removed or modified.
+        
+        Args:
+            force: Rediscover even if no stamp changed
+            
+        Returns:
+            DatasetChanges (empty if nothing changed)
+            
+        Example:
+            # In a long-running server, poll every few seconds
+            changes = manager.refresh_datasets()
+            if changes:
+                print(f"New datasets: {list(changes.added)}")
+        """
+        changes = DatasetChanges()
+        if not force and not self.discovery.has_changes():
+            return changes
+        
         logger.info("Refreshing dataset discovery...")
-        self.config = self._load_config()
-        logger.info(f"Found {len(self.config.datasets)} datasets")
+        current = self.config.datasets
+        stamps = {name: self.discovery.dataset_stamp(dataset) for name, dataset in current.items()}
+        datasets = self.discovery.discover_datasets()
+        
+        for name, dataset in current.items():
+            if name not in datasets or datasets[name].path != dataset.path:
+                changes.removed[name] = dataset
+        for name, dataset in datasets.items():
+            if name not in current or name in changes.removed:
+                changes.added[name] = dataset
+            elif dataset != current[name] or self.discovery.dataset_stamp(dataset) != stamps[name]:
+                changes.modified[name] = dataset
+        
+        for name in changes.removed:
+            del current[name]
+        for name, dataset in {**changes.modified, **changes.added}.items():
+            current[name] = dataset
+        if self.config.default_dataset not in current:
+            self.config.default_dataset = self._choose_default(current)
+        
+        logger.info(f"Found {len(current)} datasets ({len(changes.added)} added, "
+                    f"{len(changes.removed)} removed, {len(changes.modified)} modified)")
+        if changes:
+            for listener in list(self._listeners):
+                listener(changes)
+        return changes
 
 # Global configuration instance
 _config_manager = None
@@ -0,0 +1,184 @@
+"""
+Document Cache - Process-Wide Cache of final_output.json Headers
+
+Dataset discovery needs the document_info and document_summary of every
+final_output.json, and a Silo in the same process has usually parsed the
+file already. DocumentCache records those header fields whenever a file is
+parsed, keyed by path and change stamp ((size, mtime) for files, (size,
+CRC) for archive members), so discovery does not read the file again. A
+changed file simply misses; the stale entry is dropped.
+
+Only headers are cached, never whole parses: a parsed document is owned by
+the caller that parsed it, so a Silo's compression, eviction and interning
+savings are not cancelled out by a second, uncompressed copy held here.
+The cache is an LRU bounded by the retained size of the cached headers.
+
+Example Usage:
+    cache = shared_document_cache()
+    data = cache.load("data/doc/final_output.json")   # parsed, header recorded
+    header = cache.get("data/doc/final_output.json")  # {'document_info': ..., 'document_summary': ...}
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.archives import open_source, source_stamp
+from src.memory import deep_sizeof
+
+
+# final_output.json fields recorded for each parsed file (what dataset discovery reads)
+HEADER_FIELDS = ("document_info", "document_summary")
+
+# Default bound on the retained size of cached headers
+DEFAULT_MAX_BYTES = 4 << 20
+
+
+def _cache_key(path: str) -> str:
+    """Normalize a path so different spellings of one file share an entry."""
+    return os.path.abspath(os.path.normpath(str(path)))
+
+
+class DocumentCache:
+    """
+    Size-bounded LRU of document headers keyed by path and change stamp.
+    
+    Safe to use from several threads. Parsing happens outside the lock.
+    
+    Attributes:
+        max_bytes: Upper bound on the retained size of cached headers
+        size_bytes: Current retained size of cached headers
+        hits: Lookups served from the cache
+        misses: Lookups that found no current entry
+        evictions: Headers dropped to stay within max_bytes
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_bytes: Upper bound on the retained size of cached headers (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any], int]]" = OrderedDict()  # {key: (stamp, header, size)}
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, path: str, stamp: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a file's cached header if it matches the file's current version.
+        
+        Args:
+            path: Path to the file (or an archive member)
+            stamp: Current stamp of the file, if already known
+        
+        Returns:
+            Dictionary of the HEADER_FIELDS present in the file (read-only),
+            or None on a miss
+        """
+        if stamp is None:
+            stamp = source_stamp(path)
+        key = _cache_key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, path: str, stamp: Tuple[int, int], data: Dict[str, Any]):
+        """
+        Record a parsed document's header, evicting least recently used ones beyond max_bytes.
+        
+        Args:
+            path: Path the document was parsed from
+            stamp: Stamp of the file taken before it was parsed
+            data: Parsed document (only its HEADER_FIELDS are kept, and
+                  must not be modified afterwards)
+        """
+        header = {name: data[name] for name in HEADER_FIELDS if name in data}
+        size = deep_sizeof(header)
+        if size > self.max_bytes:
+            return
+        key = _cache_key(path)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (stamp, header, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+    
+    def load(self, path: str) -> Dict[str, Any]:
+        """
+        Parse a document and record its header.
+        
+        Args:
+            path: Path to a final_output.json file (or an archive member)
+        
+        Returns:
+            Parsed document, owned by the caller
+        
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file contains invalid JSON
+        """
+        stamp = source_stamp(path)
+        with open_source(path) as f:
+            data = json.load(f)
+        self.put(path, stamp, data)
+        return data
+    
+    def discard(self, path: str):
+        """Drop a file's cached header if present."""
+        with self._lock:
+            self._discard(_cache_key(path))
+    
+    def clear(self):
+        """Drop every cached header (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Get cache size and counters."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+    
+    def _discard(self, key: str):
+        """Drop an entry; the caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[2]
+
+
+# Cache shared by every Silo and DataDiscovery in the process
+_shared_cache = DocumentCache()
+
+
+def shared_document_cache() -> DocumentCache:
+    """
+    Get the process-wide document cache.
+    
+    Returns:
+        DocumentCache used by default by Silo and DataDiscovery
+    """
+    return _shared_cache
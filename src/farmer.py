@@ -54,17 +54,18 @@ class Farmer:
         """
         return self.barn.load_document(doc_id, data_path)
     
-    def load_documents(self, doc_mappings: Dict[str, str]) -> Dict[str, bool]:
+    def load_documents(self, doc_mappings: Dict[str, str], workers: int = 1) -> Dict[str, bool]:
         """
         Load multiple documents at once.
         
         Args:
             doc_mappings: {doc_id: data_path} mapping
+            workers: Number of worker processes used for parsing (1 = serial)
             
         Returns:
             {doc_id: success_status} mapping
         """
-        return self.barn.load_documents(doc_mappings)
+        return self.barn.load_documents(doc_mappings, workers=workers)
     
     def ask(self, question: str) -> RAGResponse:
         """
@@ -110,14 +111,19 @@ class Farmer:
     
     # ==================== DISCOVERY METHODS ====================
     
-    def get_pages(self) -> List[Dict[str, Any]]:
+    def get_pages(self, offset: int = 0, limit: Optional[int] = None, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get overview of all available pages.
+        Get overview of available pages, ordered by page number.
+        
+        Args:
+            offset: Number of pages to skip
+            limit: Maximum number of pages to return (None for all)
+            doc_id: Only list pages of this document
         
         Returns:
             List of pages with number, title, and doc_id
         """
-        return self.barn.call_tool("view_pages")
+        return self.barn.call_tool("view_pages", offset=offset, limit=limit, doc_id=doc_id)
     
     def get_keywords(self) -> List[str]:
         """
@@ -128,14 +134,45 @@ class Farmer:
         """
         return self.barn.call_tool("view_keywords")
     
-    def get_tables(self) -> List[Dict[str, Any]]:
+    def search_keywords(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Complete a keyword prefix.
+        
+        Args:
+            prefix: Start of the keyword
+            limit: Maximum number of completions
+            
+        Returns:
+            Matching keywords with document counts, most widespread first
+        """
+        return self.barn.call_tool("search_keywords", prefix=prefix, limit=limit)
+    
+    def get_tables(self, offset: int = 0, limit: Optional[int] = None, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get overview of all available tables.
+        Get overview of available tables, ordered by page number and title.
+        
+        Args:
+            offset: Number of tables to skip
+            limit: Maximum number of tables to return (None for all)
+            doc_id: Only list tables of this document
         
         Returns:
             List of tables with title, category, and metadata
         """
-        return self.barn.call_tool("view_tables")
+        return self.barn.call_tool("view_tables", offset=offset, limit=limit, doc_id=doc_id)
+    
+    def filter_tables(self, **facets) -> Dict[str, Any]:
+        """
+        Find tables by facets.
+        
+        Args:
+            **facets: category, doc_id, page_min, page_max, min_rows, max_rows,
+                      min_columns, max_columns, offset, limit
+        
+        Returns:
+            Dictionary with the matching tables, their total and facet counts
+        """
+        return self.barn.call_tool("filter_tables", **facets)
     
     # ==================== EXPLORATION METHODS ====================
     
@@ -0,0 +1,136 @@
+"""
+Interning - Corpus-Wide String Deduplication for the Silo
+
+Each parsed document holds its own copy of every dictionary key and cell
+value, so column names like "Angle (°)", metadata categories and repeated
+cell values exist once per row per document. A StringPool shared by all
+documents of a Silo replaces equal strings with a single pooled object.
+
+Only dictionary keys and strings up to `max_length` characters are pooled;
+long free text such as raw_content rarely repeats and would just grow the
+pool.
+
+Strings cannot be held weakly, so the pool is pruned instead: after a
+document is removed or reloaded, prune() drops every pooled string that
+nothing outside the pool refers to any more.
+
+Example Usage:
+    pool = StringPool()
+    data, saved = pool.intern_value(data)
+    print(f"Interning saved {saved} bytes")
+    
+    del data
+    pool.prune()  # the pool no longer keeps the document's strings alive
+"""
+
+import sys
+from typing import Any, Dict, Tuple
+
+
+# Longest string value that is pooled (dictionary keys are always pooled)
+INTERN_MAX_LENGTH = 128
+
+
+def _pool_only_refcount() -> int:
+    """
+    Measure sys.getrefcount() of a string held only as a pool key and value.
+    
+    Measured with the same comprehension StringPool.prune() uses, since the
+    count includes references from the interpreter that vary by version.
+    """
+    probe: Dict[str, str] = {}
+    text = "".join(["string", "pool", "probe"])
+    probe[text] = text
+    del text
+    return [sys.getrefcount(text) for text in probe][0]
+
+
+# Reference count of a pooled string that nothing outside the pool uses
+_POOL_ONLY_REFCOUNT = _pool_only_refcount()
+
+
+class StringPool:
+    """
+    Pool of canonical string objects shared across documents.
+    
+    Attributes:
+        max_length: Longest string value that is pooled
+        saved_bytes: Total bytes released by all interning passes so far
+    """
+    
+    def __init__(self, max_length: int = INTERN_MAX_LENGTH):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            max_length: Longest string value that is pooled
+        """
+        self.max_length = max_length
+        self.saved_bytes = 0
+        self._strings: Dict[str, str] = {}
+    
+    def __len__(self) -> int:
+        return len(self._strings)
+    
+    def clear(self):
+        """Drop every pooled string and reset the savings counter."""
+        self._strings.clear()
+        self.saved_bytes = 0
+    
+    def prune(self) -> int:
+        """
+        Drop pooled strings that are referenced only by the pool itself.
+        
+        Call after documents were removed or replaced, so the strings only
+        they used are freed. Costs one pass over the pool.
+        
+        Returns:
+            Number of strings dropped
+        """
+        unused = [text for text in self._strings if sys.getrefcount(text) <= _POOL_ONLY_REFCOUNT]
+        for text in unused:
+            del self._strings[text]
+        return len(unused)
+    
+    def intern_value(self, value: Any) -> Tuple[Any, int]:
+        """
+        Intern every key and short string value in a JSON-like structure.
+        
+        Dictionaries and lists are rebuilt with pooled keys and values, so
+        the input is never modified (it may be a cached, shared document).
+        
+        Args:
+            value: Parsed JSON value (dict, list or scalar)
+        
+        Returns:
+            Tuple of (interned value, bytes released by this pass)
+        """
+        # Keep every replaced string alive until the pass ends, so each one
+        # is counted once even if many rows shared it, and ids stay unique
+        replaced: Dict[int, str] = {}
+        result = self._intern(value, replaced)
+        saved = sum(sys.getsizeof(text) for text in replaced.values())
+        self.saved_bytes += saved
+        return result, saved
+    
+    def _pooled(self, text: str, replaced: Dict[int, str]) -> str:
+        """Get the pooled instance of a string, recording the one it replaces."""
+        pooled = self._strings.setdefault(text, text)
+        if pooled is not text:
+            replaced[id(text)] = text
+        return pooled
+    
+    def _intern(self, value: Any, replaced: Dict[int, str]) -> Any:
+        """Recursively intern one value."""
+        if isinstance(value, str):
+            if len(value) <= self.max_length:
+                return self._pooled(value, replaced)
+            return value
+        if type(value) is dict:
+            return {
+                (self._pooled(key, replaced) if isinstance(key, str) else key): self._intern(item, replaced)
+                for key, item in value.items()
+            }
+        if type(value) is list:
+            return [self._intern(item, replaced) for item in value]
+        return value
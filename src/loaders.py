@@ -0,0 +1,668 @@
+"""
+Loaders - Lazy Page Sources for the Silo
+
+Helpers that let the Silo keep only lightweight page headers resident and
+fault page bodies in from their source on first access.
+
+A page header holds the fields the Silo needs for indexing and discovery
+(page_id, title, summary, keywords and each table's table_id/title). The
+rest of the page - raw_content, table rows, processing metadata - stays in
+the source file until a tool actually reads it.
+
+Key Features:
+- LazyPage: read-only page mapping backed by a resident header and a body loader
+- Streaming parser for final_output.json that reads one page at a time
+- Header-only reads of final_output.json top-level fields for discovery
+- Byte-span loaders that re-read a single page body from the source file
+- Manifest-backed loading from the per-page 03_cleaned_json stage folder
+- Content digests so a re-read page can be compared without keeping its body
+- Every source may also be a member of a pipeline .zip archive (see archives)
+
+Example Usage:
+    header, pages = stream_final_output("data/doc/final_output.json")
+    page = pages[0]
+    print(page["title"])        # served from the header, no file access
+    print(page["raw_content"])  # faults the page body in from disk
+    
+    # Per-page stage files: a directory listing plus a cached manifest
+    fields, pages = scan_page_directory("data/doc")
+"""
+
+import codecs
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.archives import (FINAL_OUTPUT_NAME, list_source_directory, open_source,
+                          resolve_source, source_stamp, split_archive_path)
+
+
+# Page fields kept resident in a LazyPage header
+HEADER_FIELDS = ("page_id", "title", "summary", "keywords")
+
+# Size of each read from the source file while streaming
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Per-page stage folder written by the PB&J pipeline and the manifest cached next to it
+CLEANED_JSON_DIR = "03_cleaned_json"
+MANIFEST_NAME = "page_manifest.json"
+MANIFEST_VERSION = 1
+
+_PAGE_FILE_PATTERN = re.compile(r"^page_(\d+)\.json$")
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert the Silo's read-only page and row containers for json.dumps."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def content_digest(value: Any) -> str:
+    """
+    Get a digest of a page, table or other JSON-like value.
+    
+    The digest covers every field (for a page: raw_content, tables,
+    processing_metadata, ...) in canonical form, so it is the same for a
+    plain page dict and for the same page stored as a LazyPage,
+    CompressedPage or with columnar rows.
+    
+    Args:
+        value: Page, table or any other JSON-like value
+    
+    Returns:
+        Hex digest that changes whenever any field changes
+    """
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_jsonable)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LazyPage(Mapping):
+    """
+    Read-only page whose body is loaded on first access.
+    
+    Header fields and the key list are always resident, so membership tests,
+    iteration over keys and header lookups never touch the source. Any other
+    key triggers a single call to the body loader, after which the body is
+    cached until release() is called.
+    
+    Attributes:
+        table_headers: List of (table_id, title) tuples for the page's tables
+        digest: content_digest() of the full page as read, or None if unknown
+    """
+    
+    __slots__ = ("_header", "_keys", "table_headers", "_loader", "_body", "digest")
+    
+    def __init__(self,
+                 header: Dict[str, Any],
+                 keys: Tuple[str, ...],
+                 table_headers: List[Tuple[str, str]],
+                 loader: Callable[[], Dict[str, Any]],
+                 digest: Optional[str] = None):
+        """
+        Initialize a lazy page.
+        
+        Args:
+            header: Resident page fields (see HEADER_FIELDS)
+            keys: All keys of the full page, in source order
+            table_headers: (table_id, title) for each table on the page
+            loader: Callable returning the full page dictionary
+            digest: content_digest() of the full page, if it is known
+        """
+        self._header = header
+        self._keys = keys
+        self.table_headers = table_headers
+        self._loader = loader
+        self._body: Optional[Dict[str, Any]] = None
+        self.digest = digest
+    
+    @classmethod
+    def from_page(cls, page: Dict[str, Any], loader: Callable[[], Dict[str, Any]]) -> "LazyPage":
+        """
+        Build a lazy page from a fully parsed page, keeping only its header.
+        
+        Args:
+            page: Full page dictionary
+            loader: Callable that can re-read the same page later
+        
+        Returns:
+            LazyPage with the body not resident and its digest recorded
+        """
+        header = {key: page[key] for key in HEADER_FIELDS if key in page}
+        table_headers = [(table["table_id"], table["title"]) for table in page.get("tables", [])]
+        return cls(header, tuple(page.keys()), table_headers, loader, content_digest(page))
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the page body is currently resident."""
+        return self._body is not None
+    
+    @property
+    def body(self) -> Optional[Mapping]:
+        """The resident page body, or None if it is not loaded."""
+        return self._body
+    
+    def load(self) -> Dict[str, Any]:
+        """
+        Fault the page body in if needed and return it.
+        
+        Returns:
+            Full page dictionary
+        """
+        if self._body is None:
+            self._body = self._loader()
+        return self._body
+    
+    def release(self):
+        """Drop the resident page body; it is re-read on next access."""
+        self._body = None
+    
+    def add_body_transform(self, transform: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        """
+        Apply a transform to the page body every time it is loaded.
+        
+        Args:
+            transform: Callable receiving the loaded page dict and returning
+                       the page dict to keep resident
+        """
+        self._loader = TransformedLoader(self._loader, transform)
+        if self._body is not None:
+            self._body = transform(self._body)
+    
+    def rebind(self, source: "LazyPage"):
+        """
+        Read the body from another lazy page's source, keeping body transforms.
+        
+        Used when a document is re-read and this page is unchanged: the new
+        read knows where the page now lives (e.g. its byte span in a
+        rewritten file), while this page keeps its identity and loaded body.
+        
+        Args:
+            source: Freshly read LazyPage for the same page content
+        """
+        outer = None
+        loader = self._loader
+        while isinstance(loader, TransformedLoader):
+            outer, loader = loader, loader.loader
+        base = source._loader
+        while isinstance(base, TransformedLoader):
+            base = base.loader
+        if outer is None:
+            self._loader = base
+        else:
+            outer.loader = base
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._header:
+            return self._header[key]
+        if key not in self._keys:
+            raise KeyError(key)
+        return self.load()[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "unloaded"
+        return f"LazyPage({self._header.get('page_id')!r}, {state})"
+
+
+class TransformedLoader:
+    """Body loader that post-processes the result of another loader."""
+    
+    __slots__ = ("loader", "transform")
+    
+    def __init__(self, loader: Callable[[], Dict[str, Any]], transform: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        self.loader = loader
+        self.transform = transform
+    
+    def __call__(self) -> Dict[str, Any]:
+        return self.transform(self.loader())
+
+
+def page_table_headers(page: Mapping) -> List[Tuple[str, str]]:
+    """
+    Get (table_id, title) for each table on a page without loading its body.
+    
+    Args:
+        page: Plain page dictionary or LazyPage
+    
+    Returns:
+        List of (table_id, title) tuples in page order
+    """
+    if isinstance(page, LazyPage):
+        return page.table_headers
+    return [(table["table_id"], table["title"]) for table in page.get("tables", [])]
+
+
+class FileSpanLoader:
+    """
+    Loads one JSON value from a byte span of a file.
+    
+    The file's change stamp (see archives.source_stamp) is recorded when the
+    span is created, and a changed file is reported instead of returning
+    bytes that no longer correspond to the recorded span. The file may be a
+    .zip archive member, which is decompressed up to the span on each load.
+    """
+    
+    __slots__ = ("path", "offset", "length", "_stamp")
+    
+    def __init__(self, path: str, offset: int, length: int, stamp: Tuple[int, int]):
+        """
+        Initialize the loader.
+        
+        Args:
+            path: Path to the source file or archive member
+            offset: Byte offset of the JSON value
+            length: Byte length of the JSON value
+            stamp: Change stamp of the file when the span was recorded
+        """
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self._stamp = stamp
+    
+    def __call__(self) -> Dict[str, Any]:
+        if source_stamp(self.path) != self._stamp:
+            raise ValueError(f"Source file changed since it was loaded: {self.path}")
+        with open_source(self.path) as f:
+            f.seek(self.offset)
+            return json.loads(f.read(self.length))
+
+
+class _JsonStream:
+    """
+    Minimal incremental reader over a UTF-8 JSON file.
+    
+    Keeps a text buffer holding at most the value currently being decoded
+    plus one read chunk, and tracks the byte offset of the buffer start so
+    decoded values can be mapped back to byte spans in the file.
+    """
+    
+    _decoder = json.JSONDecoder()
+    
+    def __init__(self, f, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._buf_offset = 0  # byte offset of self._buf[0] in the file
+        self._eof = False
+    
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Read more data into the buffer; returns False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._buf += self._text_decoder.decode(b"", final=True)
+            self._eof = True
+            return False
+        self._buf += self._text_decoder.decode(chunk)
+        return True
+    
+    def _compact(self):
+        """Drop the consumed part of the buffer."""
+        if self._pos:
+            self._buf_offset += len(self._buf[:self._pos].encode("utf-8"))
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            self._compact()
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON stream")
+    
+    def expect(self, char: str):
+        """Consume the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at byte {self.byte_offset()}, found {found!r}")
+        self._pos += 1
+    
+    def byte_offset(self) -> int:
+        """Byte offset of the current position in the file."""
+        self._compact()
+        return self._buf_offset
+    
+    def value(self) -> Tuple[Any, int, int]:
+        """
+        Decode the next JSON value.
+        
+        Returns:
+            Tuple of (value, byte offset, byte length)
+        """
+        self.peek()
+        self._compact()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer edge may be a truncated number
+                if end < len(self._buf) or self._eof:
+                    break
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill(read_size)
+            read_size *= 2  # keep retries for large values close to linear
+        
+        start = self._buf_offset
+        length = len(self._buf[:end].encode("utf-8"))
+        self._buf = self._buf[end:]
+        self._buf_offset = start + length
+        self._pos = 0
+        return value, start, length
+
+
+def stream_final_output(data_path: str,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[Dict[str, Any], List[LazyPage]]:
+    """
+    Stream a final_output.json file page by page.
+    
+    Top-level fields other than 'pages' (document_info, document_summary,
+    toast_info) are decoded normally. Each element of 'pages' is decoded on
+    its own, reduced to a LazyPage header with a byte-span loader, and then
+    discarded, so peak memory is bounded by the largest single page rather
+    than by the document size.
+    
+    Args:
+        data_path: Path to the final_output.json file (or an archive member)
+        chunk_size: Number of bytes read from the file at a time
+    
+    Returns:
+        Tuple of (top-level fields without 'pages', list of LazyPage objects)
+    
+    Raises:
+        ValueError: If the file is not a JSON object or is truncated
+        json.JSONDecodeError: If a value in the file is invalid JSON
+    """
+    stamp = source_stamp(data_path)
+    fields: Dict[str, Any] = {}
+    pages: List[LazyPage] = []
+    
+    with open_source(data_path) as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return fields, pages
+        
+        while True:
+            key, _, _ = stream.value()
+            stream.expect(":")
+            
+            if key == "pages" and stream.peek() == "[":
+                stream.expect("[")
+                if stream.peek() != "]":
+                    while True:
+                        page, offset, length = stream.value()
+                        loader = FileSpanLoader(data_path, offset, length, stamp)
+                        pages.append(LazyPage.from_page(page, loader))
+                        del page
+                        if stream.peek() == "]":
+                            break
+                        stream.expect(",")
+                stream.expect("]")
+            else:
+                fields[key], _, _ = stream.value()
+            
+            if stream.peek() == "}":
+                break
+            stream.expect(",")
+    
+    return fields, pages
+
+
+def read_top_level_fields(data_path: str,
+                          names: Tuple[str, ...],
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Read selected top-level fields of a final_output.json file.
+    
+    Stops as soon as every requested field has been decoded. The pipeline
+    writes document_info and document_summary ahead of 'pages', so reading
+    just those costs one chunk of the file rather than a full parse. Fields
+    that come before the requested ones are decoded and discarded.
+    
+    Args:
+        data_path: Path to the final_output.json file (or an archive member)
+        names: Top-level field names to read
+        chunk_size: Number of bytes read from the file at a time
+    
+    Returns:
+        Dictionary with the requested fields that the file has
+    
+    Raises:
+        ValueError: If the file is not a JSON object or is truncated
+        json.JSONDecodeError: If a value in the file is invalid JSON
+    """
+    wanted = set(names)
+    fields: Dict[str, Any] = {}
+    
+    with open_source(data_path) as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return fields
+        
+        while wanted:
+            key, _, _ = stream.value()
+            stream.expect(":")
+            value, _, _ = stream.value()
+            if key in wanted:
+                fields[key] = value
+                wanted.discard(key)
+            del value
+            
+            if stream.peek() == "}":
+                break
+            stream.expect(",")
+    
+    return fields
+
+
+def columns_to_rows(page: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a stage-3 page's tables from column arrays to row dictionaries.
+    
+    The per-page 03_cleaned_json files store each table as a 'columns' list
+    plus 'rows' as value arrays. final_output.json stores rows as dictionaries
+    keyed by column name (the "toast" conversion) and has no 'columns' key.
+    This applies the same conversion so both sources look identical.
+    
+    Args:
+        page: Page dictionary from a 03_cleaned_json file (modified in place)
+    
+    Returns:
+        The same page dictionary with row-based tables
+    """
+    for table in page.get("tables", []):
+        if "columns" not in table:
+            continue
+        columns = table.pop("columns")
+        table["rows"] = [
+            dict(zip(columns, row)) if isinstance(row, list) else row
+            for row in table.get("rows", [])
+        ]
+    return page
+
+
+class PageFileLoader:
+    """Loads one page from a per-page stage file, converting tables to rows."""
+    
+    __slots__ = ("path", "_stamp")
+    
+    def __init__(self, path: str, stamp: Tuple[int, int]):
+        """
+        Initialize the loader.
+        
+        Args:
+            path: Path to the page_N.json file (or an archive member)
+            stamp: Change stamp of the file when it was scanned
+        """
+        self.path = path
+        self._stamp = stamp
+    
+    def __call__(self) -> Dict[str, Any]:
+        if source_stamp(self.path) != self._stamp:
+            raise ValueError(f"Source file changed since it was loaded: {self.path}")
+        with open_source(self.path) as f:
+            return columns_to_rows(json.load(f))
+
+
+def _read_manifest(manifest_path: str) -> Dict[str, Any]:
+    """Read a page manifest, returning an empty one if missing or unusable."""
+    try:
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("pages", {})
+
+
+def _write_manifest(manifest_path: str, entries: Dict[str, Any]) -> bool:
+    """Persist a page manifest atomically; returns False if the location is not writable."""
+    tmp_path = f"{manifest_path}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": MANIFEST_VERSION, "pages": entries}, f)
+        os.replace(tmp_path, manifest_path)
+        return True
+    except OSError:
+        return False
+
+
+def scan_page_directory(dataset_dir: str,
+                        manifest_path: Optional[str] = None) -> Tuple[Dict[str, Any], List[LazyPage]]:
+    """
+    Build lazy pages for a dataset from its 03_cleaned_json page files.
+    
+    The page folder is listed with os.scandir and each page_N.json file is
+    matched against a manifest entry by name, size and mtime. Matching files
+    are not opened at all - their headers come from the manifest. Only new or
+    changed files are read once to record their header, after which the
+    manifest is written back. Page bodies are read when first accessed.
+    
+    Document-level fields (document_info, document_summary) are synthesized
+    from the page headers, since final_output.json is not consulted.
+    
+    The dataset may live in a .zip archive, given either as the archive
+    itself or as a directory inside it. Archive members are stamped by size
+    and CRC, and no manifest is kept unless `manifest_path` is given, since
+    the default location would be inside the archive.
+    
+    Args:
+        dataset_dir: Dataset directory containing 03_cleaned_json/
+        manifest_path: Where to cache the manifest
+                      (default: <dataset_dir>/page_manifest.json)
+    
+    Returns:
+        Tuple of (document-level fields, list of LazyPage objects in page order)
+    
+    Raises:
+        FileNotFoundError: If the dataset has no 03_cleaned_json folder
+    """
+    archive = split_archive_path(dataset_dir)
+    if archive is not None:
+        if not archive[1]:
+            # A bare archive: use the dataset directory holding final_output.json
+            dataset_dir = os.path.dirname(resolve_source(dataset_dir, FINAL_OUTPUT_NAME))
+    elif manifest_path is None:
+        manifest_path = os.path.join(dataset_dir, MANIFEST_NAME)
+    pages_dir = os.path.join(dataset_dir, CLEANED_JSON_DIR)
+    
+    cached = _read_manifest(manifest_path) if manifest_path else {}
+    entries: Dict[str, Any] = {}
+    files: List[Tuple[int, str, Tuple[int, int]]] = []
+    changed = False
+    
+    for name, stamp in list_source_directory(pages_dir):
+        match = _PAGE_FILE_PATTERN.match(name)
+        if match:
+            files.append((int(match.group(1)), name, stamp))
+    files.sort()
+    
+    pages: List[LazyPage] = []
+    for _, name, stamp in files:
+        path = os.path.join(pages_dir, name)
+        entry = cached.get(name)
+        if not entry or tuple(entry["stamp"]) != stamp:
+            # New or changed page file: read it once to record its header
+            page = PageFileLoader(path, stamp)()
+            entry = {
+                "stamp": list(stamp),
+                "header": {key: page[key] for key in HEADER_FIELDS if key in page},
+                "keys": list(page.keys()),
+                "tables": [[table["table_id"], table["title"]] for table in page.get("tables", [])],
+            }
+            changed = True
+        entries[name] = entry
+        pages.append(LazyPage(
+            entry["header"],
+            tuple(entry["keys"]),
+            [tuple(table) for table in entry["tables"]],
+            PageFileLoader(path, stamp)
+        ))
+    
+    if manifest_path and (changed or len(entries) != len(cached)):
+        _write_manifest(manifest_path, entries)
+    
+    return _summarize_pages(os.path.basename(os.path.normpath(dataset_dir)), pages), pages
+
+
+def _summarize_pages(document_id: str, pages: List[LazyPage]) -> Dict[str, Any]:
+    """
+    Synthesize final_output.json-style document fields from page headers.
+    
+    Args:
+        document_id: Identifier to record in document_info
+        pages: Lazy pages of the document
+    
+    Returns:
+        Dictionary with 'document_info' and 'document_summary'
+    """
+    keywords: Dict[str, None] = {}
+    table_summary = []
+    for page in pages:
+        keywords.update(dict.fromkeys(page.get("keywords", [])))
+        table_summary.append({
+            "page_id": page["page_id"],
+            "page_title": page.get("title", ""),
+            "table_count": len(page.table_headers),
+            "table_titles": [title for _, title in page.table_headers]
+        })
+    
+    return {
+        "document_info": {
+            "document_id": document_id,
+            "total_pages": len(pages),
+            "total_tables": sum(len(page.table_headers) for page in pages),
+            "total_keywords": len(keywords),
+            "processing_pipeline": [CLEANED_JSON_DIR]
+        },
+        "document_summary": {
+            "combined_keywords": list(keywords),
+            "page_titles": [page.get("title", "") for page in pages],
+            "table_summary": table_summary
+        }
+    }
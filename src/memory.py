@@ -0,0 +1,63 @@
+"""
+Memory - Retained-Size Accounting for Silo Data
+
+Measures how many bytes a structure keeps alive by walking its references
+with gc.get_referents() and summing sys.getsizeof() of every object reached.
+A shared `seen` set lets several measurements split one object graph
+between owners: an object is charged to the first measurement that reaches
+it, so strings pooled across documents or page dicts referenced by a tool
+cache are never counted twice.
+
+Types, modules, functions and methods are not followed. They are shared
+program state, and a bound method (such as a lazy-page body loader) would
+otherwise pull in its whole owning object.
+
+Example Usage:
+    seen = set()
+    doc_bytes = deep_sizeof(silo.documents["doc1"], seen)
+    cache_bytes = deep_sizeof(finder._table_cache, seen)
+"""
+
+import gc
+import sys
+import types
+from functools import partial
+from typing import Any, Optional, Set
+
+
+# Shared program objects that are neither measured nor followed
+_OPAQUE_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    partial,
+)
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Get the bytes retained by an object and everything it references.
+    
+    Args:
+        obj: Root object
+        seen: ids of objects already charged elsewhere; updated in place
+    
+    Returns:
+        Total size in bytes of the objects reached that were not in `seen`
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, _OPAQUE_TYPES):
+            continue
+        total += sys.getsizeof(current)
+        stack.extend(gc.get_referents(current))
+    return total
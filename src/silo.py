@@ -14,6 +14,20 @@ Key Features:
 - Document metadata tracking and statistics
 - Pure data storage (no search/retrieval logic)
 - Support for document addition and removal
+- Constant-time page/table lookups through load-time hash indexes
+- Zero-copy, read-only page and table views for lazy corpus iteration
+- Optional streaming load that keeps only page headers resident
+- Manifest-backed loading from per-page stage files, reading pages on demand
+- Binary, memory-mapped snapshots for fast cold start across processes
+- Parallel multi-document ingestion with per-file load timings
+- Typed columnar table storage with lazy row-dictionary views
+- Corpus-wide interning of keys and repeated string values
+- Retained-memory report per document, page content, table rows and tool cache
+- Memory-budgeted LRU eviction of document bodies with transparent reload
+- Optional zlib/lzma compression of page raw_content with a decompressed-text LRU
+- Loading straight from pipeline .zip archives without extracting
+- Monotonic version counter and document added/removed/changed events
+- In-place document reload that swaps only changed pages and reports a diff
 - Comprehensive statistics and overview capabilities
 
 Example Usage:
@@ -27,16 +41,31 @@ Example Usage:
     # Get tables from specific document
     doc_tables = silo.get_tables_by_document("doc1")
     
+    # Iterate pages lazily without copying them
+    for page in silo.iter_pages():
+        print(page["doc_id"], page["page_id"])
+    
     # Get comprehensive statistics
     stats = silo.get_statistics()
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterator, Callable
+from collections import OrderedDict
+from collections.abc import Mapping
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from datetime import datetime
 from dataclasses import dataclass, field
-from src.models.table import TableInfo, TableRow
-from src.models.search import SearchResult
+from src.loaders import LazyPage, stream_final_output, scan_page_directory, page_table_headers, content_digest
+from src.snapshot import Snapshot, write_snapshot
+from src.archives import open_source, resolve_source
+from src.columnar import columnarize_page, plain_rows
+from src.interning import StringPool
+from src.memory import deep_sizeof
+from src.compression import CODECS, DEFAULT_CACHE_BYTES, CompressedPage, DecompressedCache
+from src.document_cache import DocumentCache, shared_document_cache
 
 
 @dataclass
@@ -60,6 +89,257 @@ class DocumentInfo:
     keywords: List[str] = field(default_factory=list)
 
 
+# Change event kinds published by Silo.subscribe()
+DOCUMENT_ADDED = "document_added"
+DOCUMENT_REMOVED = "document_removed"
+DOCUMENT_CHANGED = "document_changed"
+
+
+@dataclass
+class DocumentDiff:
+    """
+    Pages and tables that changed when a document was reloaded.
+    
+    Pages are matched by page_id and tables by (page_id, table_id).
+    
+    Attributes:
+        doc_id: Identifier of the reloaded document
+        added_pages: page_ids that are new in the document
+        removed_pages: page_ids that are no longer in the document
+        changed_pages: page_ids whose content changed
+        unchanged_pages: Number of pages kept as they were
+        added_tables: (page_id, table_id) of new tables
+        removed_tables: (page_id, table_id) of tables that are gone
+        changed_tables: (page_id, table_id) of tables whose content changed
+        fields_changed: Whether document-level fields (document_info,
+                        document_summary, ...) changed
+    """
+    doc_id: str
+    added_pages: List[str] = field(default_factory=list)
+    removed_pages: List[str] = field(default_factory=list)
+    changed_pages: List[str] = field(default_factory=list)
+    unchanged_pages: int = 0
+    added_tables: List[Tuple[str, str]] = field(default_factory=list)
+    removed_tables: List[Tuple[str, str]] = field(default_factory=list)
+    changed_tables: List[Tuple[str, str]] = field(default_factory=list)
+    fields_changed: bool = False
+    
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything in the document changed."""
+        return bool(self.added_pages or self.removed_pages or self.changed_pages or self.fields_changed)
+
+
+@dataclass(frozen=True)
+class SiloEvent:
+    """
+    A change to the set of documents held by a Silo.
+    
+    Attributes:
+        kind: DOCUMENT_ADDED, DOCUMENT_REMOVED or DOCUMENT_CHANGED
+        doc_id: Identifier of the affected document
+        version: Silo version after the change
+        diff: What changed, for DOCUMENT_CHANGED events (None otherwise)
+    """
+    kind: str
+    doc_id: str
+    version: int
+    diff: Optional[DocumentDiff] = None
+
+
+class _ContextView(Mapping):
+    """
+    Read-only mapping that overlays context fields on a stored record.
+    
+    The underlying record is referenced, not copied, so creating a view costs
+    the same regardless of how large the record is. Context fields take
+    precedence over keys of the same name in the record. Nested values
+    (tables, rows, metadata) are the stored objects and must not be mutated.
+    """
+    
+    __slots__ = ("_record", "_context")
+    
+    def __init__(self, record: Mapping, context: Dict[str, Any]):
+        self._record = record
+        self._context = context
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._context:
+            return self._context[key]
+        return self._record[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._context
+        for key in self._record:
+            if key not in self._context:
+                yield key
+    
+    def __len__(self) -> int:
+        return len(self._context) + sum(1 for key in self._record if key not in self._context)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class PageView(_ContextView):
+    """
+    Read-only view of a stored page with its 'doc_id' added.
+    
+    Attributes:
+        doc_id: Identifier of the document the page belongs to
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, page: Mapping, doc_id: str):
+        super().__init__(page, {"doc_id": doc_id})
+    
+    @property
+    def doc_id(self) -> str:
+        return self._context["doc_id"]
+
+
+class TableView(_ContextView):
+    """
+    Read-only view of a stored table with its 'doc_id' and 'page_id' added.
+    
+    Attributes:
+        doc_id: Identifier of the document the table belongs to
+        page_id: Identifier of the page the table appears on
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, table: Mapping, doc_id: str, page_id: str):
+        super().__init__(table, {"doc_id": doc_id, "page_id": page_id})
+    
+    @property
+    def doc_id(self) -> str:
+        return self._context["doc_id"]
+    
+    @property
+    def page_id(self) -> str:
+        return self._context["page_id"]
+
+
+def _normalize_title(title: str) -> str:
+    """
+    Normalize a table title for index lookups.
+    
+    Collapses internal whitespace and case-folds the title so that lookups
+    coming from LLM tool calls tolerate minor formatting differences.
+    
+    Args:
+        title: Raw table title
+        
+    Returns:
+        Normalized title key
+    """
+    return " ".join(str(title).split()).casefold()
+
+
+def _plain_table(table: Mapping) -> Dict[str, Any]:
+    """Copy a table, materializing columnar rows as a plain list of row dicts."""
+    table_copy = dict(table)
+    if "rows" in table_copy:
+        table_copy["rows"] = plain_rows(table_copy["rows"])
+    return table_copy
+
+
+def _plain_page(page: Mapping) -> Dict[str, Any]:
+    """Copy a page, materializing the rows of its tables as plain lists."""
+    page_copy = dict(page)
+    if "tables" in page_copy:
+        page_copy["tables"] = [_plain_table(table) for table in page_copy["tables"]]
+    return page_copy
+
+
+def _read_document(data_path: str, streaming: bool = False,
+                   cache: Optional[DocumentCache] = None) -> Tuple[Dict[str, Any], float]:
+    """
+    Parse a final_output.json file into document data.
+    
+    Module-level so that it can run in a worker process for parallel
+    ingestion; the result is merged into a Silo by the caller.
+    
+    Args:
+        data_path: Path to the final_output.json file, a pipeline .zip
+                   archive holding one, or a member path inside an archive
+        streaming: Parse incrementally and keep only page headers resident
+        cache: Header cache to record full parses in (streaming reads bypass it)
+        
+    Returns:
+        Tuple of (document data, seconds spent parsing)
+    """
+    started = time.perf_counter()
+    data_path = resolve_source(data_path)
+    if streaming:
+        data, pages = stream_final_output(data_path)
+        data["pages"] = pages
+    elif cache is not None:
+        data = cache.load(data_path)
+    else:
+        with open_source(data_path) as f:
+            data = json.load(f)
+    return data, time.perf_counter() - started
+
+
+def _read_document_in_worker(data_path: str, streaming: bool) -> Tuple[Optional[Dict[str, Any]], float, Optional[str]]:
+    """
+    Worker-process wrapper around _read_document() that never raises.
+    
+    Returns:
+        Tuple of (document data or None, seconds spent, error message or None)
+    """
+    started = time.perf_counter()
+    try:
+        data, seconds = _read_document(data_path, streaming)
+        return data, seconds, None
+    except Exception as e:
+        return None, time.perf_counter() - started, str(e)
+
+
+def _reread_document(data_path: str, streaming: bool, cache: Optional[DocumentCache] = None) -> Dict[str, Any]:
+    """Re-read a final_output.json document (source for evicted documents)."""
+    return _read_document(data_path, streaming, cache)[0]
+
+
+def _detach_document(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the containers that document preparation modifies.
+    
+    The document, its pages list, page dicts, tables lists and table dicts
+    are copied; everything else (rows, text, metadata) is shared with the
+    source, which stays as it was read.
+    """
+    detached = dict(data)
+    if isinstance(detached.get("pages"), list):
+        pages = []
+        for page in detached["pages"]:
+            if isinstance(page, dict):
+                page = dict(page)
+                if isinstance(page.get("tables"), list):
+                    page["tables"] = [dict(table) if isinstance(table, dict) else table for table in page["tables"]]
+            pages.append(page)
+        detached["pages"] = pages
+    return detached
+
+
+def _read_page_directory(dataset_dir: str, manifest_path: Optional[str]) -> Dict[str, Any]:
+    """Read a document from per-page stage files (see Silo.load_page_directory)."""
+    data, pages = scan_page_directory(dataset_dir, manifest_path)
+    data["pages"] = pages
+    return data
+
+
+def _read_snapshot_document(snapshot: Snapshot, doc_id: str) -> Dict[str, Any]:
+    """Rebuild one document from an open snapshot."""
+    for snapshot_doc_id, data in snapshot.documents():
+        if snapshot_doc_id == doc_id:
+            return data
+    raise KeyError(f"Document {doc_id} not found in snapshot {snapshot.path}")
+
+
 class Silo:
     """
     Base data storage for PB&J pipeline outputs.
@@ -76,20 +356,120 @@ class Silo:
         documents: Dictionary mapping document IDs to their data
         document_info: Dictionary mapping document IDs to DocumentInfo objects
         loaded_at: Dictionary mapping document IDs to load timestamps
+        load_timings: Dictionary mapping document IDs to seconds spent parsing
+                      on the most recent load attempt (successful or not)
+        version: Monotonic counter incremented on every document change
+        columnar: Whether tables are converted to columnar storage on load
+        intern_strings: Whether keys and short strings are pooled across documents
+        intern_savings: Dictionary mapping document IDs to bytes released by interning
+        memory_budget: Byte budget for resident document bodies (None = unlimited)
+        residency: Hit, miss and eviction counters for document body accesses
+        compression: Codec used for page raw_content ("zlib", "lzma" or None)
+        decompressed_cache: LRU of recently decompressed page texts
+        document_cache: Cache of document headers shared with dataset discovery
+    
+    Lookups by page ID, table ID and table title are served from hash indexes
+    that are built in load_document() and maintained by remove_document()
+    and clear(), so they cost O(1) regardless of how many documents are loaded.
+    
+    Every document change bumps `version` and is published as a SiloEvent to
+    listeners registered with subscribe(), so tools holding derived caches can
+    update just the affected document. Replacing a document under an existing
+    ID publishes a removal followed by an addition; reload_document() instead
+    keeps unchanged pages in place and publishes a single DOCUMENT_CHANGED
+    event carrying a DocumentDiff.
+    
+    With `columnar` enabled, each rectangular table is stored as one typed
+    column per name (see src.columnar) and its 'rows' become a lazy
+    RowSequence of row dictionaries. The copying accessors (get_all_tables(),
+    get_table_by_id(), ...) still return plain row lists; pass as_view=True
+    to the lookups, or use iter_tables(), to work on the columns directly.
+    
+    With `intern_strings` enabled, every dictionary key and short string
+    value is replaced by one pooled instance shared by all documents, so a
+    column name or category repeated across rows and documents is stored
+    once. Bytes released are tracked per document in `intern_savings`.
+    Removing or reloading a document prunes the strings no document uses
+    any more from the pool.
+    
+    With a `memory_budget`, the silo tracks when each document body was last
+    accessed and evicts the least recently used bodies once the resident
+    total (estimated when each document is loaded, plus every lazy page
+    body when it is read in) exceeds the budget.
+    DocumentInfo and the lookup indexes stay resident, and an evicted body
+    is re-read from its source on next access without publishing events.
+    `documents` only holds resident bodies; use get_document_ids() for the
+    full list.
+    
+    With `compression` set, each page's raw_content is kept compressed and
+    pages are stored as CompressedPage mappings that decompress it on
+    access; recently read texts stay in `decompressed_cache`, bounded to
+    `decompressed_cache_bytes`.
+    
+    Full parses of final_output.json record the file's header fields in
+    `document_cache`, by default one cache for the whole process, so dataset
+    discovery does not read a file the silo already parsed. Only headers are
+    cached; the parsed pages are owned by the silo alone.
     """
     
-    def __init__(self):
+    def __init__(self, columnar: bool = True, intern_strings: bool = True,
+                 memory_budget: Optional[int] = None,
+                 compression: Optional[str] = None,
+                 decompressed_cache_bytes: int = DEFAULT_CACHE_BYTES,
+                 document_cache: Optional[DocumentCache] = None):
         """
         Initialize an empty silo.
         
         Creates a new Silo instance with no loaded documents.
         Documents can be added using load_document() or load_documents().
+        
+        Args:
+            columnar: Store tables column by column instead of as row dicts
+            intern_strings: Deduplicate keys and repeated strings across documents
+            memory_budget: Evict least recently used document bodies above this
+                           many bytes (None keeps every document resident)
+            compression: Compress page raw_content with "zlib" or "lzma" (None = off)
+            decompressed_cache_bytes: Size bound of the decompressed-text LRU
+            document_cache: Cache of final_output.json headers
+                            (default: the process-wide shared_document_cache())
+            
+        Raises:
+            ValueError: If the compression codec is not supported
         """
+        if compression is not None and compression not in CODECS:
+            raise ValueError(f"Unsupported compression {compression!r}; expected one of {sorted(CODECS)}")
+        self.columnar = columnar
+        self.memory_budget = memory_budget
+        self.residency: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        self.compression = compression
+        self.decompressed_cache = DecompressedCache(decompressed_cache_bytes)
+        self.document_cache = document_cache if document_cache is not None else shared_document_cache()
+        self.intern_strings = intern_strings
+        self.intern_savings: Dict[str, int] = {}  # {doc_id: bytes released}
+        self._string_pool = StringPool()
         self.documents: Dict[str, Dict[str, Any]] = {}  # {doc_id: data}
         self.document_info: Dict[str, DocumentInfo] = {}  # {doc_id: info}
         self.loaded_at: Dict[str, datetime] = {}  # {doc_id: loaded_at}
+        self.load_timings: Dict[str, float] = {}  # {doc_id: parse seconds}
+        self.version: int = 0
+        self._listeners: List[Callable[[SiloEvent], None]] = []
+        self._caches: Dict[str, Callable[[], Any]] = {}  # {cache name: getter}
+        
+        # Residency tracking for memory-budgeted eviction
+        self._sources: Dict[str, Callable[[], Dict[str, Any]]] = {}  # {doc_id: reader}
+        self._lru: "OrderedDict[str, None]" = OrderedDict()  # resident doc_ids, least recent first
+        self._resident_bytes: Dict[str, int] = {}  # {doc_id: estimated bytes}
+        self._body_bytes: Dict[str, Dict[int, int]] = {}  # {doc_id: {id(lazy page): bytes of its loaded body}}
+        self._evicted: Dict[str, List[Dict[str, Any]]] = {}  # {doc_id: page/table header skeleton}
+        self._page_digests: Dict[str, List[Optional[str]]] = {}  # {doc_id: content digest per page}
+        
+        # Lookup indexes, each keyed first by the lookup value and then by doc_id
+        # so that cross-document lookups keep document load order
+        self._page_index: Dict[str, Dict[str, int]] = {}  # {page_id: {doc_id: page_pos}}
+        self._table_index: Dict[str, Dict[str, Tuple[int, int]]] = {}  # {table_id: {doc_id: (page_pos, table_pos)}}
+        self._title_index: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}  # {normalized_title: {doc_id: [(page_pos, table_pos)]}}
     
-    def load_document(self, doc_id: str, data_path: str) -> bool:
+    def load_document(self, doc_id: str, data_path: str, streaming: bool = False) -> bool:
         """
         Load a single document from a file path.
         
@@ -97,9 +477,21 @@ class Silo:
         with the specified document ID. Automatically extracts metadata and
         creates a DocumentInfo object for the loaded document.
         
+        With streaming=True the file is parsed one page at a time and only
+        page headers (page_id, title, summary, keywords, table IDs and titles)
+        stay resident; page bodies and table rows are read back from the file
+        on first access. Peak memory during load is then bounded by the
+        largest page instead of the whole document.
+        
+        The path may also be a pipeline .zip archive (its final_output.json
+        is found automatically) or a member inside one, such as
+        "data/run.zip/run/final_output.json"; the member is streamed from
+        the archive without extracting it.
+        
         Args:
             doc_id: Unique identifier for the document (used for disambiguation)
-            data_path: Path to the final_output.json file to load
+            data_path: Path to the final_output.json file (or .zip archive) to load
+            streaming: Parse incrementally and load page bodies lazily
             
         Returns:
             True if document loaded successfully, False if loading failed
@@ -113,44 +505,126 @@ class Silo:
             success = silo.load_document("pbj_2024_01", "data/pbj_2024_01/final_output.json")
             if success:
                 print("Document loaded successfully")
+            
+            # Large manuals: keep only page headers resident
+            silo.load_document("manual", "data/manual/final_output.json", streaming=True)
         """
+        started = time.perf_counter()
         try:
-            with open(data_path, 'r') as f:
-                data = json.load(f)
-            
-            self.documents[doc_id] = data
-            self.loaded_at[doc_id] = datetime.now()
-            
-            # Create document info
-            page_count = len(data.get("pages", []))
-            table_count = sum(len(page.get("tables", [])) for page in data.get("pages", []))
-            keywords = data.get("document_summary", {}).get("combined_keywords", [])
-            
-            self.document_info[doc_id] = DocumentInfo(
-                doc_id=doc_id,
-                title=data.get("document_info", {}).get("title", f"Document {doc_id}"),
-                loaded_at=self.loaded_at[doc_id],
-                page_count=page_count,
-                table_count=table_count,
-                keywords=keywords
-            )
+            data, seconds = _read_document(data_path, streaming, self.document_cache)
+            self._store_document(doc_id, data, partial(_reread_document, data_path, streaming, self.document_cache))
+            self.load_timings[doc_id] = seconds
+            return True
+            
+        except Exception as e:
+            self.load_timings[doc_id] = time.perf_counter() - started
+            print(f"Error loading document {doc_id}: {e}")
+            return False
+    
+    def load_page_directory(self, doc_id: str, dataset_dir: str, manifest_path: Optional[str] = None) -> bool:
+        """
+        Load a document from its per-page 03_cleaned_json stage files.
+        
+        Instead of parsing final_output.json, lists the dataset's
+        03_cleaned_json/page_N.json files and builds page headers from a
+        cached manifest keyed by file name, size and mtime. A page file is
+        only opened when a tool touches that page (or once, when it is new
+        or changed and its manifest entry has to be recorded), so startup
+        for an unchanged dataset costs a directory listing.
+        
+        Stage files store tables as column arrays; they are converted to the
+        same row dictionaries final_output.json uses when a page is read.
+        The dataset may also be a pipeline .zip archive, read in place.
+        
+        Args:
+            doc_id: Unique identifier for the document (used for disambiguation)
+            dataset_dir: Dataset directory (or .zip archive) containing 03_cleaned_json/
+            manifest_path: Where to cache the manifest
+                          (default: <dataset_dir>/page_manifest.json)
             
+        Returns:
+            True if document loaded successfully, False if loading failed
+            
+        Example:
+            silo.load_page_directory("manual", "data/Hip_TRTIIH_SP_2_20250703_121853")
+            page = silo.get_page_by_id("page_12", "manual")  # reads page_12.json only
+        """
+        try:
+            source = partial(_read_page_directory, dataset_dir, manifest_path)
+            self._store_document(doc_id, source(), source)
             return True
             
         except Exception as e:
             print(f"Error loading document {doc_id}: {e}")
             return False
     
-    def load_documents(self, doc_mappings: Dict[str, str]) -> Dict[str, bool]:
+    def save_snapshot(self, path: str):
+        """
+        Write all loaded documents to a binary snapshot file.
+        
+        The snapshot stores a shared string table, the offsets of every
+        page and table, and table rows column by column. Lazily loaded pages
+        are read in full while writing.
+        
+        Args:
+            path: Destination file path
+            
+        Example:
+            silo.save_snapshot("data/corpus.silo")
+        """
+        write_snapshot(path, ((doc_id, self._document(doc_id)) for doc_id in self.get_document_ids()))
+    
+    def open_snapshot(self, path: str) -> bool:
+        """
+        Load all documents from a snapshot written by save_snapshot().
+        
+        The file is memory-mapped, so worker processes opening the same
+        snapshot share one copy of it in the OS page cache. Only the
+        snapshot's directory is decoded up front; page bodies are rebuilt
+        from the mapped columns on first access. Documents already loaded
+        under the same IDs are replaced.
+        
+        Args:
+            path: Path to the snapshot file
+            
+        Returns:
+            True if the snapshot was opened successfully, False otherwise
+            
+        Example:
+            silo = Silo()
+            if silo.open_snapshot("data/corpus.silo"):
+                print(silo.get_document_ids())
+        """
+        try:
+            snapshot = Snapshot(path)
+            for doc_id, data in snapshot.documents():
+                self._store_document(doc_id, data, partial(_read_snapshot_document, snapshot, doc_id))
+            return True
+            
+        except Exception as e:
+            print(f"Error opening snapshot {path}: {e}")
+            return False
+    
+    def load_documents(self,
+                       doc_mappings: Dict[str, str],
+                       streaming: bool = False,
+                       workers: int = 1) -> Dict[str, bool]:
         """
         Load multiple documents at once.
         
         Convenience method to load multiple documents in a single call.
         Each document is loaded with its own document ID and file path.
         
+        With workers > 1, files are parsed in a process pool and the parsed
+        documents are merged into the silo in mapping order, so indexes and
+        document order are the same as for a serial load. Parse time for
+        each file is recorded in load_timings either way.
+        
         Args:
             doc_mappings: Dictionary mapping document IDs to file paths
                          Format: {doc_id: data_path}
+            streaming: Parse incrementally and load page bodies lazily
+            workers: Number of worker processes used for parsing (1 = serial)
             
         Returns:
             Dictionary mapping document IDs to success status
@@ -161,14 +635,191 @@ class Silo:
                 "doc1": "data/doc1/final_output.json",
                 "doc2": "data/doc2/final_output.json"
             }
-            results = silo.load_documents(mappings)
+            results = silo.load_documents(mappings, workers=4)
             # results = {"doc1": True, "doc2": False}
+            # silo.load_timings = {"doc1": 0.012, "doc2": 0.001}
         """
+        if workers <= 1 or len(doc_mappings) <= 1:
+            results = {}
+            for doc_id, data_path in doc_mappings.items():
+                results[doc_id] = self.load_document(doc_id, data_path, streaming=streaming)
+            return results
+        
         results = {}
-        for doc_id, data_path in doc_mappings.items():
-            results[doc_id] = self.load_document(doc_id, data_path)
+        with ProcessPoolExecutor(max_workers=min(workers, len(doc_mappings))) as pool:
+            futures = {
+                doc_id: pool.submit(_read_document_in_worker, data_path, streaming)
+                for doc_id, data_path in doc_mappings.items()
+            }
+            for doc_id, future in futures.items():
+                try:
+                    data, seconds, error = future.result()
+                    if error is None:
+                        self._store_document(doc_id, data, partial(_reread_document, doc_mappings[doc_id],
+                                                                   streaming, self.document_cache))
+                    self.load_timings[doc_id] = seconds
+                except Exception as e:
+                    error = str(e)
+                
+                if error is not None:
+                    print(f"Error loading document {doc_id}: {error}")
+                results[doc_id] = error is None
         return results
     
+    def reload_document(self, doc_id: str) -> Optional[DocumentDiff]:
+        """
+        Re-read a document from its source and swap in only what changed.
+        
+        Every page is compared by a content digest of all its fields
+        (raw_content, tables, processing_metadata, ...). Unchanged pages keep
+        their stored objects, so loaded bodies, columnar tables and views
+        held by tools stay valid; only new and changed pages are interned,
+        converted and compressed. Listeners receive one DOCUMENT_CHANGED
+        event carrying the diff, or none if nothing changed.
+        
+        Use this instead of remove_document() + load_document() when the
+        PB&J pipeline re-processes a document in place. A document opened
+        from a snapshot is re-read from that same snapshot file, so its
+        diff is always empty; load the re-processed JSON with
+        load_document() instead.
+        
+        Args:
+            doc_id: Loaded document to reload
+        
+        Returns:
+            DocumentDiff describing the changes, or None if the document is
+            not loaded or could not be re-read
+        
+        Example:
+            diff = silo.reload_document("doc1")
+            if diff and diff.has_changes:
+                print(f"Changed pages: {diff.changed_pages}")
+        """
+        source = self._sources.get(doc_id)
+        if doc_id not in self.document_info or source is None:
+            return None
+        try:
+            data = source()
+        except Exception as e:
+            print(f"Error reloading document {doc_id}: {e}")
+            return None
+        
+        old = self.documents.get(doc_id)
+        if old is None:
+            # Evicted: only the page/table IDs are known, so every page counts as changed
+            old = {"pages": self._evicted[doc_id]}
+            old_digests: List[Optional[str]] = [None] * len(old["pages"])
+            fields_changed = True
+        else:
+            old_digests = self._page_digests.get(doc_id) or [self._page_digest(page) for page in old.get("pages", [])]
+            fields_changed = (content_digest({key: value for key, value in old.items() if key != "pages"})
+                              != content_digest({key: value for key, value in data.items() if key != "pages"}))
+        old_pages = old.get("pages", [])
+        new_pages = data.get("pages", [])
+        new_digests = [self._page_digest(page) for page in new_pages]
+        
+        # Match pages by page_id (and occurrence, should an ID repeat)
+        old_positions = dict(zip(self._page_keys(old_pages), range(len(old_pages))))
+        diff = DocumentDiff(doc_id=doc_id, fields_changed=fields_changed)
+        pages: List[Any] = []
+        fresh: List[Any] = []
+        fresh_positions: List[int] = []
+        for page_pos, key in enumerate(self._page_keys(new_pages)):
+            page = new_pages[page_pos]
+            old_pos = old_positions.pop(key, None)
+            if old_pos is None:
+                diff.added_pages.append(page["page_id"])
+                diff.added_tables.extend((page["page_id"], table_id) for table_id, _ in page_table_headers(page))
+            elif new_digests[page_pos] is not None and new_digests[page_pos] == old_digests[old_pos]:
+                diff.unchanged_pages += 1
+                kept = old_pages[old_pos]
+                if isinstance(kept, LazyPage) and isinstance(page, LazyPage):
+                    # The source was rewritten, so read the kept body from its new location
+                    kept.rebind(page)
+                pages.append(kept)
+                continue
+            else:
+                diff.changed_pages.append(page["page_id"])
+                self._diff_tables(diff, old_pages[old_pos], page)
+            pages.append(None)
+            fresh.append(page)
+            fresh_positions.append(page_pos)
+        for old_pos in sorted(old_positions.values()):
+            page = old_pages[old_pos]
+            diff.removed_pages.append(page["page_id"])
+            diff.removed_tables.extend((page["page_id"], table_id) for table_id, _ in page_table_headers(page))
+        
+        if not diff.has_changes:
+            self._page_digests[doc_id] = new_digests
+            return diff
+        
+        # Prepare only the new and changed pages, then slot them in
+        savings = self.intern_savings.get(doc_id, 0)
+        prepared = self._prepare_document(doc_id, {**data, "pages": fresh})
+        if self.intern_strings:
+            self.intern_savings[doc_id] += savings
+        for page_pos, page in zip(fresh_positions, prepared["pages"]):
+            pages[page_pos] = page
+        prepared["pages"] = pages
+        
+        self._unindex_document(doc_id, old)
+        self._evicted.pop(doc_id, None)
+        self.documents[doc_id] = prepared
+        self._page_digests[doc_id] = new_digests
+        self._index_document(doc_id, prepared)
+        self.loaded_at[doc_id] = datetime.now()
+        self.document_info[doc_id] = self._build_document_info(doc_id, prepared)
+        self._publish(DOCUMENT_CHANGED, doc_id, diff)
+        self._track_resident(doc_id, prepared)
+        
+        # Free strings only the old version used (this frame's references go first)
+        old = old_pages = page = None
+        self._string_pool.prune()
+        return diff
+    
+    def subscribe(self, listener: Callable[[SiloEvent], None]):
+        """
+        Register a listener for document added/removed/changed events.
+        
+        Listeners are called synchronously after the silo has been updated,
+        in registration order. They should only record the change and defer
+        any expensive work (such as reading page bodies) until needed.
+        
+        Args:
+            listener: Callable receiving a SiloEvent
+            
+        Example:
+            silo.subscribe(lambda event: print(event.kind, event.doc_id))
+        """
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[SiloEvent], None]):
+        """
+        Remove a previously registered listener.
+        
+        Args:
+            listener: Listener passed to subscribe()
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def register_cache(self, name: str, getter: Callable[[], Any]):
+        """
+        Register a derived cache to be included in memory_report().
+        
+        Tools that keep caches built from silo data register them here so
+        their footprint is reported next to the documents they came from.
+        Registering an existing name replaces the previous getter.
+        
+        Args:
+            name: Name of the cache in the report
+            getter: Callable returning the cache object(s) to measure
+            
+        Example:
+            silo.register_cache("my_tool", lambda: self._cache)
+        """
+        self._caches[name] = getter
+    
     def is_loaded(self) -> bool:
         """
         Check if at least one document is loaded.
@@ -182,7 +833,7 @@ class Silo:
             else:
                 print("Silo is empty - load some documents first")
         """
-        return bool(self.documents)
+        return bool(self.document_info)
     
     def get_document_ids(self) -> List[str]:
         """
@@ -195,7 +846,7 @@ class Silo:
             doc_ids = silo.get_document_ids()
             print(f"Loaded documents: {doc_ids}")
         """
-        return list(self.documents.keys())
+        return list(self.document_info.keys())
     
     def get_document_info(self, doc_id: Optional[str] = None) -> Union[DocumentInfo, Dict[str, DocumentInfo], None]:
         """
@@ -241,9 +892,12 @@ class Silo:
                 print(f"Page {page['page_id']} from document {page['doc_id']}")
         """
         all_pages = []
-        for doc_id, data in self.documents.items():
+        for doc_id in self.get_document_ids():
+            data = self._document(doc_id)
+            if not data:
+                continue
             for page in data.get("pages", []):
-                page_copy = dict(page)
+                page_copy = _plain_page(page)
                 page_copy["doc_id"] = doc_id
                 all_pages.append(page_copy)
         return all_pages
@@ -264,10 +918,13 @@ class Silo:
                 print(f"Table {table['table_id']} from page {table['page_id']} in doc {table['doc_id']}")
         """
         all_tables = []
-        for doc_id, data in self.documents.items():
+        for doc_id in self.get_document_ids():
+            data = self._document(doc_id)
+            if not data:
+                continue
             for page in data.get("pages", []):
                 for table in page.get("tables", []):
-                    table_copy = dict(table)
+                    table_copy = _plain_table(table)
                     table_copy["doc_id"] = doc_id
                     table_copy["page_id"] = page["page_id"]
                     all_tables.append(table_copy)
@@ -287,13 +944,13 @@ class Silo:
             pages = silo.get_pages_by_document("doc1")
             print(f"Document doc1 has {len(pages)} pages")
         """
-        data = self.documents.get(doc_id)
+        data = self._document(doc_id)
         if not data:
             return []
         
         pages = []
         for page in data.get("pages", []):
-            page_copy = dict(page)
+            page_copy = _plain_page(page)
             page_copy["doc_id"] = doc_id
             pages.append(page_copy)
         return pages
@@ -312,20 +969,85 @@ class Silo:
             tables = silo.get_tables_by_document("doc1")
             print(f"Document doc1 has {len(tables)} tables")
         """
-        data = self.documents.get(doc_id)
+        data = self._document(doc_id)
         if not data:
             return []
         
         tables = []
         for page in data.get("pages", []):
             for table in page.get("tables", []):
-                table_copy = dict(table)
+                table_copy = _plain_table(table)
                 table_copy["doc_id"] = doc_id
                 table_copy["page_id"] = page["page_id"]
                 tables.append(table_copy)
         return tables
     
-    def get_page_by_id(self, page_id: str, doc_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def iter_pages(self, doc_id: Optional[str] = None, release_bodies: bool = False) -> Iterator[PageView]:
+        """
+        Lazily iterate pages as read-only views.
+        
+        Unlike get_all_pages(), no page is copied and no list is built, so
+        iterating the corpus allocates nothing proportional to its size.
+        
+        With release_bodies=True, a lazy page body that was read in while
+        its view was being processed is dropped again as soon as the caller
+        moves on to the next page, so a pass over a streamed, page-directory
+        or snapshot document keeps at most one such body resident. Views
+        must then not be used after the iteration has moved past them.
+        
+        Args:
+            doc_id: Restrict iteration to this document, or None for all documents
+            release_bodies: Release lazy page bodies loaded during the iteration
+            
+        Yields:
+            PageView objects exposing the page fields plus 'doc_id'
+            
+        Example:
+            for page in silo.iter_pages():
+                print(f"Page {page['page_id']} from document {page['doc_id']}")
+            
+            # Index a streamed document without keeping its bodies
+            for page in silo.iter_pages("manual", release_bodies=True):
+                index(page["raw_content"])
+        """
+        doc_ids = [doc_id] if doc_id else self.get_document_ids()
+        for d_id in doc_ids:
+            data = self._document(d_id)
+            if not data:
+                continue
+            for page in data.get("pages", []):
+                release = release_bodies and isinstance(page, LazyPage) and not page.is_loaded
+                yield PageView(page, d_id)
+                if release and page.is_loaded:
+                    self._release_body(d_id, page)
+    
+    def iter_tables(self, doc_id: Optional[str] = None) -> Iterator[TableView]:
+        """
+        Lazily iterate tables as read-only views.
+        
+        Unlike get_all_tables(), no table is copied and no list is built.
+        
+        Args:
+            doc_id: Restrict iteration to this document, or None for all documents
+            
+        Yields:
+            TableView objects exposing the table fields plus 'doc_id' and 'page_id'
+            
+        Example:
+            for table in silo.iter_tables("doc1"):
+                print(f"{table['title']} on {table['page_id']}")
+        """
+        doc_ids = [doc_id] if doc_id else self.get_document_ids()
+        for d_id in doc_ids:
+            data = self._document(d_id)
+            if not data:
+                continue
+            for page in data.get("pages", []):
+                for table in page.get("tables", []):
+                    yield TableView(table, d_id, page["page_id"])
+    
+    def get_page_by_id(self, page_id: str, doc_id: Optional[str] = None,
+                       as_view: bool = False) -> Optional[Mapping]:
         """
         Get a specific page by ID.
         
@@ -335,6 +1057,7 @@ class Silo:
         Args:
             page_id: Page identifier (e.g., "page_1", "page_2")
             doc_id: Optional document ID for disambiguation
+            as_view: Return a read-only PageView instead of a copy
             
         Returns:
             Page data with doc_id added, or None if not found
@@ -346,22 +1069,29 @@ class Silo:
             # Search across all documents
             page = silo.get_page_by_id("page_1")
         """
-        docs = [doc_id] if doc_id else self.documents.keys()
+        locations = self._page_index.get(page_id)
+        if not locations:
+            return None
         
-        for d_id in docs:
-            data = self.documents.get(d_id)
-            if not data:
-                continue
-                
-            for page in data.get("pages", []):
-                if page["page_id"] == page_id:
-                    page_copy = dict(page)
-                    page_copy["doc_id"] = d_id
-                    return page_copy
+        if doc_id:
+            if doc_id not in locations:
+                return None
+            d_id, page_pos = doc_id, locations[doc_id]
+        else:
+            d_id, page_pos = next(iter(locations.items()))
         
-        return None
+        data = self._document(d_id)
+        if not data:
+            return None
+        page = data["pages"][page_pos]
+        if as_view:
+            return PageView(page, d_id)
+        page_copy = _plain_page(page)
+        page_copy["doc_id"] = d_id
+        return page_copy
     
-    def get_table_by_id(self, table_id: str, doc_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def get_table_by_id(self, table_id: str, doc_id: Optional[str] = None,
+                        as_view: bool = False) -> Optional[Mapping]:
         """
         Get a specific table by ID.
         
@@ -371,6 +1101,7 @@ class Silo:
         Args:
             table_id: Table identifier (e.g., "table_1", "table_2")
             doc_id: Optional document ID for disambiguation
+            as_view: Return a read-only TableView instead of a copy
             
         Returns:
             Table data with doc_id and page_id added, or None if not found
@@ -382,33 +1113,35 @@ class Silo:
             # Search across all documents
             table = silo.get_table_by_id("table_1")
         """
-        docs = [doc_id] if doc_id else self.documents.keys()
+        locations = self._table_index.get(table_id)
+        if not locations:
+            return None
         
-        for d_id in docs:
-            data = self.documents.get(d_id)
-            if not data:
-                continue
-                
-            for page in data.get("pages", []):
-                for table in page.get("tables", []):
-                    if table["table_id"] == table_id:
-                        table_copy = dict(table)
-                        table_copy["doc_id"] = d_id
-                        table_copy["page_id"] = page["page_id"]
-                        return table_copy
+        if doc_id:
+            if doc_id not in locations:
+                return None
+            d_id, (page_pos, table_pos) = doc_id, locations[doc_id]
+        else:
+            d_id, (page_pos, table_pos) = next(iter(locations.items()))
         
-        return None
+        return self._table_at(d_id, page_pos, table_pos, as_view)
     
-    def get_table_by_title(self, title: str, doc_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def get_table_by_title(self, title: str, doc_id: Optional[str] = None,
+                           as_view: bool = False) -> Optional[Mapping]:
         """
         Get a specific table by title.
         
         If doc_id is provided, searches only in that document.
         If doc_id is None, searches across all loaded documents.
         
+        Titles are matched case-insensitively with whitespace collapsed;
+        an exact title match is preferred when several tables normalize
+        to the same key.
+        
         Args:
             title: Table title to search for
             doc_id: Optional document ID for disambiguation
+            as_view: Return a read-only TableView instead of a copy
             
         Returns:
             Table data with doc_id and page_id added, or None if not found
@@ -420,22 +1153,25 @@ class Silo:
             # Search across all documents
             table = silo.get_table_by_title("B.L.T. Sandwich Preparation Measurements")
         """
-        docs = [doc_id] if doc_id else self.documents.keys()
+        locations = self._title_index.get(_normalize_title(title))
+        if not locations:
+            return None
         
-        for d_id in docs:
-            data = self.documents.get(d_id)
-            if not data:
-                continue
-                
-            for page in data.get("pages", []):
-                for table in page.get("tables", []):
-                    if table["title"] == title:
-                        table_copy = dict(table)
-                        table_copy["doc_id"] = d_id
-                        table_copy["page_id"] = page["page_id"]
-                        return table_copy
+        if doc_id:
+            candidates = [(doc_id, pos) for pos in locations.get(doc_id, [])]
+        else:
+            candidates = [(d_id, pos) for d_id, positions in locations.items() for pos in positions]
+        if not candidates:
+            return None
+        
+        # Prefer an exact title match, fall back to the first normalized match
+        for d_id, (page_pos, table_pos) in candidates:
+            data = self._document(d_id)
+            if data and page_table_headers(data["pages"][page_pos])[table_pos][1] == title:
+                return self._table_at(d_id, page_pos, table_pos, as_view)
         
-        return None
+        d_id, (page_pos, table_pos) = candidates[0]
+        return self._table_at(d_id, page_pos, table_pos, as_view)
     
     def get_all_keywords(self) -> List[str]:
         """
@@ -471,22 +1207,108 @@ class Silo:
         total_keywords = len(self.get_all_keywords())
         
         return {
-            "total_documents": len(self.documents),
+            "total_documents": len(self.document_info),
             "total_pages": total_pages,
             "total_tables": total_tables,
             "total_keywords": total_keywords,
+            "interned_strings": len(self._string_pool),
+            "intern_bytes_saved": sum(self.intern_savings.values()),
+            "residency": {
+                "memory_budget": self.memory_budget,
+                "resident_documents": len(self.documents),
+                "evicted_documents": len(self._evicted),
+                "resident_bytes": sum(self._resident_bytes.values()),
+                **self.residency
+            },
+            "compression": {"codec": self.compression, **self.decompressed_cache.stats()},
+            "document_cache": self.document_cache.stats(),
             "documents": {
                 doc_id: {
                     "title": info.title,
                     "page_count": info.page_count,
                     "table_count": info.table_count,
                     "keyword_count": len(info.keywords),
-                    "loaded_at": info.loaded_at.isoformat()
+                    "loaded_at": info.loaded_at.isoformat(),
+                    "load_seconds": self.load_timings.get(doc_id),
+                    "intern_bytes_saved": self.intern_savings.get(doc_id, 0)
                 }
                 for doc_id, info in self.document_info.items()
             }
         }
     
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Break down the memory retained by loaded documents and tool caches.
+        
+        Sizes are retained bytes (see src.memory.deep_sizeof). An object
+        shared between owners is charged once, to the first owner measured:
+        documents in load order, then the lookup indexes, string pool,
+        decompressed-text cache and document header cache, then registered
+        caches, so a cache only reports what it adds on top of the silo
+        data. Lazy pages whose bodies are not resident count only their
+        headers, and evicted documents are left out; neither is loaded by
+        this method.
+        
+        Returns:
+            Dictionary with total, per-document, index and cache sizes in bytes
+            
+        Example:
+            report = silo.memory_report()
+            for doc_id, usage in report["documents"].items():
+                print(f"{doc_id}: {usage['total_bytes']} bytes")
+        """
+        # Compressed pages reference the shared decompressed-text cache; it is
+        # measured on its own line, not charged to the first document
+        seen = {id(self.decompressed_cache)}
+        documents = {}
+        for doc_id, data in self.documents.items():
+            raw_content_bytes = 0
+            table_row_bytes = 0
+            resident_pages = 0
+            for page in data.get("pages", []):
+                body = page.body if isinstance(page, LazyPage) else page
+                if body is None:
+                    continue
+                resident_pages += 1
+                if isinstance(body, CompressedPage):
+                    raw_content_bytes += deep_sizeof(body.stored("raw_content"), seen)
+                else:
+                    raw_content_bytes += deep_sizeof(body.get("raw_content"), seen)
+                for table in body.get("tables", []):
+                    table_row_bytes += deep_sizeof(table.get("rows"), seen)
+            other_bytes = deep_sizeof(data, seen) + deep_sizeof(self.document_info[doc_id], seen)
+            documents[doc_id] = {
+                "total_bytes": raw_content_bytes + table_row_bytes + other_bytes,
+                "raw_content_bytes": raw_content_bytes,
+                "table_row_bytes": table_row_bytes,
+                "other_bytes": other_bytes,
+                "page_count": len(data.get("pages", [])),
+                "resident_pages": resident_pages
+            }
+        
+        # Keep every measured root alive until the end, so no id in `seen` is reused
+        indexes = (self._page_index, self._table_index, self._title_index)
+        cache_objects = {name: getter() for name, getter in self._caches.items()}
+        index_bytes = deep_sizeof(indexes, seen)
+        string_pool_bytes = deep_sizeof(self._string_pool, seen)
+        seen.discard(id(self.decompressed_cache))
+        decompressed_cache_bytes = deep_sizeof(self.decompressed_cache, seen)
+        document_cache_bytes = deep_sizeof(self.document_cache, seen)
+        caches = {name: deep_sizeof(objects, seen) for name, objects in cache_objects.items()}
+        
+        document_bytes = sum(usage["total_bytes"] for usage in documents.values())
+        return {
+            "total_bytes": (document_bytes + index_bytes + string_pool_bytes + decompressed_cache_bytes
+                            + document_cache_bytes + sum(caches.values())),
+            "document_bytes": document_bytes,
+            "index_bytes": index_bytes,
+            "string_pool_bytes": string_pool_bytes,
+            "decompressed_cache_bytes": decompressed_cache_bytes,
+            "document_cache_bytes": document_cache_bytes,
+            "documents": documents,
+            "caches": caches
+        }
+    
     def clear(self):
         """
         Clear all loaded documents.
@@ -498,9 +1320,24 @@ class Silo:
             silo.clear()
             print("Silo is now empty")
         """
+        removed = self.get_document_ids()
         self.documents.clear()
+        self._sources.clear()
+        self._lru.clear()
+        self._resident_bytes.clear()
+        self._body_bytes.clear()
+        self._evicted.clear()
+        self._page_digests.clear()
         self.document_info.clear()
         self.loaded_at.clear()
+        self.load_timings.clear()
+        self.intern_savings.clear()
+        self._string_pool.clear()
+        self._page_index.clear()
+        self._table_index.clear()
+        self._title_index.clear()
+        for doc_id in removed:
+            self._publish(DOCUMENT_REMOVED, doc_id)
     
     def remove_document(self, doc_id: str) -> bool:
         """
@@ -518,10 +1355,432 @@ class Silo:
             else:
                 print("Document doc1 was not found")
         """
-        if doc_id in self.documents:
-            del self.documents[doc_id]
+        if doc_id in self.document_info:
+            if doc_id in self._evicted:
+                self._unindex_document(doc_id, {"pages": self._evicted.pop(doc_id)})
+            else:
+                self._unindex_document(doc_id, self.documents.pop(doc_id))
+            self._sources.pop(doc_id, None)
+            self._page_digests.pop(doc_id, None)
+            self._lru.pop(doc_id, None)
+            self._resident_bytes.pop(doc_id, None)
+            self._body_bytes.pop(doc_id, None)
             del self.document_info[doc_id]
             if doc_id in self.loaded_at:
                 del self.loaded_at[doc_id]
+            self.load_timings.pop(doc_id, None)
+            self.intern_savings.pop(doc_id, None)
+            self._string_pool.prune()
+            self._publish(DOCUMENT_REMOVED, doc_id)
             return True
-        return False 
\ No newline at end of file
+        return False 
+    
+    def _store_document(self, doc_id: str, data: Dict[str, Any],
+                        source: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Store parsed document data, index it and record its DocumentInfo.
+        
+        Args:
+            doc_id: Document identifier
+            data: Document data with 'pages' holding page dicts or LazyPages
+            source: Callable re-reading the document; without one the document
+                    is never evicted
+        """
+        # Replacing a document must not leave stale index entries behind
+        if doc_id in self.document_info:
+            self.remove_document(doc_id)
+        
+        data = self._prepare_document(doc_id, data)
+        self.documents[doc_id] = data
+        if source is not None:
+            self._sources[doc_id] = source
+        self._index_document(doc_id, data)
+        self.loaded_at[doc_id] = datetime.now()
+        self.document_info[doc_id] = self._build_document_info(doc_id, data)
+        self._publish(DOCUMENT_ADDED, doc_id)
+        self._track_resident(doc_id, data)
+    
+    def _build_document_info(self, doc_id: str, data: Dict[str, Any]) -> DocumentInfo:
+        """
+        Create a document's DocumentInfo from its page headers.
+        
+        Lazy pages stay unloaded.
+        
+        Args:
+            doc_id: Document identifier
+            data: Stored document data
+        
+        Returns:
+            DocumentInfo stamped with the document's loaded_at time
+        """
+        pages = data.get("pages", [])
+        page_count = len(pages)
+        table_count = sum(len(page_table_headers(page)) for page in pages)
+        keywords = data.get("document_summary", {}).get("combined_keywords", [])
+        
+        return DocumentInfo(
+            doc_id=doc_id,
+            title=data.get("document_info", {}).get("title", f"Document {doc_id}"),
+            loaded_at=self.loaded_at[doc_id],
+            page_count=page_count,
+            table_count=table_count,
+            keywords=keywords
+        )
+    
+    def _prepare_document(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply interning and columnar conversion to freshly read document data.
+        
+        Lazy pages are interned and converted whenever their body is (re)loaded.
+        The data passed in is not modified.
+        
+        Args:
+            doc_id: Document identifier
+            data: Document data as read from its source
+            
+        Returns:
+            Document data to keep resident
+        """
+        if self.intern_strings:
+            # Interning rebuilds every dict and list, so the source is left untouched
+            data, self.intern_savings[doc_id] = self._string_pool.intern_value(data)
+            for page in data.get("pages", []):
+                if not isinstance(page, dict):
+                    page.add_body_transform(partial(self._intern_page, doc_id))
+        else:
+            data = _detach_document(data)
+        
+        if self.columnar:
+            for page in data.get("pages", []):
+                if isinstance(page, dict):
+                    columnarize_page(page)
+                else:
+                    page.add_body_transform(columnarize_page)
+        
+        if self.compression:
+            compress = partial(CompressedPage, codec=self.compression, cache=self.decompressed_cache)
+            pages = data.get("pages", [])
+            for page_pos, page in enumerate(pages):
+                if isinstance(page, dict):
+                    pages[page_pos] = compress(page)
+                else:
+                    page.add_body_transform(compress)
+        
+        if self.memory_budget is not None:
+            # Runs last, so the body is measured as it is kept resident
+            for page in data.get("pages", []):
+                if isinstance(page, LazyPage):
+                    page.add_body_transform(partial(self._charge_body, doc_id, page))
+        return data
+    
+    def _document(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a document body for an accessor, reloading it if it was evicted.
+        
+        Every call counts as a residency hit or miss and marks the document
+        as most recently used.
+        
+        Args:
+            doc_id: Document identifier
+            
+        Returns:
+            Document data, or None if the document is unknown or its source
+            could not be re-read
+        """
+        data = self.documents.get(doc_id)
+        if data is not None:
+            self.residency["hits"] += 1
+            self._lru.move_to_end(doc_id)
+            return data
+        if doc_id not in self._evicted:
+            return None
+        
+        self.residency["misses"] += 1
+        try:
+            data = self._sources[doc_id]()
+        except Exception as e:
+            print(f"Error reloading document {doc_id}: {e}")
+            return None
+        
+        if self._page_skeleton(data) != self._evicted[doc_id]:
+            # The source changed since it was loaded: replace it like a fresh load
+            self._store_document(doc_id, data, self._sources[doc_id])
+            return self.documents.get(doc_id)
+        
+        del self._evicted[doc_id]
+        data = self._prepare_document(doc_id, data)
+        self.documents[doc_id] = data
+        self._track_resident(doc_id, data)
+        return data
+    
+    def _track_resident(self, doc_id: str, data: Dict[str, Any]):
+        """
+        Record a resident document body and evict others if over budget.
+        
+        Args:
+            doc_id: Document that just became resident (never evicted here)
+            data: Its document data
+        """
+        self._lru[doc_id] = None
+        self._lru.move_to_end(doc_id)
+        if self.memory_budget is None:
+            return
+        
+        # Bodies already loaded are part of this measurement
+        self._resident_bytes[doc_id] = self._owned_sizeof(data)
+        self._body_bytes[doc_id] = {}
+        self._enforce_budget(doc_id)
+    
+    def _owned_sizeof(self, obj: Any) -> int:
+        """Get the bytes an object retains, leaving out the shared decompressed-text cache."""
+        return deep_sizeof(obj, {id(self.decompressed_cache)})
+    
+    def _charge_body(self, doc_id: str, page: LazyPage, body: Mapping) -> Mapping:
+        """
+        Add a lazily loaded page body to its document's resident size.
+        
+        Installed as the last body transform of each lazy page when a
+        memory budget is set, so bodies read after the document was
+        measured count towards the budget too.
+        
+        Args:
+            doc_id: Document the page belongs to
+            page: The LazyPage being loaded
+            body: Its freshly loaded (and transformed) body
+            
+        Returns:
+            The body, unchanged
+        """
+        charges = self._body_bytes.get(doc_id)
+        if charges is not None and doc_id in self.documents:
+            size = self._owned_sizeof(body)
+            self._resident_bytes[doc_id] += size - charges.get(id(page), 0)
+            charges[id(page)] = size
+            self._enforce_budget(doc_id)
+        return body
+    
+    def _release_body(self, doc_id: str, page: LazyPage):
+        """
+        Drop a lazy page's body and its charge against the memory budget.
+        
+        Args:
+            doc_id: Document the page belongs to
+            page: LazyPage whose body is resident
+        """
+        page.release()
+        charges = self._body_bytes.get(doc_id)
+        if charges is not None:
+            self._resident_bytes[doc_id] -= charges.pop(id(page), 0)
+    
+    def _enforce_budget(self, doc_id: str):
+        """
+        Evict least recently used document bodies until within the memory budget.
+        
+        Args:
+            doc_id: Document being accessed, which is never evicted here
+        """
+        while sum(self._resident_bytes.values()) > self.memory_budget:
+            victim = next((d_id for d_id in self._lru if d_id != doc_id and d_id in self._sources), None)
+            if victim is None:
+                break
+            self._evict(victim)
+    
+    def _evict(self, doc_id: str):
+        """
+        Drop a document body, keeping its DocumentInfo and index entries.
+        
+        Args:
+            doc_id: Resident document with a source to reload it from
+        """
+        data = self.documents.pop(doc_id)
+        self._evicted[doc_id] = self._page_skeleton(data)
+        self._lru.pop(doc_id, None)
+        self._resident_bytes.pop(doc_id, None)
+        self._body_bytes.pop(doc_id, None)
+        self.residency["evictions"] += 1
+    
+    @staticmethod
+    def _page_skeleton(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get the page and table IDs and titles that a document is indexed by.
+        
+        Kept for evicted documents so they can be unindexed, and compared on
+        reload to check that index positions are still valid.
+        
+        Args:
+            data: Document data
+            
+        Returns:
+            List of {'page_id', 'tables': [{'table_id', 'title'}]} dicts
+        """
+        return [
+            {
+                "page_id": page["page_id"],
+                "tables": [{"table_id": table_id, "title": title} for table_id, title in page_table_headers(page)]
+            }
+            for page in data.get("pages", [])
+        ]
+    
+    @staticmethod
+    def _page_digest(page: Mapping) -> Optional[str]:
+        """
+        Get the content digest of a stored or freshly read page.
+        
+        Lazy pages use the digest recorded when they were parsed, or have
+        their body read once to compute it.
+        
+        Args:
+            page: Page dict, CompressedPage or LazyPage
+        
+        Returns:
+            Hex digest, or None if the page body can no longer be read
+        """
+        if isinstance(page, LazyPage):
+            if page.digest is None:
+                was_loaded = page.is_loaded
+                try:
+                    page.digest = content_digest(page.load())
+                except Exception:
+                    return None
+                if not was_loaded:
+                    page.release()
+            return page.digest
+        return content_digest(page)
+    
+    @staticmethod
+    def _page_keys(pages: List[Mapping]) -> List[Tuple[str, int]]:
+        """Key pages by (page_id, occurrence of that page_id so far)."""
+        seen: Dict[str, int] = {}
+        keys = []
+        for page in pages:
+            page_id = page["page_id"]
+            keys.append((page_id, seen.get(page_id, 0)))
+            seen[page_id] = seen.get(page_id, 0) + 1
+        return keys
+    
+    @staticmethod
+    def _diff_tables(diff: DocumentDiff, old_page: Mapping, new_page: Mapping):
+        """
+        Record added, removed and changed tables of a changed page.
+        
+        Args:
+            diff: Diff to extend
+            old_page: Page as stored (its body may no longer be readable)
+            new_page: Page as re-read
+        """
+        page_id = new_page["page_id"]
+        try:
+            old_tables = {table["table_id"]: content_digest(table) for table in old_page.get("tables", [])}
+        except Exception:
+            # The old body is gone (e.g. its source file was rewritten): compare IDs only
+            old_tables = {table_id: None for table_id, _ in page_table_headers(old_page)}
+        for table in new_page.get("tables", []):
+            table_id = table["table_id"]
+            if table_id not in old_tables:
+                diff.added_tables.append((page_id, table_id))
+            else:
+                old_digest = old_tables.pop(table_id)
+                if old_digest is None or old_digest != content_digest(table):
+                    diff.changed_tables.append((page_id, table_id))
+        diff.removed_tables.extend((page_id, table_id) for table_id in old_tables)
+    
+    def _intern_page(self, doc_id: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Intern a lazily loaded page body, crediting the savings to its document.
+        
+        Args:
+            doc_id: Document the page belongs to
+            page: Freshly loaded page dictionary
+            
+        Returns:
+            The interned page dictionary
+        """
+        page, saved = self._string_pool.intern_value(page)
+        if doc_id in self.intern_savings:
+            self.intern_savings[doc_id] += saved
+        return page
+    
+    def _publish(self, kind: str, doc_id: str, diff: Optional[DocumentDiff] = None):
+        """
+        Bump the version and notify listeners of a document change.
+        
+        Args:
+            kind: DOCUMENT_ADDED, DOCUMENT_REMOVED or DOCUMENT_CHANGED
+            doc_id: Identifier of the affected document
+            diff: What changed, for DOCUMENT_CHANGED
+        """
+        self.version += 1
+        event = SiloEvent(kind=kind, doc_id=doc_id, version=self.version, diff=diff)
+        for listener in list(self._listeners):
+            listener(event)
+    
+    def _index_document(self, doc_id: str, data: Dict[str, Any]):
+        """
+        Add a document's pages and tables to the lookup indexes.
+        
+        The first occurrence wins when an ID or title repeats within a
+        document, matching the order a linear scan would have returned.
+        
+        Args:
+            doc_id: Document identifier
+            data: Loaded document data
+        """
+        for page_pos, page in enumerate(data.get("pages", [])):
+            self._page_index.setdefault(page["page_id"], {}).setdefault(doc_id, page_pos)
+            
+            for table_pos, (table_id, title) in enumerate(page_table_headers(page)):
+                location = (page_pos, table_pos)
+                self._table_index.setdefault(table_id, {}).setdefault(doc_id, location)
+                title_key = _normalize_title(title)
+                self._title_index.setdefault(title_key, {}).setdefault(doc_id, []).append(location)
+    
+    def _unindex_document(self, doc_id: str, data: Dict[str, Any]):
+        """
+        Remove a document's pages and tables from the lookup indexes.
+        
+        Args:
+            doc_id: Document identifier
+            data: Document data that was previously indexed
+        """
+        for page in data.get("pages", []):
+            self._discard_index_entry(self._page_index, page["page_id"], doc_id)
+            
+            for table_id, title in page_table_headers(page):
+                self._discard_index_entry(self._table_index, table_id, doc_id)
+                self._discard_index_entry(self._title_index, _normalize_title(title), doc_id)
+    
+    @staticmethod
+    def _discard_index_entry(index: Dict[str, Dict[str, Any]], key: str, doc_id: str):
+        """Remove a document's entry for a key, dropping the key once it is empty."""
+        locations = index.get(key)
+        if locations is None:
+            return
+        locations.pop(doc_id, None)
+        if not locations:
+            del index[key]
+    
+    def _table_at(self, doc_id: str, page_pos: int, table_pos: int, as_view: bool = False) -> Optional[Mapping]:
+        """
+        Resolve an indexed table location to a table with document context.
+        
+        Args:
+            doc_id: Document identifier
+            page_pos: Position of the page within the document
+            table_pos: Position of the table within the page
+            as_view: Return a read-only TableView instead of a copy
+            
+        Returns:
+            Table data with doc_id and page_id added, or None if the document
+            could not be reloaded
+        """
+        data = self._document(doc_id)
+        if not data:
+            return None
+        page = data["pages"][page_pos]
+        table = page["tables"][table_pos]
+        if as_view:
+            return TableView(table, doc_id, page["page_id"])
+        table_copy = _plain_table(table)
+        table_copy["doc_id"] = doc_id
+        table_copy["page_id"] = page["page_id"]
+        return table_copy
@@ -0,0 +1,319 @@
+"""
+Snapshot - Binary, Memory-Mapped Silo Snapshots
+
+Writes the documents held by a Silo to a single compact binary file and
+reopens it through mmap, so a process can start serving without re-parsing
+any JSON and several worker processes share one copy of the corpus through
+the OS page cache.
+
+File layout (all integers little-endian, sections 8-byte aligned):
+
+    header      magic, version, section offsets (see _HEADER)
+    strings     u64 offset array (count + 1 entries) followed by UTF-8 data;
+                every column name and string cell is stored once here
+    columns     one array per table column: int64, float64 (+ u8 int flags),
+                u8 booleans or u32 string-table indexes
+    blobs       JSON for page fields other than tables, table fields other
+                than rows, and rows of tables that are not rectangular
+    meta        JSON directory: documents, page headers and the offsets of
+                every page, table and column above
+
+Opening a snapshot only decodes the meta directory. Pages come back as
+LazyPage objects whose bodies are rebuilt from the mapped columns on first
+access.
+
+Example Usage:
+    silo.save_snapshot("corpus.silo")
+    
+    worker_silo = Silo()
+    worker_silo.open_snapshot("corpus.silo")
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Tuple
+
+from src.loaders import HEADER_FIELDS, LazyPage
+
+
+SNAPSHOT_MAGIC = b"SILOSNAP"
+SNAPSHOT_VERSION = 1
+
+# magic, version, string count, string offsets pos, string data pos, meta pos, meta length
+_HEADER = struct.Struct("<8sIxxxxQQQQQ")
+
+# Column type tags
+_INT = "i"      # int64
+_NUMBER = "n"   # float64 values plus u8 flags marking values that were ints
+_BOOL = "b"     # u8
+_STRING = "s"   # u32 string-table index
+
+# Largest integer a float64 represents exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+class _SnapshotWriter:
+    """Accumulates snapshot sections in memory and writes them out."""
+    
+    def __init__(self):
+        self._string_ids: Dict[str, int] = {}
+        self._strings: List[bytes] = []
+        self._body = bytearray()
+    
+    def string_id(self, value: str) -> int:
+        """Get the string-table index for a string, adding it if needed."""
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = len(self._strings)
+            self._string_ids[value] = sid
+            self._strings.append(value.encode("utf-8"))
+        return sid
+    
+    def _append(self, data: bytes) -> List[int]:
+        """Append an 8-byte aligned segment and return its [offset, length] (relative to the body)."""
+        self._body.extend(b"\0" * (-len(self._body) % 8))
+        offset = len(self._body)
+        self._body.extend(data)
+        return [offset, len(data)]
+    
+    def add_json(self, value: Any) -> List[int]:
+        """Append a JSON blob."""
+        return self._append(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+    
+    def add_column(self, values: List[Any]) -> Tuple[str, List[int]]:
+        """
+        Append one column using the most compact type that round-trips exactly.
+        
+        Returns:
+            Tuple of (type tag, segment list)
+        
+        Raises:
+            TypeError: If the values have no columnar encoding
+        """
+        if all(type(value) is bool for value in values):
+            return _BOOL, [self._append(bytes(values))]
+        if all(type(value) is str for value in values):
+            sids = array("I", (self.string_id(value) for value in values))
+            return _STRING, [self._append(sids.tobytes())]
+        if all(type(value) is int and -2 ** 63 <= value < 2 ** 63 for value in values):
+            return _INT, [self._append(array("q", values).tobytes())]
+        if all(type(value) is float or (type(value) is int and abs(value) <= _MAX_EXACT_FLOAT_INT)
+               for value in values):
+            flags = bytes(type(value) is int for value in values)
+            return _NUMBER, [self._append(array("d", values).tobytes()), self._append(flags)]
+        raise TypeError("column has no columnar encoding")
+    
+    def add_table(self, table: Mapping) -> Dict[str, Any]:
+        """
+        Append a table and return its meta entry.
+        
+        Rectangular tables (every row a dict with the same columns) are stored
+        column by column; anything else keeps its rows as a JSON blob.
+        """
+        rows = list(table.get("rows", []))  # materializes lazy (columnar) row sequences
+        entry: Dict[str, Any] = {
+            "keys": list(table.keys()),
+            "info": self.add_json({key: value for key, value in table.items() if key != "rows"}),
+            "row_count": len(rows),
+        }
+        
+        column_names = list(rows[0].keys()) if rows and isinstance(rows[0], dict) else []
+        rectangular = bool(column_names) and all(
+            isinstance(row, dict) and row.keys() == rows[0].keys() for row in rows
+        )
+        if rectangular:
+            try:
+                columns = []
+                for name in column_names:
+                    kind, segments = self.add_column([row[name] for row in rows])
+                    columns.append([self.string_id(name), kind, segments])
+                entry["columns"] = columns
+                return entry
+            except TypeError:
+                pass
+        
+        entry["rows"] = self.add_json(rows)
+        return entry
+    
+    def add_page(self, page: Mapping) -> Dict[str, Any]:
+        """Append a page and return its meta entry."""
+        tables = page.get("tables", [])
+        return {
+            "header": {key: page[key] for key in HEADER_FIELDS if key in page},
+            "keys": list(page.keys()),
+            "table_headers": [[table["table_id"], table["title"]] for table in tables],
+            "rest": self.add_json({key: value for key, value in page.items() if key != "tables"}),
+            "tables": [self.add_table(table) for table in tables],
+        }
+    
+    def write(self, path: str, meta: Dict[str, Any]):
+        """Write all sections to `path`."""
+        string_offsets = array("Q", [0])
+        for encoded in self._strings:
+            string_offsets.append(string_offsets[-1] + len(encoded))
+        
+        def aligned(position: int) -> int:
+            return position + (-position % 8)
+        
+        string_offsets_pos = _HEADER.size
+        string_data_pos = string_offsets_pos + len(string_offsets) * 8
+        body_pos = aligned(string_data_pos + string_offsets[-1])
+        meta_pos = aligned(body_pos + len(self._body))
+        meta["body_pos"] = body_pos
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self._strings),
+                                 string_offsets_pos, string_data_pos, meta_pos, len(meta_bytes)))
+            f.write(string_offsets.tobytes())
+            for encoded in self._strings:
+                f.write(encoded)
+            f.write(b"\0" * (body_pos - f.tell()))
+            f.write(self._body)
+            f.write(b"\0" * (meta_pos - f.tell()))
+            f.write(meta_bytes)
+
+
+def write_snapshot(path: str, documents: Iterable[Tuple[str, Mapping]]):
+    """
+    Write documents to a snapshot file.
+    
+    Lazy pages are faulted in while writing, so the snapshot always holds the
+    complete corpus.
+    
+    Args:
+        path: Destination file path
+        documents: Iterable of (doc_id, document data) pairs
+    """
+    writer = _SnapshotWriter()
+    meta_documents = []
+    for doc_id, data in documents:
+        meta_documents.append({
+            "doc_id": doc_id,
+            "fields": {key: value for key, value in data.items() if key != "pages"},
+            "pages": [writer.add_page(page) for page in data.get("pages", [])],
+        })
+    writer.write(path, {"documents": meta_documents})
+
+
+class Snapshot:
+    """
+    An open, memory-mapped snapshot file.
+    
+    Column arrays are exposed as memoryviews over the mapping, so they are
+    never copied into the Python heap; string cells are decoded on demand.
+    The mapping stays open for as long as any page loaded from it is alive.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Map a snapshot file.
+        
+        Args:
+            path: Path to a file written by write_snapshot()
+        
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        
+        magic, version, count, offsets_pos, data_pos, meta_pos, meta_len = _HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a silo snapshot: {path}")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}: {path}")
+        
+        self._string_offsets = self._view[offsets_pos:offsets_pos + (count + 1) * 8].cast("Q")
+        self._string_data_pos = data_pos
+        self._strings: Dict[int, str] = {}
+        self.meta = json.loads(self._view[meta_pos:meta_pos + meta_len].tobytes())
+        self._body_pos = self.meta["body_pos"]
+    
+    def string(self, sid: int) -> str:
+        """Decode a string-table entry (memoized, so equal cells share one object)."""
+        value = self._strings.get(sid)
+        if value is None:
+            start = self._string_data_pos + self._string_offsets[sid]
+            end = self._string_data_pos + self._string_offsets[sid + 1]
+            value = self._view[start:end].tobytes().decode("utf-8")
+            self._strings[sid] = value
+        return value
+    
+    def segment(self, segment: List[int]) -> memoryview:
+        """Get a zero-copy view of a body segment."""
+        offset, length = segment
+        start = self._body_pos + offset
+        return self._view[start:start + length]
+    
+    def json(self, segment: List[int]) -> Any:
+        """Decode a JSON blob segment."""
+        return json.loads(self.segment(segment).tobytes())
+    
+    def column(self, kind: str, segments: List[List[int]]) -> List[Any]:
+        """Decode one column into Python values."""
+        if kind == _STRING:
+            return [self.string(sid) for sid in self.segment(segments[0]).cast("I")]
+        if kind == _INT:
+            return self.segment(segments[0]).cast("q").tolist()
+        if kind == _BOOL:
+            return [bool(value) for value in self.segment(segments[0])]
+        if kind == _NUMBER:
+            values = self.segment(segments[0]).cast("d")
+            flags = self.segment(segments[1])
+            return [int(value) if flag else value for value, flag in zip(values, flags)]
+        raise ValueError(f"Unknown column type {kind!r} in {self.path}")
+    
+    def table(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild a table dictionary from its meta entry."""
+        info = self.json(entry["info"])
+        if "columns" in entry:
+            names = [self.string(sid) for sid, _, _ in entry["columns"]]
+            columns = [self.column(kind, segments) for _, kind, segments in entry["columns"]]
+            info["rows"] = [dict(zip(names, values)) for values in zip(*columns)]
+        else:
+            info["rows"] = self.json(entry["rows"])
+        return {key: info[key] for key in entry["keys"]}
+    
+    def page_loader(self, entry: Dict[str, Any]) -> "SnapshotPageLoader":
+        """Get a body loader for a page meta entry."""
+        return SnapshotPageLoader(self, entry)
+    
+    def documents(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Build document data for every document in the snapshot.
+        
+        Returns:
+            List of (doc_id, data) pairs whose 'pages' are LazyPage objects
+        """
+        documents = []
+        for doc in self.meta["documents"]:
+            data = dict(doc["fields"])
+            data["pages"] = [
+                LazyPage(page["header"], tuple(page["keys"]),
+                         [tuple(table) for table in page["table_headers"]],
+                         self.page_loader(page))
+                for page in doc["pages"]
+            ]
+            documents.append((doc["doc_id"], data))
+        return documents
+
+
+class SnapshotPageLoader:
+    """Rebuilds one page body from an open snapshot."""
+    
+    __slots__ = ("snapshot", "entry")
+    
+    def __init__(self, snapshot: Snapshot, entry: Dict[str, Any]):
+        self.snapshot = snapshot
+        self.entry = entry
+    
+    def __call__(self) -> Dict[str, Any]:
+        page = self.snapshot.json(self.entry["rest"])
+        page["tables"] = [self.snapshot.table(table) for table in self.entry["tables"]]
+        return {key: page[key] for key in self.entry["keys"]}
@@ -0,0 +1,232 @@
+"""
+Catalog - Sorted, Incrementally Maintained Overview Entries
+
+Discovery tools list pages and tables in a fixed order. Rebuilding and
+re-sorting that list on every call makes each call cost as much as the
+whole corpus. A SortedCatalog keeps the entries sorted as documents come
+and go: a loaded document's entries are merged in with bisect, an unloaded
+document's entries are located by their keys and deleted, and readers take
+slices by offset and limit, optionally restricted to one document.
+
+Entries with equal sort keys keep the order in which they were added, so
+the catalog matches a stable sort over documents in load order.
+
+A catalog can also index facets of its entries, maintained on the same
+document updates:
+- exact facets:  value -> set of entry keys (strings match case-insensitively)
+- range facets:  entries sorted by value, so a [low, high] range is two bisects
+select() intersects the matching key sets, smallest first, and returns the
+matches in catalog order.
+
+Example Usage:
+    catalog = SortedCatalog(lambda entry: (entry["page_number"],),
+                            exact_facets=("category",), range_facets=("row_count",))
+    catalog.replace_document("doc1", entries)
+    first_page = catalog.slice(offset=0, limit=20)
+    doc_page = catalog.slice(offset=0, limit=20, doc_id="doc1")
+    large = catalog.select(exact={"category": ["pricing"]}, ranges={"row_count": (50, None)})
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class SortedCatalog:
+    """
+    Entries kept sorted across documents, with per-document views.
+    
+    Attributes:
+        sort_key: Function mapping an entry to its sort key (a tuple)
+        exact_facets: Entry fields indexed for equality lookups
+        range_facets: Entry fields indexed for numeric range lookups
+    """
+    
+    def __init__(self, sort_key: Callable[[Dict[str, Any]], Tuple],
+                 exact_facets: Iterable[str] = (), range_facets: Iterable[str] = ()):
+        """
+        Initialize an empty catalog.
+        
+        Args:
+            sort_key: Function mapping an entry to its sort key (a tuple)
+            exact_facets: Entry fields to index for equality lookups
+            range_facets: Entry fields to index for range lookups (numeric values)
+        """
+        self.sort_key = sort_key
+        self.exact_facets = tuple(exact_facets)
+        self.range_facets = tuple(range_facets)
+        self._by_key: Dict[Tuple, Dict[str, Any]] = {}
+        self._exact: Dict[str, Dict[Any, Set[Tuple]]] = {field: {} for field in self.exact_facets}  # {field: {value: keys}}
+        self._range_pairs: Dict[str, List[Tuple[Any, Tuple]]] = {field: [] for field in self.range_facets}  # sorted (value, key)
+        self._range_values: Dict[str, List[Any]] = {field: [] for field in self.range_facets}  # values of _range_pairs
+        self._keys: List[Tuple] = []  # sort key + insertion number, parallel to _entries
+        self._entries: List[Dict[str, Any]] = []
+        self._doc_keys: Dict[str, List[Tuple]] = {}  # {doc_id: sorted keys of its entries}
+        self._doc_entries: Dict[str, List[Dict[str, Any]]] = {}  # {doc_id: its entries in order}
+        self._sequence = count()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def count(self, doc_id: Optional[str] = None) -> int:
+        """Get the number of entries, overall or for one document."""
+        if doc_id is None:
+            return len(self._entries)
+        return len(self._doc_entries.get(doc_id, []))
+    
+    def replace_document(self, doc_id: str, entries: List[Dict[str, Any]]):
+        """
+        Set a document's entries, replacing any it had before.
+        
+        Args:
+            doc_id: Document the entries belong to
+            entries: The document's entries, in any order
+        """
+        self.remove_document(doc_id)
+        keyed = sorted(((self.sort_key(entry) + (next(self._sequence),), entry) for entry in entries),
+                       key=lambda item: item[0])
+        if not keyed:
+            return
+        self._doc_keys[doc_id] = [key for key, _ in keyed]
+        self._doc_entries[doc_id] = [entry for _, entry in keyed]
+        for key, entry in keyed:
+            self._index_facets(key, entry)
+        
+        if len(keyed) > len(self._entries):
+            # Merging a large document into a small catalog: re-sort once
+            merged = sorted(list(zip(self._keys, self._entries)) + keyed, key=lambda item: item[0])
+            self._keys = [key for key, _ in merged]
+            self._entries = [entry for _, entry in merged]
+            return
+        for key, entry in keyed:
+            position = bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self._entries.insert(position, entry)
+    
+    def remove_document(self, doc_id: str):
+        """Drop every entry of a document (no-op if it has none)."""
+        self._doc_entries.pop(doc_id, None)
+        for key in self._doc_keys.pop(doc_id, []):
+            position = bisect_left(self._keys, key)
+            del self._keys[position]
+            del self._entries[position]
+            self._unindex_facets(key)
+    
+    def clear(self):
+        """Drop every entry."""
+        self._keys.clear()
+        self._entries.clear()
+        self._doc_keys.clear()
+        self._doc_entries.clear()
+        self._by_key.clear()
+        for index in self._exact.values():
+            index.clear()
+        for field in self.range_facets:
+            self._range_pairs[field].clear()
+            self._range_values[field].clear()
+    
+    def slice(self, offset: int = 0, limit: Optional[int] = None, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get a window of entries in catalog order.
+        
+        Args:
+            offset: Number of entries to skip
+            limit: Maximum number of entries to return (None for all)
+            doc_id: Only return entries of this document
+        
+        Returns:
+            List of entries (the catalog's own dictionaries, not copies)
+        """
+        entries = self._entries if doc_id is None else self._doc_entries.get(doc_id, [])
+        offset = max(offset, 0)
+        if limit is None:
+            return entries[offset:]
+        return entries[offset:offset + max(limit, 0)]
+    
+    def select(self, exact: Optional[Dict[str, Any]] = None,
+               ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None) -> List[Dict[str, Any]]:
+        """
+        Get the entries matching every given facet, in catalog order.
+        
+        Args:
+            exact: {field: value or list of values}; an entry matches a field
+                   if it equals any of the values
+            ranges: {field: (low, high)}; inclusive bounds, None for open
+        
+        Returns:
+            Matching entries
+        
+        Raises:
+            KeyError: If a field is not an indexed facet of the right kind
+        """
+        candidates: List[Set[Tuple]] = []
+        for field, wanted in (exact or {}).items():
+            index = self._exact[field]
+            values = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            keys: Set[Tuple] = set()
+            for value in values:
+                keys |= index.get(self._facet_value(value), set())
+            candidates.append(keys)
+        for field, (low, high) in (ranges or {}).items():
+            values = self._range_values[field]
+            start = 0 if low is None else bisect_left(values, low)
+            end = len(values) if high is None else bisect_right(values, high)
+            candidates.append({key for _, key in self._range_pairs[field][start:end]})
+        
+        if not candidates:
+            return list(self._entries)
+        candidates.sort(key=len)
+        matched = candidates[0].intersection(*candidates[1:])
+        return [self._by_key[key] for key in sorted(matched)]
+    
+    def facet_counts(self, entries: Iterable[Dict[str, Any]]) -> Dict[str, Dict[Any, int]]:
+        """
+        Count the exact-facet values of some entries.
+        
+        Args:
+            entries: Entries to count (e.g. the result of select())
+        
+        Returns:
+            {field: {value: number of entries}}, most common values first
+        """
+        counters = {field: Counter() for field in self.exact_facets}
+        for entry in entries:
+            for field, counter in counters.items():
+                counter[entry.get(field)] += 1
+        return {field: dict(counter.most_common()) for field, counter in counters.items()}
+    
+    @staticmethod
+    def _facet_value(value: Any) -> Any:
+        """Normalize an exact-facet value (strings compare case-insensitively)."""
+        return value.lower() if isinstance(value, str) else value
+    
+    def _index_facets(self, key: Tuple, entry: Dict[str, Any]):
+        """Add one entry to the facet indexes."""
+        self._by_key[key] = entry
+        for field, index in self._exact.items():
+            index.setdefault(self._facet_value(entry.get(field)), set()).add(key)
+        for field in self.range_facets:
+            value = entry.get(field)
+            if value is None:
+                continue
+            position = bisect_left(self._range_pairs[field], (value, key))
+            self._range_pairs[field].insert(position, (value, key))
+            self._range_values[field].insert(position, value)
+    
+    def _unindex_facets(self, key: Tuple):
+        """Remove one entry from the facet indexes."""
+        entry = self._by_key.pop(key)
+        for field, index in self._exact.items():
+            value = self._facet_value(entry.get(field))
+            keys = index[value]
+            keys.discard(key)
+            if not keys:
+                del index[value]
+        for field in self.range_facets:
+            value = entry.get(field)
+            if value is None:
+                continue
+            position = bisect_left(self._range_pairs[field], (value, key))
+            del self._range_pairs[field][position]
+            del self._range_values[field][position]
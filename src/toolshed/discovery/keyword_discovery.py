@@ -3,10 +3,164 @@ Keyword Discovery Tool
 
 Provides overview of all available keywords in the system.
 Returns comprehensive list of keywords for content exploration.
+
+Keywords are kept in an inverted index: each keyword maps to postings that
+say where it occurs (document, page, table, row) and how often, so other
+tools can jump straight to the pages and tables containing a term.
+
+Extraction covers every page text field (title, summary, keywords,
+raw_content), every table's title, description, columns and metadata, and
+every row. It runs in two steps per document: document_texts() gathers
+each location's lowercased text from the silo, and tokenize_texts()
+tokenizes it with one precompiled regex into postings. The second step
+touches no shared state, so with workers > 1 a sync covering several
+documents tokenizes them in parallel worker processes.
+Benchmark: python devtools/benchmark_keywords.py
 """
 
-from typing import List, Set
-from src.silo import Silo
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from src.silo import Silo, SiloEvent
+from src.columnar import RowSequence, column_names
+
+
+# A keyword is a run of three or more letters or digits
+_TOKEN_PATTERN = re.compile(r"[^\W_]{3,}")
+
+# Page fields holding free text ("content" is the legacy name of raw_content)
+PAGE_TEXT_FIELDS = ("title", "summary", "raw_content", "content")
+
+# Where a keyword occurs within a document: (page_id, table_id, row)
+Location = Tuple[str, Optional[str], Optional[int]]
+
+
+class Posting(NamedTuple):
+    """
+    One location of a keyword.
+    
+    Attributes:
+        doc_id: Document containing the keyword
+        page_id: Page containing the keyword
+        table_id: Table containing the keyword (None for page text)
+        row: Row index within the table (None for page or table text)
+        count: Occurrences of the keyword at this location (term frequency)
+    """
+    doc_id: str
+    page_id: str
+    table_id: Optional[str]
+    row: Optional[int]
+    count: int
+
+
+def _metadata_strings(metadata: Any, texts: List[str]):
+    """Collect the string values and string list items of a metadata dict."""
+    if not isinstance(metadata, Mapping):
+        return
+    for value in metadata.values():
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, list):
+            texts.extend(item for item in value if isinstance(item, str))
+
+
+def _row_texts(rows: Any) -> Iterable[str]:
+    """
+    Get the lowercased string cells of each row, joined into one text per row.
+    
+    Columnar tables are read column by column from their precomputed
+    lowercased text columns, without building row dictionaries.
+    """
+    if isinstance(rows, RowSequence):
+        columns = []
+        for column in rows.table.columns.values():
+            if column.kind == "text":
+                columns.append(column.lowered())
+            elif column.kind == "object":
+                columns.append([value.lower() if isinstance(value, str) else "" for value in column])
+        if not columns:
+            return [""] * len(rows)
+        return map("\n".join, zip(*columns))
+    return [
+        "\n".join(value for value in row.values() if isinstance(value, str)).lower() if isinstance(row, Mapping) else ""
+        for row in rows
+    ]
+
+
+def document_texts(pages: Iterable[Mapping]) -> List[Tuple[Location, str]]:
+    """
+    Gather the lowercased text of every location of one document.
+    
+    Args:
+        pages: The document's pages (dicts or silo page views)
+        
+    Returns:
+        List of (location, text) pairs in document order, where location
+        is (page_id, table_id, row); plain strings, so it can be sent to a
+        worker process
+    """
+    located: List[Tuple[Location, str]] = []
+    for page in pages:
+        page_id = page["page_id"]
+        texts = [page[name] for name in PAGE_TEXT_FIELDS if isinstance(page.get(name), str)]
+        texts.extend(keyword for keyword in page.get("keywords") or [] if isinstance(keyword, str))
+        _metadata_strings(page.get("metadata"), texts)
+        located.append(((page_id, None, None), "\n".join(texts).lower()))
+        
+        for table in page.get("tables", []):
+            table_id = table.get("table_id")
+            texts = [table[name] for name in ("title", "description") if isinstance(table.get(name), str)]
+            texts.extend(column_names(table))
+            _metadata_strings(table.get("metadata"), texts)
+            located.append(((page_id, table_id, None), "\n".join(texts).lower()))
+            
+            for row_index, text in enumerate(_row_texts(table.get("rows", []))):
+                located.append(((page_id, table_id, row_index), text))
+    return located
+
+
+def tokenize_texts(located: Iterable[Tuple[Location, str]]) -> Dict[str, List[Tuple[Location, int]]]:
+    """
+    Tokenize located texts into keyword postings.
+    
+    Module-level and free of shared state so that it can run in a worker
+    process for parallel extraction.
+    
+    Args:
+        located: (location, lowercased text) pairs from document_texts()
+        
+    Returns:
+        Dictionary mapping each keyword to (location, count) pairs in
+        document order
+    """
+    doc_postings: Dict[str, List[Tuple[Location, int]]] = defaultdict(list)
+    findall = _TOKEN_PATTERN.findall
+    for location, text in located:
+        tokens = findall(text)
+        if len(tokens) == 1:
+            doc_postings[tokens[0]].append((location, 1))
+        elif tokens:
+            for keyword, count in Counter(tokens).items():
+                doc_postings[keyword].append((location, count))
+    return dict(doc_postings)
+
+
+def extract_document_postings(pages: Iterable[Mapping]) -> Dict[str, List[Tuple[Location, int]]]:
+    """
+    Tokenize one document into keyword postings.
+    
+    Args:
+        pages: The document's pages (dicts or silo page views)
+        
+    Returns:
+        Dictionary mapping each keyword to (location, count) pairs in
+        document order, where location is (page_id, table_id, row)
+    """
+    return tokenize_texts(document_texts(pages))
 
 
 class KeywordDiscovery:
@@ -15,18 +169,44 @@ class KeywordDiscovery:
     
     Provides comprehensive list of all keywords in the system
     for initial content exploration and understanding.
+    
+    Keywords are indexed per document. The tool subscribes to silo change
+    events and, on the next call, re-extracts keywords only for documents
+    that were added or replaced and drops those of removed documents.
+    With workers > 1, a sync that covers several documents tokenizes them
+    in a process pool; the index is still updated in document order.
+    
+    Attributes:
+        workers: Number of worker processes used for tokenizing (1 = serial)
     """
     
-    def __init__(self, silo: Silo):
+    def __init__(self, silo: Silo, workers: int = 1):
         """
         Initialize keyword discovery with a silo of data.
         
         Args:
             silo: Silo instance containing the data to explore
+            workers: Number of worker processes used for tokenizing (1 = serial)
         """
         self.silo = silo
-        self._keywords_cache: Set[str] = set()
-        self._is_cached = False
+        self.workers = workers
+        self._postings: Dict[str, Dict[str, List[Tuple[Location, int]]]] = {}  # {keyword: {doc_id: [(location, count)]}}
+        self._doc_term_counts: Dict[str, Dict[str, int]] = {}  # {doc_id: {keyword: occurrences}}
+        self._doc_page_counts: Dict[str, Dict[str, int]] = {}  # {doc_id: {keyword: pages containing it}}
+        self._doc_total_pages: Dict[str, int] = {}  # {doc_id: page count}
+        self._term_counts: Dict[str, int] = {}  # {keyword: occurrences in the corpus}
+        self._page_counts: Dict[str, int] = {}  # {keyword: pages containing it in the corpus}
+        self._keyword_doc_counts: Dict[str, int] = {}  # {keyword: number of documents}
+        self._total_pages = 0
+        self._sorted_keywords: List[str] = []
+        self._sorted_is_current = False
+        self._dirty_docs: Dict[str, None] = dict.fromkeys(silo.get_document_ids())
+        self.silo.subscribe(self._on_silo_event)
+        self.silo.register_cache(
+            "keyword_discovery",
+            lambda: (self._postings, self._doc_term_counts, self._doc_page_counts, self._term_counts,
+                     self._page_counts, self._keyword_doc_counts, self._sorted_keywords)
+        )
     
     def view_keywords(self) -> List[str]:
         """
@@ -38,102 +218,284 @@ class KeywordDiscovery:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        if not self._is_cached:
-            self._build_keyword_cache()
+        self._sync()
+        return list(self._vocabulary())
+    
+    def search_keywords(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Complete a keyword prefix against the vocabulary.
+        
+        The matching range is found by binary search in the sorted
+        vocabulary, and the most widespread completions are picked from it
+        with a bounded heap, so the full vocabulary is never copied or sent.
+        
+        Args:
+            prefix: Start of the keyword (case-insensitive)
+            limit: Maximum number of completions to return
+            
+        Returns:
+            Completions ranked by the number of documents containing them
+            (ties alphabetical):
+            [
+                {
+                    "keyword": str,
+                    "document_count": int
+                }
+            ]
+            
+        Example:
+            search_keywords("sand", limit=3)
+            # [{"keyword": "sandwich", "document_count": 2}, ...]
+        """
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
+        
+        self._sync()
+        if limit <= 0:
+            return []
+        prefix = prefix.strip().lower()
+        vocabulary = self._vocabulary()
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + "\U0010ffff", start)
+        doc_counts = self._keyword_doc_counts
+        top = heapq.nlargest(limit, vocabulary[start:end], key=doc_counts.__getitem__)
+        return [{"keyword": keyword, "document_count": doc_counts[keyword]} for keyword in top]
+    
+    def keyword_count(self) -> int:
+        """Get the number of distinct keywords without building the vocabulary list."""
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
         
-        # Return sorted list for consistent ordering
-        return sorted(list(self._keywords_cache))
+        self._sync()
+        return len(self._keyword_doc_counts)
     
-    def _build_keyword_cache(self):
+    def keyword_frequencies(self, keyword: str, doc_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Build cache of all keywords from silo data.
+        Get the frequency statistics of one keyword.
         
-        Extracts keywords from pages, tables, and metadata
-        to create a comprehensive keyword index.
+        Args:
+            keyword: Keyword to look up (case-insensitive)
+            doc_id: Restrict term and page frequencies to one document
+            
+        Returns:
+            Dictionary with:
+            {
+                "keyword": str,
+                "term_frequency": int,      # occurrences
+                "page_frequency": int,      # pages containing it
+                "document_frequency": int,  # documents containing it (corpus-wide)
+                "documents": {doc_id: occurrences}
+            }
         """
-        self._keywords_cache.clear()
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
+        
+        self._sync()
+        keyword = keyword.strip().lower()
+        term_counts, page_counts = self._frequency_scope(doc_id)
+        return {
+            "keyword": keyword,
+            "term_frequency": term_counts.get(keyword, 0),
+            "page_frequency": page_counts.get(keyword, 0),
+            "document_frequency": self._keyword_doc_counts.get(keyword, 0),
+            "documents": {
+                doc: counts[keyword] for doc, counts in self._doc_term_counts.items()
+                if keyword in counts and doc_id in (None, doc)
+            }
+        }
+    
+    def top_keywords(self, k: int = 50, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get the most distinctive keywords of the corpus or of one document.
         
-        # Get all pages from silo
-        pages = self.silo.get_all_pages()
+        Keywords are scored by tf-idf at page granularity:
+        term_frequency * log(pages / page_frequency), counted within the
+        scope. Terms found on every page (articles, boilerplate) score 0, and
+        ties fall back to term frequency, then alphabetical order. The top k
+        are picked with a bounded heap instead of sorting the vocabulary.
         
-        for page in pages:
-            # Extract keywords from page content
-            self._extract_keywords_from_text(page.get("content", ""))
+        Args:
+            k: Number of keywords to return
+            doc_id: Rank within one document instead of the whole corpus
             
-            # Extract keywords from page metadata
-            if "metadata" in page:
-                self._extract_keywords_from_metadata(page["metadata"])
+        Returns:
+            List of keyword dictionaries, most distinctive first:
+            [
+                {
+                    "keyword": str,
+                    "score": float,
+                    "term_frequency": int,
+                    "page_frequency": int,
+                    "document_frequency": int
+                }
+            ]
             
-            # Extract keywords from tables
-            for table in page.get("tables", []):
-                self._extract_keywords_from_table(table)
+        Example:
+            [entry["keyword"] for entry in top_keywords(5, doc_id="doc1")]
+        """
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
+        
+        self._sync()
+        if k <= 0:
+            return []
+        term_counts, page_counts = self._frequency_scope(doc_id)
+        total_pages = self._total_pages if doc_id is None else self._doc_total_pages.get(doc_id, 0)
+        
+        def score(keyword: str) -> float:
+            return term_counts[keyword] * math.log(max(total_pages, 1) / page_counts[keyword])
         
-        self._is_cached = True
+        # Scan in alphabetical order so equal keys keep it (nlargest is stable)
+        candidates = self._vocabulary() if doc_id is None else sorted(term_counts)
+        top = heapq.nlargest(k, candidates, key=lambda keyword: (score(keyword), term_counts[keyword]))
+        return [
+            {
+                "keyword": keyword,
+                "score": round(score(keyword), 4),
+                "term_frequency": term_counts[keyword],
+                "page_frequency": page_counts[keyword],
+                "document_frequency": self._keyword_doc_counts[keyword]
+            }
+            for keyword in top
+        ]
     
-    def _extract_keywords_from_text(self, text: str):
+    def get_postings(self, keyword: str) -> List[Posting]:
         """
-        Extract keywords from text content.
+        Get every location of a keyword.
+        
+        The keyword is found with a single dictionary lookup; the result
+        lists postings document by document in load order.
         
         Args:
-            text: Text content to extract keywords from
+            keyword: Keyword to look up (case-insensitive)
+            
+        Returns:
+            List of Posting tuples (empty if the keyword does not occur)
         """
-        if not text:
-            return
-        
-        # Simple keyword extraction - split on whitespace and filter
-        words = text.lower().split()
-        keywords = [word.strip('.,!?;:()[]{}"\'') for word in words]
-        keywords = [word for word in keywords if len(word) > 2 and word.isalnum()]
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
         
-        self._keywords_cache.update(keywords)
+        self._sync()
+        by_doc = self._postings.get(keyword.strip().lower())
+        if not by_doc:
+            return []
+        return [
+            Posting(doc_id, page_id, table_id, row, count)
+            for doc_id, postings in by_doc.items()
+            for (page_id, table_id, row), count in postings
+        ]
     
-    def _extract_keywords_from_metadata(self, metadata: dict):
+    def locate_keyword(self, keyword: str) -> List[Dict[str, Any]]:
         """
-        Extract keywords from metadata.
+        Find the pages, tables and rows containing a keyword.
         
         Args:
-            metadata: Metadata dictionary
+            keyword: Keyword to look up (case-insensitive)
+            
+        Returns:
+            List of location dictionaries:
+            [
+                {
+                    "doc_id": str,
+                    "page_id": str,
+                    "table_id": str or None,
+                    "row": int or None,
+                    "count": int
+                }
+            ]
         """
-        if not metadata:
-            return
+        return [posting._asdict() for posting in self.get_postings(keyword)]
+    
+    def _frequency_scope(self, doc_id: Optional[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Get the (term counts, page counts) dictionaries of the corpus or one document."""
+        if doc_id is None:
+            return self._term_counts, self._page_counts
+        if doc_id not in self._doc_term_counts and doc_id not in self.silo.document_info:
+            raise ValueError(f"Document {doc_id} not found")
+        return self._doc_term_counts.get(doc_id, {}), self._doc_page_counts.get(doc_id, {})
+    
+    def _vocabulary(self) -> List[str]:
+        """Get the sorted vocabulary, re-sorting only after the index changed."""
+        if not self._sorted_is_current:
+            self._sorted_keywords = sorted(self._keyword_doc_counts)
+            self._sorted_is_current = True
+        return self._sorted_keywords
+    
+    def _on_silo_event(self, event: SiloEvent):
+        """Record a changed document; its keywords are rebuilt on next use."""
+        self._dirty_docs[event.doc_id] = None
+    
+    def _sync(self):
+        """Bring the keyword index up to date with the silo."""
+        while self._dirty_docs:
+            doc_ids = list(self._dirty_docs)
+            self._dirty_docs.clear()
+            for doc_id in doc_ids:
+                self._remove_document_keywords(doc_id)
+            doc_ids = [doc_id for doc_id in doc_ids if doc_id in self.silo.document_info]
+            
+            if self.workers <= 1 or len(doc_ids) <= 1:
+                for doc_id in doc_ids:
+                    self._add_document_keywords(doc_id, tokenize_texts(self._document_texts(doc_id)))
+                continue
+            
+            # Gather texts here (they come from the silo), tokenize in workers
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(doc_ids))) as pool:
+                futures = {doc_id: pool.submit(tokenize_texts, self._document_texts(doc_id)) for doc_id in doc_ids}
+                for doc_id, future in futures.items():
+                    self._add_document_keywords(doc_id, future.result())
+    
+    def _document_texts(self, doc_id: str) -> List[Tuple[Location, str]]:
+        """Gather one document's located texts from the silo."""
+        # Iterate page views from silo (no per-page copies, lazy bodies released after each page)
+        return document_texts(self.silo.iter_pages(doc_id, release_bodies=True))
+    
+    def _add_document_keywords(self, doc_id: str, doc_postings: Dict[str, List[Tuple[Location, int]]]):
+        """
+        Add one document's extracted keywords to the index.
+        
+        Keywords come from pages, tables, rows and metadata
+        to create a comprehensive keyword index.
         
-        # Extract keywords from metadata fields
-        for value in metadata.values():
-            if isinstance(value, str):
-                self._extract_keywords_from_text(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        self._extract_keywords_from_text(item)
+        Args:
+            doc_id: Document the keywords were extracted from
+            doc_postings: Its postings from tokenize_texts()
+        """
+        term_counts = self._doc_term_counts[doc_id] = {}
+        page_counts = self._doc_page_counts[doc_id] = {}
+        for keyword, postings in doc_postings.items():
+            self._postings.setdefault(keyword, {})[doc_id] = postings
+            term_counts[keyword] = sum(count for _, count in postings)
+            page_counts[keyword] = len({location[0] for location, _ in postings})
+            self._term_counts[keyword] = self._term_counts.get(keyword, 0) + term_counts[keyword]
+            self._page_counts[keyword] = self._page_counts.get(keyword, 0) + page_counts[keyword]
+            self._keyword_doc_counts[keyword] = self._keyword_doc_counts.get(keyword, 0) + 1
+        self._doc_total_pages[doc_id] = self.silo.document_info[doc_id].page_count
+        self._total_pages += self._doc_total_pages[doc_id]
+        self._sorted_is_current = False
     
-    def _extract_keywords_from_table(self, table: dict):
+    def _remove_document_keywords(self, doc_id: str):
         """
-        Extract keywords from table data.
+        Drop one document's keywords from the index.
         
         Args:
-            table: Table dictionary
+            doc_id: Document whose keywords should be removed
         """
-        if not table:
+        term_counts = self._doc_term_counts.pop(doc_id, None)
+        if term_counts is None:
             return
-        
-        # Extract from table title and description
-        self._extract_keywords_from_text(table.get("title", ""))
-        self._extract_keywords_from_text(table.get("description", ""))
-        
-        # Extract from column names
-        for column in table.get("columns", []):
-            if isinstance(column, dict):
-                self._extract_keywords_from_text(column.get("name", ""))
-            elif isinstance(column, str):
-                self._extract_keywords_from_text(column)
-        
-        # Extract from table metadata
-        if "metadata" in table:
-            self._extract_keywords_from_metadata(table["metadata"])
-        
-        # Extract from sample row data
-        for row in table.get("rows", [])[:5]:  # Limit to first 5 rows for performance
-            if isinstance(row, dict):
-                for value in row.values():
-                    if isinstance(value, str):
-                        self._extract_keywords_from_text(value) 
\ No newline at end of file
+        page_counts = self._doc_page_counts.pop(doc_id)
+        self._total_pages -= self._doc_total_pages.pop(doc_id)
+        for keyword, occurrences in term_counts.items():
+            by_doc = self._postings[keyword]
+            del by_doc[doc_id]
+            if not by_doc:
+                del self._postings[keyword]
+                del self._term_counts[keyword]
+                del self._page_counts[keyword]
+                del self._keyword_doc_counts[keyword]
+            else:
+                self._term_counts[keyword] -= occurrences
+                self._page_counts[keyword] -= page_counts[keyword]
+                self._keyword_doc_counts[keyword] -= 1
+        self._sorted_is_current = False
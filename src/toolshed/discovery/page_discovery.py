@@ -3,10 +3,14 @@ Page Discovery Tool
 
 Provides overview of all available pages in the system.
 Returns page numbers and titles for initial data exploration.
+
+The overview is a SortedCatalog updated per document from silo change
+events, so a call costs as much as the window it returns.
 """
 
-from typing import List, Dict, Any
-from src.silo import Silo
+from typing import List, Dict, Any, Optional
+from src.silo import Silo, SiloEvent
+from .catalog import SortedCatalog
 
 
 class PageDiscovery:
@@ -15,6 +19,9 @@ class PageDiscovery:
     
     Provides high-level overview of all pages in the system,
     including page numbers and titles for initial exploration.
+    
+    Page entries are kept sorted by page number and refreshed only for
+    documents reported as added, replaced or removed by silo change events.
     """
     
     def __init__(self, silo: Silo):
@@ -25,10 +32,19 @@ class PageDiscovery:
             silo: Silo instance containing the data to explore
         """
         self.silo = silo
+        self._catalog = SortedCatalog(lambda entry: (entry["page_number"] or 0,))
+        self._dirty_docs: Dict[str, None] = dict.fromkeys(silo.get_document_ids())
+        self.silo.subscribe(self._on_silo_event)
+        self.silo.register_cache("page_discovery", lambda: self._catalog)
     
-    def view_pages(self) -> List[Dict[str, Any]]:
+    def view_pages(self, offset: int = 0, limit: Optional[int] = None, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get overview of all available pages.
+        Get overview of available pages, ordered by page number.
+        
+        Args:
+            offset: Number of pages to skip
+            limit: Maximum number of pages to return (None for all)
+            doc_id: Only list pages of this document
         
         Returns:
             List of dictionaries containing page information:
@@ -44,10 +60,53 @@ class PageDiscovery:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        pages = self.silo.get_all_pages()
+        if self._dirty_docs:
+            self._sync()
+        
+        return self._catalog.slice(offset, limit, doc_id)
+    
+    def page_count(self, doc_id: Optional[str] = None) -> int:
+        """
+        Get the number of pages without listing them.
+        
+        Args:
+            doc_id: Only count pages of this document
+            
+        Returns:
+            Number of pages
+        """
+        if self._dirty_docs:
+            self._sync()
+        return self._catalog.count(doc_id)
+    
+    def _on_silo_event(self, event: SiloEvent):
+        """Record a changed document; its pages are re-listed on next use."""
+        self._dirty_docs[event.doc_id] = None
+    
+    def _sync(self):
+        """Refresh the catalog entries of documents that changed since the last call."""
+        while self._dirty_docs:
+            doc_id = next(iter(self._dirty_docs))
+            del self._dirty_docs[doc_id]
+            
+            if doc_id in self.silo.document_info:
+                self._catalog.replace_document(doc_id, self._build_document_pages(doc_id))
+            else:
+                self._catalog.remove_document(doc_id)
+    
+    def _build_document_pages(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Build the page entries of one document.
+        
+        Args:
+            doc_id: Document to list pages of
+            
+        Returns:
+            List of page entries for the document
+        """
         overview = []
         
-        for page in pages:
+        for page in self.silo.iter_pages(doc_id):
             page_id = page["page_id"]
             page_number = self._extract_page_number(page_id)
             page_title = page.get("title", f"Page {page_number}")
@@ -58,8 +117,6 @@ class PageDiscovery:
                 "doc_id": page["doc_id"]
             })
         
-        # Sort by page number for consistent ordering
-        overview.sort(key=lambda x: x["page_number"] or 0)
         return overview
     
     def _extract_page_number(self, page_id: str) -> int:
@@ -3,10 +3,24 @@ Table Discovery Tool
 
 Provides overview of all available tables in the system.
 Returns table titles, categories, and page numbers for initial exploration.
+
+The overview is a SortedCatalog updated per document from silo change
+events, so a call costs as much as the window it returns. The catalog also
+indexes category and doc_id (exact) and page number, row count and column
+count (ranges), which filter_tables() intersects to narrow candidates.
 """
 
-from typing import List, Dict, Any
-from src.silo import Silo
+from typing import List, Dict, Any, Optional, Union
+from src.silo import Silo, SiloEvent
+from src.columnar import column_names
+from .catalog import SortedCatalog
+
+
+# Exact-match facets of table entries
+EXACT_FACETS = ("category", "doc_id")
+
+# Range facets of table entries
+RANGE_FACETS = ("page_number", "row_count", "column_count")
 
 
 class TableDiscovery:
@@ -15,6 +29,10 @@ class TableDiscovery:
     
     Provides high-level overview of all tables in the system,
     including titles, categories, and page numbers for initial exploration.
+    
+    Table entries are kept sorted by page number and title, and refreshed
+    only for documents reported as added, replaced or removed by silo
+    change events.
     """
     
     def __init__(self, silo: Silo):
@@ -25,12 +43,23 @@ class TableDiscovery:
             silo: Silo instance containing the data to explore
         """
         self.silo = silo
-        self._table_cache: List[Dict[str, Any]] = []
-        self._is_cached = False
+        self._catalog = SortedCatalog(
+            lambda entry: (entry["page_number"] or 0, entry["table_title"]),
+            exact_facets=EXACT_FACETS,
+            range_facets=RANGE_FACETS
+        )
+        self._dirty_docs: Dict[str, None] = dict.fromkeys(silo.get_document_ids())
+        self.silo.subscribe(self._on_silo_event)
+        self.silo.register_cache("table_discovery", lambda: self._catalog)
     
-    def view_tables(self) -> List[Dict[str, Any]]:
+    def view_tables(self, offset: int = 0, limit: Optional[int] = None, doc_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get overview of all available tables.
+        Get overview of available tables, ordered by page number and title.
+        
+        Args:
+            offset: Number of tables to skip
+            limit: Maximum number of tables to return (None for all)
+            doc_id: Only list tables of this document
         
         Returns:
             List of dictionaries containing table information:
@@ -49,24 +78,131 @@ class TableDiscovery:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        if not self._is_cached:
-            self._build_table_cache()
+        if self._dirty_docs:
+            self._sync()
         
-        return self._table_cache
+        return self._catalog.slice(offset, limit, doc_id)
     
-    def _build_table_cache(self):
+    def table_count(self, doc_id: Optional[str] = None) -> int:
         """
-        Build cache of all tables from silo data.
+        Get the number of tables without listing them.
         
-        Extracts table information from all pages and organizes
-        it for easy discovery and exploration.
+        Args:
+            doc_id: Only count tables of this document
+            
+        Returns:
+            Number of tables
         """
-        self._table_cache.clear()
+        if self._dirty_docs:
+            self._sync()
+        return self._catalog.count(doc_id)
+    
+    def filter_tables(self,
+                      category: Union[str, List[str], None] = None,
+                      doc_id: Union[str, List[str], None] = None,
+                      page_min: Optional[int] = None,
+                      page_max: Optional[int] = None,
+                      min_rows: Optional[int] = None,
+                      max_rows: Optional[int] = None,
+                      min_columns: Optional[int] = None,
+                      max_columns: Optional[int] = None,
+                      offset: int = 0,
+                      limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Find tables by category, document, page range and size.
+        
+        Every given facet must match; a list for category or doc_id matches
+        any of its values. Ranges are inclusive. Each facet is answered from
+        its own index and the smallest candidate sets are intersected first.
         
-        # Get all pages from silo
-        pages = self.silo.get_all_pages()
+        Args:
+            category: Technical category (case-insensitive) or list of them
+            doc_id: Document ID or list of them
+            page_min: Lowest page number
+            page_max: Highest page number
+            min_rows: Fewest rows
+            max_rows: Most rows
+            min_columns: Fewest columns
+            max_columns: Most columns
+            offset: Number of matching tables to skip
+            limit: Maximum number of tables to return (None for all)
+            
+        Returns:
+            Dictionary with:
+            {
+                "tables": [table entries as in view_tables()],
+                "total": int,  # matches before offset/limit
+                "facets": {
+                    "category": {category: count},
+                    "doc_id": {doc_id: count}
+                }
+            }
+            
+        Example:
+            filter_tables(category="pricing", doc_id="doc1", page_min=10, page_max=20)
+            filter_tables(min_rows=51)
+        """
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
+        
+        if self._dirty_docs:
+            self._sync()
+        
+        exact = {
+            field: value for field, value in (("category", category), ("doc_id", doc_id))
+            if value is not None
+        }
+        ranges = {
+            field: bounds for field, bounds in (
+                ("page_number", (page_min, page_max)),
+                ("row_count", (min_rows, max_rows)),
+                ("column_count", (min_columns, max_columns))
+            )
+            if bounds != (None, None)
+        }
+        matches = self._catalog.select(exact, ranges)
+        offset = max(offset, 0)
+        window = matches[offset:] if limit is None else matches[offset:offset + max(limit, 0)]
+        return {
+            "tables": window,
+            "total": len(matches),
+            "facets": self._catalog.facet_counts(matches)
+        }
+    
+    def _on_silo_event(self, event: SiloEvent):
+        """Record a changed document; its tables are rebuilt on next use."""
+        self._dirty_docs[event.doc_id] = None
+    
+    def _sync(self):
+        """
+        Refresh table entries for changed documents.
+        
+        Extracts table information only from documents that changed since
+        the last call and merges it into the sorted catalog.
+        """
+        while self._dirty_docs:
+            doc_id = next(iter(self._dirty_docs))
+            del self._dirty_docs[doc_id]
+            
+            if doc_id in self.silo.document_info:
+                self._catalog.replace_document(doc_id, self._build_document_tables(doc_id))
+            else:
+                self._catalog.remove_document(doc_id)
+    
+    def _build_document_tables(self, doc_id: str) -> List[Dict[str, Any]]:
+        """
+        Extract table information from all pages of one document.
+        
+        Args:
+            doc_id: Document to extract tables from
+            
+        Returns:
+            List of table entries for the document
+        """
+        tables = []
         
-        for page in pages:
+        # Iterate page views from silo (no per-page copies, lazy bodies released after each page)
+        for page in self.silo.iter_pages(doc_id, release_bodies=True):
             page_id = page["page_id"]
             page_number = self._extract_page_number(page_id)
             
@@ -74,11 +210,9 @@ class TableDiscovery:
             for table in page.get("tables", []):
                 table_info = self._extract_table_info(table, page, page_number)
                 if table_info:
-                    self._table_cache.append(table_info)
+                    tables.append(table_info)
         
-        # Sort by page number, then by table title for consistent ordering
-        self._table_cache.sort(key=lambda x: (x["page_number"] or 0, x["table_title"]))
-        self._is_cached = True
+        return tables
     
     def _extract_table_info(self, table: dict, page: dict, page_number: int) -> Dict[str, Any] | None:
         """
@@ -95,9 +229,9 @@ class TableDiscovery:
         if not table or "title" not in table:
             return None
         
-        # Get table dimensions
+        # Get table dimensions (columns from the declared list or the row keys)
         rows = table.get("rows", [])
-        columns = table.get("columns", [])
+        columns = column_names(table)
         
         # Extract category from metadata
         category = "Unknown"
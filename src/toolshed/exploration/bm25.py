@@ -0,0 +1,246 @@
+"""
+BM25F - Field-Weighted Inverted Index for Relevance Ranking
+
+Items (tables or pages) are indexed by the tokens of several text fields.
+Each term maps to the items containing it and its frequency in each field,
+so a query only reads the postings of its own tokens. Scoring follows
+BM25F: per-field term frequencies are length-normalized, weighted and
+summed before BM25 saturation, then multiplied by the term's idf.
+
+Query tokens also match indexed terms they are a prefix of ("sand" finds
+"sandwich"), found by bisecting the sorted vocabulary, at a discount.
+
+Items are added and removed per group (a silo document), so the index
+follows document loads and unloads without a rebuild.
+
+Example Usage:
+    index = BM25FIndex({"title": 1.0, "body": 0.3})
+    index.add("doc1", ("doc1", 0), {"title": tokenize(title), "body": tokenize(body)})
+    for match in index.search(tokenize("peanut butter")):
+        print(match.key, match.score, match.relation)
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+# BM25 term-frequency saturation
+K1 = 1.2
+
+# BM25 length normalization strength (0: none, 1: full)
+B = 0.75
+
+# Score multiplier for terms matched by prefix rather than exactly
+PREFIX_MATCH_WEIGHT = 0.5
+
+# A token is a run of word characters; shorter than 3 characters is ignored
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Common words never indexed or searched
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
+def tokenize(text: Any) -> List[str]:
+    """
+    Split text into lowercased index tokens.
+    
+    Args:
+        text: Text to tokenize (non-strings are converted with str())
+    
+    Returns:
+        Tokens of three or more word characters, in order, stop words removed
+    """
+    if not text:
+        return []
+    words = _WORD_PATTERN.findall(str(text).lower())
+    return [word for word in words if len(word) > 2 and word not in STOP_WORDS]
+
+
+class Match(NamedTuple):
+    """
+    One scored search result.
+    
+    Attributes:
+        key: Item key given to BM25FIndex.add()
+        score: BM25F score (unbounded, higher is better)
+        field_scores: Share of the score contributed by each field
+        field_matches: Number of distinct query tokens matched in each field
+    """
+    key: Hashable
+    score: float
+    field_scores: Dict[str, float]
+    field_matches: Dict[str, int]
+    
+    @property
+    def relation(self) -> str:
+        """The field that contributed most to the score."""
+        return max(self.field_scores, key=self.field_scores.get)
+
+
+class BM25FIndex:
+    """
+    Inverted index with BM25F scoring over weighted fields.
+    
+    Attributes:
+        field_weights: Dictionary mapping field names to weights
+        k1: Term-frequency saturation parameter
+        b: Length normalization parameter
+    """
+    
+    def __init__(self, field_weights: Dict[str, float], k1: float = K1, b: float = B):
+        """
+        Initialize an empty index.
+        
+        Args:
+            field_weights: Dictionary mapping field names to weights
+            k1: Term-frequency saturation parameter
+            b: Length normalization parameter
+        """
+        self.field_weights = dict(field_weights)
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[Hashable, Dict[str, int]]] = {}  # {term: {key: {field: tf}}}
+        self._lengths: Dict[Hashable, Dict[str, int]] = {}  # {key: {field: token count}}
+        self._length_totals: Dict[str, int] = dict.fromkeys(self.field_weights, 0)
+        self._key_terms: Dict[Hashable, Set[str]] = {}
+        self._group_keys: Dict[Hashable, List[Hashable]] = {}
+        self._order: Dict[Hashable, int] = {}  # insertion rank, for stable ties
+        self._next_rank = 0
+        self._sorted_terms: Optional[List[str]] = None
+        self._field_factors: Optional[Dict[Hashable, Dict[str, float]]] = None  # {key: {field: weight / length norm}}
+    
+    def __len__(self) -> int:
+        return len(self._lengths)
+    
+    def add(self, group: Hashable, key: Hashable, fields: Dict[str, List[str]]):
+        """
+        Index one item.
+        
+        Args:
+            group: Group the item belongs to (removed together)
+            key: Unique item key
+            fields: Dictionary mapping field names to the item's tokens
+        """
+        lengths = {}
+        terms = set()
+        for field, tokens in fields.items():
+            if field not in self.field_weights:
+                raise KeyError(f"Unknown field {field!r}")
+            lengths[field] = len(tokens)
+            self._length_totals[field] += len(tokens)
+            for token in tokens:
+                field_tfs = self._postings.setdefault(token, {}).setdefault(key, {})
+                field_tfs[field] = field_tfs.get(field, 0) + 1
+                terms.add(token)
+        self._lengths[key] = lengths
+        self._key_terms[key] = terms
+        self._group_keys.setdefault(group, []).append(key)
+        self._order[key] = self._next_rank
+        self._next_rank += 1
+        self._sorted_terms = None
+        self._field_factors = None
+    
+    def remove_group(self, group: Hashable):
+        """Remove every item of a group (no-op if it has none)."""
+        for key in self._group_keys.pop(group, []):
+            for field, length in self._lengths.pop(key).items():
+                self._length_totals[field] -= length
+            for term in self._key_terms.pop(key):
+                postings = self._postings[term]
+                del postings[key]
+                if not postings:
+                    del self._postings[term]
+            del self._order[key]
+        self._sorted_terms = None
+        self._field_factors = None
+    
+    def clear(self):
+        """Remove every item."""
+        self._postings.clear()
+        self._lengths.clear()
+        self._length_totals = dict.fromkeys(self.field_weights, 0)
+        self._key_terms.clear()
+        self._group_keys.clear()
+        self._order.clear()
+        self._sorted_terms = None
+        self._field_factors = None
+    
+    def search(self, tokens: Iterable[str]) -> List[Match]:
+        """
+        Score the items matching any query token.
+        
+        Args:
+            tokens: Query tokens (as produced by tokenize())
+        
+        Returns:
+            Matches, best first (ties in insertion order)
+        """
+        item_count = len(self._lengths)
+        if not item_count:
+            return []
+        factors = self._factors()
+        
+        scores: Dict[Hashable, float] = {}
+        field_scores: Dict[Hashable, Dict[str, float]] = {}
+        field_tokens: Dict[Hashable, Dict[str, Set[str]]] = {}
+        for token in dict.fromkeys(tokens):
+            for term, term_weight in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1 + (item_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, field_tfs in postings.items():
+                    item_factors = factors[key]
+                    parts = {field: item_factors[field] * tf for field, tf in field_tfs.items()}
+                    weighted_tf = sum(parts.values())
+                    contribution = term_weight * idf * weighted_tf * (self.k1 + 1) / (weighted_tf + self.k1)
+                    
+                    scores[key] = scores.get(key, 0.0) + contribution
+                    item_fields = field_scores.setdefault(key, {})
+                    item_tokens = field_tokens.setdefault(key, {})
+                    for field, part in parts.items():
+                        item_fields[field] = item_fields.get(field, 0.0) + contribution * part / weighted_tf
+                        item_tokens.setdefault(field, set()).add(token)
+        
+        ranked = sorted(scores, key=lambda key: (-scores[key], self._order[key]))
+        return [
+            Match(
+                key,
+                scores[key],
+                field_scores[key],
+                {field: len(matched) for field, matched in field_tokens[key].items()}
+            )
+            for key in ranked
+        ]
+    
+    def _factors(self) -> Dict[Hashable, Dict[str, float]]:
+        """
+        Get each item's per-field multiplier: weight / (1 - b + b * length / average length).
+        
+        Depends only on the indexed items, so it is computed once per index
+        change rather than once per posting per query.
+        """
+        if self._field_factors is None:
+            item_count = len(self._lengths)
+            averages = {field: (total / item_count) or 1 for field, total in self._length_totals.items()}
+            self._field_factors = {
+                key: {
+                    field: self.field_weights[field] / (1 - self.b + self.b * length / averages[field])
+                    for field, length in lengths.items()
+                }
+                for key, lengths in self._lengths.items()
+            }
+        return self._field_factors
+    
+    def _expand(self, token: str) -> List[Tuple[str, float]]:
+        """Get the indexed terms a query token matches, with their weights."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        position = bisect_left(terms, token)
+        expanded = []
+        while position < len(terms) and terms[position].startswith(token):
+            term = terms[position]
+            expanded.append((term, 1.0 if term == token else PREFIX_MATCH_WEIGHT))
+            position += 1
+        return expanded
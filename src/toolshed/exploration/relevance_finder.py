@@ -3,11 +3,37 @@ Relevance Finder Tool
 
 Finds relevant tables and pages based on search queries.
 Uses multiple criteria: keywords, columns, rows, categories, and values.
+
+Tables and pages are ranked with BM25F over inverted indexes (see bm25.py):
+each criterion is an indexed field with its own weight, and a query only
+reads the postings of its tokens instead of scanning every table and page.
 """
 
-from typing import List, Dict, Any, Set
-from src.silo import Silo
-import re
+from typing import List, Dict, Any
+from src.silo import Silo, SiloEvent
+from src.columnar import column_names
+from .bm25 import BM25FIndex, Match, tokenize
+
+
+# Table fields (named after the result "relation") and their BM25F weights
+TABLE_FIELD_WEIGHTS = {"category": 0.8, "column": 0.6, "values": 0.4, "description": 0.3}
+
+# Page fields (named after the result "relation") and their BM25F weights
+PAGE_FIELD_WEIGHTS = {"content": 0.7, "table_titles": 0.5, "keywords": 0.3}
+
+# Labels used in match_details
+_FIELD_LABELS = {
+    "category": "Category",
+    "column": "Column",
+    "values": "Value",
+    "description": "Description",
+    "content": "Content",
+    "table_titles": "Table title",
+    "keywords": "Keyword"
+}
+
+# Rows sampled per table for the "values" field
+SAMPLE_ROWS = 3
 
 
 class RelevanceFinder:
@@ -16,6 +42,9 @@ class RelevanceFinder:
     
     Uses multiple relevance criteria to find tables and pages
     that match search queries: keywords, columns, rows, categories, values.
+    
+    Table and page caches and their search indexes are kept per document
+    and refreshed only for documents reported as changed by silo events.
     """
     
     def __init__(self, silo: Silo):
@@ -26,9 +55,14 @@ class RelevanceFinder:
             silo: Silo instance containing the data to search
         """
         self.silo = silo
-        self._table_cache: List[Dict[str, Any]] = []
-        self._page_cache: List[Dict[str, Any]] = []
-        self._is_cached = False
+        self._table_cache: Dict[str, List[Dict[str, Any]]] = {}  # {doc_id: table entries}
+        self._page_cache: Dict[str, List[Dict[str, Any]]] = {}  # {doc_id: page entries}
+        self._table_index = BM25FIndex(TABLE_FIELD_WEIGHTS)  # keys: (doc_id, position in _table_cache)
+        self._page_index = BM25FIndex(PAGE_FIELD_WEIGHTS)  # keys: (doc_id, position in _page_cache)
+        self._dirty_docs: Dict[str, None] = dict.fromkeys(silo.get_document_ids())
+        self.silo.subscribe(self._on_silo_event)
+        self.silo.register_cache("relevance_finder.tables", lambda: (self._table_cache, self._table_index))
+        self.silo.register_cache("relevance_finder.pages", lambda: (self._page_cache, self._page_index))
     
     def find_relevant_tables(self, search_query: str) -> List[Dict[str, Any]]:
         """
@@ -42,7 +76,7 @@ class RelevanceFinder:
             [
                 {
                     "table_name": str,
-                    "relation": str,  # "page_keywords", "column", "row", "category", "values"
+                    "relation": str,  # "column", "values", "category", "description"
                     "relevance_score": float,  # 0.0 to 1.0
                     "page_number": int,
                     "category": str,
@@ -54,23 +88,28 @@ class RelevanceFinder:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        if not self._is_cached:
-            self._build_caches()
+        self._sync()
         
         # Normalize search query
-        query_tokens = self._tokenize_query(search_query.lower())
+        query_tokens = self._tokenize_query(search_query)
         if not query_tokens:
             return []
         
         relevant_tables = []
         
-        for table_info in self._table_cache:
-            relevance_info = self._calculate_table_relevance(table_info, query_tokens)
-            if relevance_info["relevance_score"] > 0:
-                relevant_tables.append(relevance_info)
+        for match in self._table_index.search(query_tokens):
+            doc_id, position = match.key
+            table_info = self._table_cache[doc_id][position]
+            relevant_tables.append({
+                "table_name": table_info["table_name"],
+                "relation": match.relation,
+                "relevance_score": self._normalize_score(match.score),
+                "page_number": table_info["page_number"],
+                "category": table_info["category"],
+                "match_details": self._match_details(match, TABLE_FIELD_WEIGHTS)
+            })
         
-        # Sort by relevance score (highest first)
-        relevant_tables.sort(key=lambda x: x["relevance_score"], reverse=True)
+        # Matches come sorted by relevance score (highest first)
         return relevant_tables
     
     def find_relevant_pages(self, search_query: str) -> List[Dict[str, Any]]:
@@ -96,201 +135,127 @@ class RelevanceFinder:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        if not self._is_cached:
-            self._build_caches()
+        self._sync()
         
         # Normalize search query
-        query_tokens = self._tokenize_query(search_query.lower())
+        query_tokens = self._tokenize_query(search_query)
         if not query_tokens:
             return []
         
         relevant_pages = []
         
-        for page_info in self._page_cache:
-            relevance_info = self._calculate_page_relevance(page_info, query_tokens)
-            if relevance_info["relevance_score"] > 0:
-                relevant_pages.append(relevance_info)
+        for match in self._page_index.search(query_tokens):
+            doc_id, position = match.key
+            page_info = self._page_cache[doc_id][position]
+            relevant_pages.append({
+                "page_title": page_info["page_title"],
+                "page_number": page_info["page_number"],
+                "relation": match.relation,
+                "relevance_score": self._normalize_score(match.score),
+                "match_details": self._match_details(match, PAGE_FIELD_WEIGHTS)
+            })
         
-        # Sort by relevance score (highest first)
-        relevant_pages.sort(key=lambda x: x["relevance_score"], reverse=True)
+        # Matches come sorted by relevance score (highest first)
         return relevant_pages
     
-    def _build_caches(self):
-        """Build caches of tables and pages for efficient searching."""
-        self._table_cache.clear()
-        self._page_cache.clear()
-        
-        # Get all pages from silo
-        pages = self.silo.get_all_pages()
+    def _on_silo_event(self, event: SiloEvent):
+        """Record a changed document; its caches are rebuilt on next use."""
+        self._dirty_docs[event.doc_id] = None
+    
+    def _sync(self):
+        """Bring per-document caches and indexes up to date with the silo."""
+        while self._dirty_docs:
+            doc_id = next(iter(self._dirty_docs))
+            del self._dirty_docs[doc_id]
+            
+            self._table_cache.pop(doc_id, None)
+            self._page_cache.pop(doc_id, None)
+            self._table_index.remove_group(doc_id)
+            self._page_index.remove_group(doc_id)
+            if doc_id in self.silo.document_info:
+                self._build_caches(doc_id)
+    
+    def _build_caches(self, doc_id: str):
+        """Cache one document's tables and pages and add them to the search indexes."""
+        table_cache = self._table_cache[doc_id] = []
+        page_cache = self._page_cache[doc_id] = []
         
-        for page in pages:
+        # Iterate page views from silo (no per-page copies, lazy bodies released after each page)
+        for page in self.silo.iter_pages(doc_id, release_bodies=True):
             page_id = page["page_id"]
             page_number = self._extract_page_number(page_id)
-            
-            # Cache page information
-            page_info = {
-                "page_title": page.get("title", f"Page {page_number}"),
-                "page_number": page_number,
-                "content": page.get("content", "").lower(),
-                "keywords": self._extract_keywords_from_text(page.get("content", "")),
-                "table_titles": []
-            }
+            table_titles = []
             
             # Process tables in this page
             for table in page.get("tables", []):
                 table_info = self._extract_table_info(table, page, page_number)
                 if table_info:
-                    self._table_cache.append(table_info)
-                    page_info["table_titles"].append(table["title"])
+                    fields = table_info.pop("fields")
+                    self._table_index.add(doc_id, (doc_id, len(table_cache)), fields)
+                    table_cache.append(table_info)
+                    table_titles.append(table["title"])
             
-            self._page_cache.append(page_info)
-        
-        self._is_cached = True
+            # Cache page information ("content" is the legacy name of raw_content)
+            content = page.get("raw_content") or page.get("content", "")
+            self._page_index.add(doc_id, (doc_id, len(page_cache)), {
+                "content": tokenize(content),
+                "table_titles": tokenize(" ".join(table_titles)),
+                "keywords": tokenize(" ".join(k for k in page.get("keywords") or [] if isinstance(k, str)))
+            })
+            page_cache.append({
+                "page_title": page.get("title", f"Page {page_number}"),
+                "page_number": page_number,
+                "table_titles": table_titles
+            })
     
     def _extract_table_info(self, table: dict, page: dict, page_number: int) -> Dict[str, Any] | None:
-        """Extract comprehensive table information for relevance matching."""
+        """Extract table information and the tokens of its searchable fields."""
         if not table or "title" not in table:
             return None
         
         rows = table.get("rows", [])
-        columns = table.get("columns", [])
         
         # Extract category
         category = "Unknown"
         if "metadata" in table and "technical_category" in table["metadata"]:
             category = table["metadata"]["technical_category"]
         
-        # Extract column names and sample values
-        column_names = []
+        # Extract column names and sample values from the first few rows
+        names = column_names(table)
         sample_values = []
-        for col in columns:
-            col_name = col.get("name", "Unknown")
-            column_names.append(col_name.lower())
-            
-            # Get sample values from first few rows
-            for row in rows[:3]:
-                if isinstance(row, dict) and col_name in row:
-                    value = str(row[col_name]).lower()
-                    if value not in sample_values:
-                        sample_values.append(value)
+        for row in rows[:SAMPLE_ROWS]:
+            if isinstance(row, dict):
+                sample_values.extend(str(row[name]) for name in names if name in row)
         
         return {
             "table_name": table["title"],
             "page_number": page_number,
             "category": category.lower(),
-            "column_names": column_names,
-            "sample_values": sample_values,
             "row_count": len(rows),
-            "description": table.get("description", "").lower()
+            "fields": {
+                "category": tokenize(category),
+                "column": tokenize(" ".join(names)),
+                "values": tokenize(" ".join(sample_values)),
+                "description": tokenize(table.get("description", ""))
+            }
         }
     
-    def _calculate_table_relevance(self, table_info: Dict[str, Any], query_tokens: List[str]) -> Dict[str, Any]:
-        """Calculate relevance score for a table based on multiple criteria."""
-        max_score = 0.0
-        best_relation = ""
-        match_details = []
-        
-        # Check category relevance (highest weight)
-        category_matches = sum(1 for token in query_tokens if token in table_info["category"])
-        if category_matches > 0:
-            score = min(category_matches / len(query_tokens), 1.0) * 0.8
-            if score > max_score:
-                max_score = score
-                best_relation = "category"
-                match_details.append(f"Category matches: {category_matches} tokens")
-        
-        # Check column name relevance
-        column_matches = sum(1 for token in query_tokens if any(token in col for col in table_info["column_names"]))
-        if column_matches > 0:
-            score = min(column_matches / len(query_tokens), 1.0) * 0.6
-            if score > max_score:
-                max_score = score
-                best_relation = "column"
-                match_details.append(f"Column matches: {column_matches} tokens")
-        
-        # Check sample values relevance
-        value_matches = sum(1 for token in query_tokens if any(token in val for val in table_info["sample_values"]))
-        if value_matches > 0:
-            score = min(value_matches / len(query_tokens), 1.0) * 0.4
-            if score > max_score:
-                max_score = score
-                best_relation = "values"
-                match_details.append(f"Value matches: {value_matches} tokens")
-        
-        # Check description relevance
-        desc_matches = sum(1 for token in query_tokens if token in table_info["description"])
-        if desc_matches > 0:
-            score = min(desc_matches / len(query_tokens), 1.0) * 0.3
-            if score > max_score:
-                max_score = score
-                best_relation = "description"
-                match_details.append(f"Description matches: {desc_matches} tokens")
-        
-        return {
-            "table_name": table_info["table_name"],
-            "relation": best_relation,
-            "relevance_score": max_score,
-            "page_number": table_info["page_number"],
-            "category": table_info["category"],
-            "match_details": "; ".join(match_details) if match_details else "No specific matches"
-        }
+    def _match_details(self, match: Match, field_weights: Dict[str, float]) -> str:
+        """Describe which fields a match came from, highest-weighted field first."""
+        details = [
+            f"{_FIELD_LABELS[field]} matches: {match.field_matches[field]} tokens"
+            for field in field_weights if field in match.field_matches
+        ]
+        return "; ".join(details) if details else "No specific matches"
     
-    def _calculate_page_relevance(self, page_info: Dict[str, Any], query_tokens: List[str]) -> Dict[str, Any]:
-        """Calculate relevance score for a page based on multiple criteria."""
-        max_score = 0.0
-        best_relation = ""
-        match_details = []
-        
-        # Check content relevance (highest weight)
-        content_matches = sum(1 for token in query_tokens if token in page_info["content"])
-        if content_matches > 0:
-            score = min(content_matches / len(query_tokens), 1.0) * 0.7
-            if score > max_score:
-                max_score = score
-                best_relation = "content"
-                match_details.append(f"Content matches: {content_matches} tokens")
-        
-        # Check table titles relevance
-        title_matches = sum(1 for token in query_tokens if any(token in title.lower() for title in page_info["table_titles"]))
-        if title_matches > 0:
-            score = min(title_matches / len(query_tokens), 1.0) * 0.5
-            if score > max_score:
-                max_score = score
-                best_relation = "table_titles"
-                match_details.append(f"Table title matches: {title_matches} tokens")
-        
-        # Check keywords relevance
-        keyword_matches = sum(1 for token in query_tokens if token in page_info["keywords"])
-        if keyword_matches > 0:
-            score = min(keyword_matches / len(query_tokens), 1.0) * 0.3
-            if score > max_score:
-                max_score = score
-                best_relation = "keywords"
-                match_details.append(f"Keyword matches: {keyword_matches} tokens")
-        
-        return {
-            "page_title": page_info["page_title"],
-            "page_number": page_info["page_number"],
-            "relation": best_relation,
-            "relevance_score": max_score,
-            "match_details": "; ".join(match_details) if match_details else "No specific matches"
-        }
+    @staticmethod
+    def _normalize_score(score: float) -> float:
+        """Map an unbounded BM25F score onto 0.0-1.0 (monotonic, so order is kept)."""
+        return score / (score + 1.0)
     
     def _tokenize_query(self, query: str) -> List[str]:
         """Tokenize and normalize search query."""
-        # Simple tokenization - split on whitespace and filter
-        tokens = re.findall(r'\b\w+\b', query.lower())
-        # Filter out very short tokens and common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        return [token for token in tokens if len(token) > 2 and token not in stop_words]
-    
-    def _extract_keywords_from_text(self, text: str) -> Set[str]:
-        """Extract keywords from text content."""
-        if not text:
-            return set()
-        
-        words = re.findall(r'\b\w+\b', text.lower())
-        return {word for word in words if len(word) > 2}
+        return tokenize(query)
     
     def _extract_page_number(self, page_id: str) -> int:
         """Extract page number from page_id."""
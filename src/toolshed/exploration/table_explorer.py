@@ -51,7 +51,7 @@ class TableExplorer:
             raise ValueError("No data available in silo")
         
         # Get table data by title
-        table_data = self.silo.get_table_by_title(table_name)
+        table_data = self.silo.get_table_by_title(table_name, as_view=True)
         if not table_data:
             return None
         
@@ -90,7 +90,7 @@ class TableExplorer:
             processed_columns.append(col_info)
         
         # Get sample rows (first 3)
-        sample_rows = rows[:3] if rows else []
+        sample_rows = list(rows[:3]) if rows else []
         
         return {
             "table_title": table_data["title"],
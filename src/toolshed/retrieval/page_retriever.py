@@ -5,8 +5,10 @@ Retrieves specific page content by title or number.
 Returns full page content for detailed analysis and extraction.
 """
 
-from typing import Dict, Any, Optional, Union
-from src.silo import Silo
+from typing import Dict, Any, Optional, Union, List
+from collections.abc import Mapping
+from src.silo import Silo, SiloEvent
+from src.columnar import plain_rows
 
 
 class PageRetriever:
@@ -15,6 +17,12 @@ class PageRetriever:
     
     Provides access to specific page content by title or number,
     enabling detailed page-level analysis and extraction.
+    
+    The lookup cache records which document each entry came from, so silo
+    change events only replace the entries of the affected document. When
+    several pages share a page number or title, the one loaded last wins.
+    Entries hold page IDs, not pages, and are resolved through the silo on
+    each lookup, so the cache never keeps an evicted document's pages alive.
     """
     
     def __init__(self, silo: Silo):
@@ -25,8 +33,11 @@ class PageRetriever:
             silo: Silo instance containing the data to retrieve
         """
         self.silo = silo
-        self._page_cache: Dict[str, Dict[str, Any]] = {}
-        self._is_cached = False
+        self._page_cache: Dict[str, Dict[str, str]] = {}  # {cache_key: {doc_id: page_id}}
+        self._doc_keys: Dict[str, List[str]] = {}  # {doc_id: cache keys}
+        self._dirty_docs: Dict[str, None] = dict.fromkeys(silo.get_document_ids())
+        self.silo.subscribe(self._on_silo_event)
+        self.silo.register_cache("page_retriever", lambda: (self._page_cache, self._doc_keys))
     
     def get_page_content(self, page_identifier: Union[str, int]) -> Optional[Dict[str, Any]]:
         """
@@ -49,8 +60,7 @@ class PageRetriever:
         if not self.silo.is_loaded():
             raise ValueError("No data available in silo")
         
-        if not self._is_cached:
-            self._build_page_cache()
+        self._sync()
         
         # Try to find page by identifier
         page_data = None
@@ -68,7 +78,10 @@ class PageRetriever:
         # Extract page information
         page_id = page_data["page_id"]
         page_number = self._extract_page_number(page_id)
-        tables = page_data.get("tables", [])
+        tables = [
+            {**table, "rows": plain_rows(table["rows"])} if "rows" in table else table
+            for table in page_data.get("tables", [])
+        ]
         
         return {
             "page_title": page_data.get("title", f"Page {page_number}"),
@@ -104,33 +117,60 @@ class PageRetriever:
         """
         return self.get_page_content(page_title)
     
-    def _build_page_cache(self):
-        """Build cache of pages for efficient searching."""
-        self._page_cache.clear()
-        
-        # Get all pages from silo
-        pages = self.silo.get_all_pages()
+    def _on_silo_event(self, event: SiloEvent):
+        """Record a changed document; its cache entries are rebuilt on next use."""
+        self._dirty_docs[event.doc_id] = None
+    
+    def _sync(self):
+        """Bring the page cache up to date with the silo."""
+        while self._dirty_docs:
+            doc_id = next(iter(self._dirty_docs))
+            del self._dirty_docs[doc_id]
+            
+            self._remove_document_pages(doc_id)
+            if doc_id in self.silo.document_info:
+                self._build_page_cache(doc_id)
+    
+    def _build_page_cache(self, doc_id: str):
+        """Cache one document's page IDs by number and title for efficient searching."""
+        keys = self._doc_keys[doc_id] = []
         
-        for page in pages:
+        # Iterate page views from silo (only header fields are read)
+        for page in self.silo.iter_pages(doc_id):
             page_id = page["page_id"]
             page_number = self._extract_page_number(page_id)
             page_title = page.get("title", f"Page {page_number}")
             
-            # Cache by both number and title
-            self._page_cache[f"number_{page_number}"] = page
-            self._page_cache[f"title_{page_title.lower()}"] = page
-        
-        self._is_cached = True
+            # Cache by both number and title (later pages win within a document)
+            for cache_key in (f"number_{page_number}", f"title_{page_title.lower()}"):
+                entries = self._page_cache.setdefault(cache_key, {})
+                if doc_id not in entries:
+                    keys.append(cache_key)
+                entries[doc_id] = page_id
+    
+    def _remove_document_pages(self, doc_id: str):
+        """Drop one document's entries from the page cache."""
+        for cache_key in self._doc_keys.pop(doc_id, []):
+            entries = self._page_cache[cache_key]
+            del entries[doc_id]
+            if not entries:
+                del self._page_cache[cache_key]
+    
+    def _lookup(self, cache_key: str) -> Optional[Mapping]:
+        """Get the most recently loaded document's page for a cache key."""
+        entries = self._page_cache.get(cache_key)
+        if not entries:
+            return None
+        doc_id, page_id = next(reversed(entries.items()))
+        return self.silo.get_page_by_id(page_id, doc_id, as_view=True)
     
-    def _find_page_by_number(self, page_number: int) -> Optional[Dict[str, Any]]:
+    def _find_page_by_number(self, page_number: int) -> Optional[Mapping]:
         """Find page by page number."""
-        cache_key = f"number_{page_number}"
-        return self._page_cache.get(cache_key)
+        return self._lookup(f"number_{page_number}")
     
-    def _find_page_by_title(self, page_title: str) -> Optional[Dict[str, Any]]:
+    def _find_page_by_title(self, page_title: str) -> Optional[Mapping]:
         """Find page by page title (case-insensitive)."""
-        cache_key = f"title_{page_title.lower()}"
-        return self._page_cache.get(cache_key)
+        return self._lookup(f"title_{page_title.lower()}")
     
     def _extract_page_number(self, page_id: str) -> int:
         """
@@ -2,11 +2,13 @@
 Row Retriever Tool
 
 Retrieves specific rows from tables based on column value matching.
-Returns rows where row[column] = target for precise data extraction.
+Returns rows where row[column] = target for precise data extraction, or
+rows whose numeric column value lies in a range.
 """
 
 from typing import Dict, Any, Optional, List
 from src.silo import Silo
+from src.columnar import column_names, match_rows, filter_rows, rows_in_range
 
 
 class RowRetriever:
@@ -33,7 +35,8 @@ class RowRetriever:
         Args:
             table_name: Name/title of the table to search
             column: Column name to match against
-            target: Target value to match (case-insensitive)
+            target: Target value to match (case-insensitive; a number also
+                    matches numeric cells of equal value, e.g. "2" and "+$2.00")
             
         Returns:
             Dictionary containing matching rows or None if not found:
@@ -50,7 +53,7 @@ class RowRetriever:
             raise ValueError("No data available in silo")
         
         # Get table data by title
-        table_data = self.silo.get_table_by_title(table_name)
+        table_data = self.silo.get_table_by_title(table_name, as_view=True)
         if not table_data:
             return None
         
@@ -59,23 +62,15 @@ class RowRetriever:
         page_number = self._extract_page_number(page_id)
         
         # Get columns and rows
-        columns = table_data.get("columns", [])
         rows = table_data.get("rows", [])
         
         # Validate that the column exists
-        available_columns = [col.get("name", "Unknown") for col in columns]
+        available_columns = column_names(table_data)
         if column not in available_columns:
             raise ValueError(f"Column '{column}' not found in table. Available columns: {available_columns}")
         
-        # Find matching rows (case-insensitive)
-        target_lower = str(target).lower()
-        matching_rows = []
-        
-        for row in rows:
-            if isinstance(row, dict) and column in row:
-                row_value = str(row[column]).lower()
-                if row_value == target_lower:
-                    matching_rows.append(row)
+        # Find matching rows (case-insensitive, on the lowercased column view)
+        matching_rows = match_rows(rows, column, target)
         
         return {
             "table_title": table_data["title"],
@@ -110,7 +105,7 @@ class RowRetriever:
             raise ValueError("No data available in silo")
         
         # Get table data by title
-        table_data = self.silo.get_table_by_title(table_name)
+        table_data = self.silo.get_table_by_title(table_name, as_view=True)
         if not table_data:
             return None
         
@@ -119,34 +114,16 @@ class RowRetriever:
         page_number = self._extract_page_number(page_id)
         
         # Get columns and rows
-        columns = table_data.get("columns", [])
         rows = table_data.get("rows", [])
         
         # Validate that all criteria columns exist
-        available_columns = [col.get("name", "Unknown") for col in columns]
+        available_columns = column_names(table_data)
         missing_columns = [col for col in criteria.keys() if col not in available_columns]
         if missing_columns:
             raise ValueError(f"Columns not found in table: {missing_columns}. Available columns: {available_columns}")
         
         # Find matching rows (all criteria must match)
-        matching_rows = []
-        
-        for row in rows:
-            if isinstance(row, dict):
-                all_criteria_match = True
-                for column, target in criteria.items():
-                    if column not in row:
-                        all_criteria_match = False
-                        break
-                    
-                    row_value = str(row[column]).lower()
-                    target_lower = str(target).lower()
-                    if row_value != target_lower:
-                        all_criteria_match = False
-                        break
-                
-                if all_criteria_match:
-                    matching_rows.append(row)
+        matching_rows = filter_rows(rows, criteria)
         
         return {
             "table_title": table_data["title"],
@@ -158,6 +135,66 @@ class RowRetriever:
             "category": table_data.get("metadata", {}).get("technical_category", "Unknown")
         }
     
+    def get_rows_in_range(self, table_name: str, column: str,
+                          minimum: Optional[float] = None,
+                          maximum: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get rows whose numeric value in a column lies in a range.
+        
+        Cells are compared as numbers using the column's typed view, so
+        currency and unit suffixes from the table metadata are ignored
+        ("+$2.00" is 2.0). Cells holding no number never match.
+        
+        Args:
+            table_name: Name/title of the table to search
+            column: Column name to compare
+            minimum: Inclusive lower bound (None for no lower bound)
+            maximum: Inclusive upper bound (None for no upper bound)
+            
+        Returns:
+            Dictionary containing matching rows or None if not found:
+            {
+                "table_title": str,
+                "column": str,
+                "minimum": float,
+                "maximum": float,
+                "matching_rows": [dict],
+                "row_count": int,
+                "page_number": int
+            }
+        """
+        if not self.silo.is_loaded():
+            raise ValueError("No data available in silo")
+        
+        # Get table data by title
+        table_data = self.silo.get_table_by_title(table_name, as_view=True)
+        if not table_data:
+            return None
+        
+        # Extract page information
+        page_id = table_data["page_id"]
+        page_number = self._extract_page_number(page_id)
+        
+        # Validate that the column exists
+        available_columns = column_names(table_data)
+        if column not in available_columns:
+            raise ValueError(f"Column '{column}' not found in table. Available columns: {available_columns}")
+        
+        # Find rows in range (on the column's numeric view)
+        matching_rows = rows_in_range(table_data.get("rows", []), column, minimum, maximum)
+        
+        return {
+            "table_title": table_data["title"],
+            "column": column,
+            "minimum": minimum,
+            "maximum": maximum,
+            "matching_rows": matching_rows,
+            "row_count": len(matching_rows),
+            "page_number": page_number,
+            "description": table_data.get("description", ""),
+            "category": table_data.get("metadata", {}).get("technical_category", "Unknown")
+        }
+    
     def _extract_page_number(self, page_id: str) -> int:
         """
         Extract page number from page_id.
@@ -7,6 +7,7 @@ Returns actual table data for specific analysis and extraction.
 
 from typing import Dict, Any, Optional, List, Union
 from src.silo import Silo
+from src.columnar import column_names as table_column_names, numeric_columns, plain_rows
 
 
 class TableRetriever:
@@ -42,6 +43,7 @@ class TableRetriever:
                 "rows": [dict],
                 "row_count": int,
                 "column_count": int,
+                "numeric_columns": {str: str},  # numeric column name -> unit
                 "page_number": int
             }
         """
@@ -49,7 +51,7 @@ class TableRetriever:
             raise ValueError("No data available in silo")
         
         # Get table data by title
-        table_data = self.silo.get_table_by_title(table_name)
+        table_data = self.silo.get_table_by_title(table_name, as_view=True)
         if not table_data:
             return None
         
@@ -58,21 +60,20 @@ class TableRetriever:
         page_number = self._extract_page_number(page_id)
         
         # Get original columns and rows
-        original_columns = table_data.get("columns", [])
+        available_columns = table_column_names(table_data)
         original_rows = table_data.get("rows", [])
         
         # Process columns based on filter
         if columns == "all":
             # Get all column names
-            column_names = [col.get("name", "Unknown") for col in original_columns]
-            filtered_rows = original_rows
+            column_names = available_columns
+            filtered_rows = plain_rows(original_rows)
         else:
             # Filter by specific columns
             if not isinstance(columns, list):
                 raise ValueError("columns must be 'all' or a list of column names")
             
             # Validate that requested columns exist
-            available_columns = [col.get("name", "Unknown") for col in original_columns]
             missing_columns = [col for col in columns if col not in available_columns]
             if missing_columns:
                 raise ValueError(f"Columns not found in table: {missing_columns}")
@@ -95,6 +96,9 @@ class TableRetriever:
             "rows": filtered_rows,
             "row_count": len(filtered_rows),
             "column_count": len(column_names),
+            "numeric_columns": {
+                name: unit for name, unit in numeric_columns(table_data).items() if name in column_names
+            },
             "page_number": page_number,
             "description": table_data.get("description", ""),
             "category": table_data.get("metadata", {}).get("technical_category", "Unknown")
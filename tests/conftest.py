@@ -0,0 +1,6 @@
+import pytest
+
+@pytest.fixture(autouse=True)
+def user_cache_home(tmp_path_factory, monkeypatch):
+    """Keep discovery manifests written by tests out of the real user cache."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path_factory.mktemp('cache')))
@@ -2,6 +2,10 @@ import os
 import pytest
 from src.barn import Barn
 
+@pytest.fixture
+def hip_path():
+    return os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')
+
 def setup_barn():
     data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
     barn = Barn(data_path)
@@ -25,4 +29,184 @@ def test_get_available_documents():
     barn = setup_barn()
     docs = barn.get_available_documents()
     assert isinstance(docs, list)
-    assert len(docs) > 0 
\ No newline at end of file
+    assert len(docs) > 0
+
+def test_farm_stats():
+    barn = setup_barn()
+    stats = barn.get_farm_stats()
+    assert stats.discovery_tools + stats.exploration_tools + stats.retrieval_tools == len(barn.tools)
+    assert stats.exploration_tools == 3 and stats.retrieval_tools == 4
+
+def test_tools_follow_document_changes(hip_path):
+    barn = setup_barn()
+    tables_before = len(barn.call_tool('view_tables'))
+    keywords_before = len(barn.call_tool('view_keywords'))
+    version = barn.silo.version
+    assert barn.load_document('hip', hip_path)
+    assert barn.silo.version > version
+    assert len(barn.call_tool('view_tables')) > tables_before
+    assert len(barn.call_tool('view_keywords')) > keywords_before
+    assert barn.call_tool('find_relevant_tables', search_query='acetabular')
+    assert barn.silo.remove_document('hip')
+    assert len(barn.call_tool('view_tables')) == tables_before
+    assert len(barn.call_tool('view_keywords')) == keywords_before
+
+def test_paginated_catalogs(hip_path):
+    barn = setup_barn()
+    assert barn.load_document('hip', hip_path)
+    pages = barn.call_tool('view_pages')
+    assert [p['page_number'] for p in pages] == sorted(p['page_number'] for p in pages)
+    assert barn.call_tool('view_pages', offset=5, limit=4) == pages[5:9]
+    hip_pages = barn.call_tool('view_pages', doc_id='hip')
+    assert hip_pages and {p['doc_id'] for p in hip_pages} == {'hip'}
+    assert barn.page_discovery.page_count() == len(pages)
+    assert barn.page_discovery.page_count('hip') == len(hip_pages)
+    
+    tables = barn.call_tool('view_tables')
+    assert tables == sorted(tables, key=lambda t: (t['page_number'], t['table_title']))
+    assert barn.call_tool('view_tables', offset=2, limit=3) == tables[2:5]
+    assert barn.call_tool('view_tables', doc_id='default') == [t for t in tables if t['doc_id'] == 'default']
+    
+    assert barn.silo.remove_document('hip')
+    assert barn.call_tool('view_pages') == [p for p in pages if p['doc_id'] != 'hip']
+    assert barn.call_tool('view_tables', doc_id='hip') == []
+    assert barn.table_discovery.table_count() == len([t for t in tables if t['doc_id'] != 'hip'])
+
+def test_filter_tables(hip_path):
+    barn = setup_barn()
+    assert barn.load_document('hip', hip_path)
+    tables = barn.call_tool('view_tables')
+    
+    result = barn.call_tool('filter_tables')
+    assert result['tables'] == tables and result['total'] == len(tables)
+    assert sum(result['facets']['doc_id'].values()) == len(tables)
+    
+    category = tables[0]['category']
+    result = barn.call_tool('filter_tables', category=category.upper())
+    assert result['tables'] == [t for t in tables if t['category'] == category]
+    assert result['facets']['category'] == {category: result['total']}
+    
+    result = barn.call_tool('filter_tables', doc_id='hip', page_min=10, page_max=20, min_rows=3)
+    expected = [t for t in tables if t['doc_id'] == 'hip' and 10 <= t['page_number'] <= 20 and t['row_count'] >= 3]
+    assert expected and result['tables'] == expected
+    assert barn.call_tool('filter_tables', doc_id='hip', limit=2, offset=1)['tables'] == \
+        [t for t in tables if t['doc_id'] == 'hip'][1:3]
+    assert all(t['column_count'] > 0 for t in tables)
+    
+    assert barn.silo.remove_document('hip')
+    assert barn.call_tool('filter_tables', doc_id='hip')['total'] == 0
+
+def test_relevance_ranking(hip_path):
+    barn = setup_barn()
+    tables = barn.call_tool('find_relevant_tables', search_query='sandwich toppings')
+    assert tables
+    assert set(tables[0]) == {'table_name', 'relation', 'relevance_score', 'page_number', 'category', 'match_details'}
+    scores = [t['relevance_score'] for t in tables]
+    assert scores == sorted(scores, reverse=True) and all(0 < score < 1 for score in scores)
+    assert {t['relation'] for t in tables} <= {'category', 'column', 'values', 'description'}
+    
+    pages = barn.call_tool('find_relevant_pages', search_query='peanut butter')
+    assert pages[0]['relation'] in {'content', 'table_titles', 'keywords'}
+    assert 'Content matches' in pages[0]['match_details']
+    assert barn.call_tool('find_relevant_pages', search_query='the of') == []
+    
+    assert barn.load_document('hip', hip_path)
+    assert barn.call_tool('find_relevant_pages', search_query='acetabul')
+    assert barn.silo.remove_document('hip')
+    assert barn.call_tool('find_relevant_pages', search_query='acetabular') == []
+    assert barn.call_tool('find_relevant_tables', search_query='sandwich toppings') == tables
+
+def test_follow_datasets(tmp_path):
+    import shutil
+    from src.config import ConfigManager
+    shutil.copytree('data/pb&j_20250626_173624', tmp_path / 'pb&j_20250626_173624')
+    manager = ConfigManager(tmp_path)
+    barn = Barn()
+    barn.follow_datasets(manager)
+    assert barn.get_available_documents() == ['pb&j_20250626_173624']
+    shutil.copytree('data/Hip_TRTIIH_SP_2_20250703_121853', tmp_path / 'Hip_TRTIIH_SP_2_20250703_121853')
+    shutil.rmtree(tmp_path / 'pb&j_20250626_173624')
+    manager.refresh_datasets()
+    assert barn.get_available_documents() == ['Hip_TRTIIH_SP_2_20250703_121853']
+
+def test_locate_keyword():
+    barn = setup_barn()
+    locations = barn.call_tool('locate_keyword', keyword='Sandwich')
+    assert locations
+    pages = {page['page_id'] for page in barn.silo.get_all_pages()}
+    assert all(location['page_id'] in pages and location['count'] > 0 for location in locations)
+    assert any(location['table_id'] is not None for location in locations)
+    assert barn.call_tool('locate_keyword', keyword='no-such-keyword') == []
+
+def test_top_keywords():
+    barn = setup_barn()
+    top = barn.call_tool('top_keywords', k=5)
+    assert len(top) == 5
+    assert [entry['score'] for entry in top] == sorted((entry['score'] for entry in top), reverse=True)
+    stats = barn.keyword_discovery.keyword_frequencies(top[0]['keyword'])
+    assert stats['term_frequency'] == top[0]['term_frequency']
+    assert stats['term_frequency'] == sum(p.count for p in barn.keyword_discovery.get_postings(top[0]['keyword']))
+    assert barn.keyword_discovery.keyword_frequencies('the')['page_frequency'] > 1
+    
+    doc_id = barn.silo.get_document_ids()[0]
+    assert barn.call_tool('top_keywords', k=5, doc_id=doc_id) == top
+    barn.silo.remove_document(doc_id)
+    barn.silo.load_document(doc_id, os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'))
+    assert barn.call_tool('top_keywords', k=5) == top
+    assert barn.keyword_discovery.keyword_frequencies('the')['document_frequency'] == 1
+
+def test_search_keywords():
+    barn = setup_barn()
+    vocabulary = barn.call_tool('view_keywords')
+    completions = barn.call_tool('search_keywords', prefix='Sa', limit=3)
+    assert 0 < len(completions) <= 3
+    expected = sorted((kw for kw in vocabulary if kw.startswith('sa')),
+                      key=lambda kw: -len({p.doc_id for p in barn.keyword_discovery.get_postings(kw)}))
+    assert [c['keyword'] for c in completions] == expected[:3]
+    assert all(c['document_count'] >= 1 for c in completions)
+    assert barn.call_tool('search_keywords', prefix='zzzzqq') == []
+    assert barn.call_tool('search_keywords', prefix='sa', limit=0) == []
+
+def test_parallel_keyword_sync(hip_path):
+    from src.toolshed.discovery import KeywordDiscovery
+    barn = setup_barn()
+    barn.silo.load_document('hip', hip_path)
+    serial = KeywordDiscovery(barn.silo)
+    parallel = KeywordDiscovery(barn.silo, workers=2)
+    assert parallel.view_keywords() == serial.view_keywords()
+    assert all(parallel.get_postings(kw) == serial.get_postings(kw) for kw in serial.view_keywords())
+    assert parallel.top_keywords(k=10) == serial.top_keywords(k=10)
+
+def test_silo_options():
+    data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
+    barn = Barn(data_path, memory_budget=1_000_000, compression='zlib', streaming=True)
+    assert barn.silo.memory_budget == 1_000_000 and barn.silo.compression == 'zlib'
+    assert not any(page.is_loaded for page in barn.silo.documents['default']['pages'])
+    assert barn.call_tool('get_page_content', page_identifier=2)['page_number'] == 2
+
+def test_tool_sync_releases_bodies(hip_path):
+    barn = Barn(hip_path, streaming=True)
+    assert barn.call_tool('view_keywords')
+    assert barn.call_tool('view_tables')
+    assert barn.call_tool('view_pages')
+    assert barn.call_tool('find_relevant_tables', search_query='acetabular')
+    # Syncing the tools read every page body once and released it again
+    pages = barn.silo.documents['default']['pages']
+    assert not any(page.is_loaded for page in pages)
+    assert barn.call_tool('get_page_content', page_identifier=2)
+    assert [page['page_id'] for page in pages if page.is_loaded] == ['page_2']
+
+def test_numeric_row_filters():
+    barn = setup_barn()
+    chips = 'Compatibility of Chip Brands with Sandwich Toppings'
+    cost = 'Additional Cost with Sandwich (USD)'
+    rows = barn.call_tool('get_rows_in_range', table_name=chips, column=cost, minimum=1, maximum=1.75)
+    assert [row['Chip Brand'] for row in rows['matching_rows']] == ['Lays', 'Juantonios']
+    assert barn.call_tool('get_row_data', table_name=chips, column=cost, target='2')['matching_rows'][0]['Chip Brand'] == 'Frito'
+    assert barn.call_tool('get_table_data', table_name=chips)['numeric_columns'][cost] == 'USD'
+    # Tables kept as row lists filter on the same parsed values
+    from src.silo import Silo
+    from src.toolshed.retrieval import RowRetriever
+    silo = Silo(columnar=False)
+    silo.load_document('default', os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'))
+    assert RowRetriever(silo).get_rows_in_range(chips, cost, minimum=1, maximum=1.75) == rows
@@ -0,0 +1,100 @@
+import shutil
+import src.config
+from src.config import DataDiscovery
+from src.silo import Silo
+
+def test_discover_zip_archives(tmp_path):
+    shutil.copy('data/example_pbj_output.zip', tmp_path)
+    datasets = DataDiscovery(tmp_path).discover_datasets()
+    assert len(datasets) == 1
+    dataset = next(iter(datasets.values()))
+    assert dataset.page_count > 0
+    assert 'example_pbj_output.zip' in str(dataset.path)
+    silo = Silo()
+    assert silo.load_document(dataset.document_id, str(dataset.path)) is True
+
+def test_extracted_copy_preferred(tmp_path):
+    shutil.copytree('data/pb&j_20250626_173624', tmp_path / 'pb&j_20250626_173624')
+    shutil.copy('data/example_pbj_output.zip', tmp_path)
+    datasets = DataDiscovery(tmp_path).discover_datasets()
+    assert len(datasets) == 1
+    assert '.zip' not in str(next(iter(datasets.values())).path)
+
+def test_discovery_manifest(tmp_path, monkeypatch):
+    dataset_dir = tmp_path / 'pb&j_20250626_173624'
+    shutil.copytree('data/pb&j_20250626_173624', dataset_dir)
+    first = DataDiscovery(tmp_path).discover_datasets()
+    assert src.config.default_manifest_path(tmp_path).exists()
+    assert not (tmp_path / 'discovery_manifest.json').exists()
+    
+    # Unchanged files are served from the manifest without being read
+    def fail(*args, **kwargs):
+        raise AssertionError('unchanged file was read')
+    monkeypatch.setattr(src.config, 'read_top_level_fields', fail)
+    assert DataDiscovery(tmp_path).discover_datasets() == first
+    monkeypatch.undo()
+    
+    final_output = dataset_dir / 'final_output.json'
+    final_output.write_text(final_output.read_text() + '\n')
+    reads = []
+    read_fields = src.config.read_top_level_fields
+    def recording_read(path, names):
+        reads.append(path)
+        return read_fields(path, names)
+    monkeypatch.setattr(src.config, 'read_top_level_fields', recording_read)
+    assert DataDiscovery(tmp_path).discover_datasets() == first
+    assert reads == [str(final_output)]
+
+def test_discovery_manifest_fallback(tmp_path, monkeypatch):
+    shutil.copytree('data/pb&j_20250626_173624', tmp_path / 'data' / 'pb&j_20250626_173624')
+    # An unusable cache directory falls back to the data root
+    (tmp_path / 'cache').write_text('not a directory')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    discovery = DataDiscovery(tmp_path / 'data')
+    first = discovery.discover_datasets()
+    assert (tmp_path / 'data' / 'discovery_manifest.json').exists()
+    assert not discovery.has_changes()
+    # An explicit location is used as is
+    manifest_path = tmp_path / 'manifest.json'
+    assert DataDiscovery(tmp_path / 'data', manifest_path=manifest_path).discover_datasets() == first
+    assert manifest_path.exists()
+
+def test_recursive_parallel_discovery(tmp_path):
+    shutil.copytree('data/pb&j_20250626_173624', tmp_path / 'kitchen' / 'pb&j_20250626_173624')
+    shutil.copytree('data/Hip_TRTIIH_SP_2_20250703_121853', tmp_path / 'Hip_TRTIIH_SP_2_20250703_121853')
+    shutil.copy('data/example_pbj_output.zip', tmp_path / 'kitchen')
+    assert len(DataDiscovery(tmp_path, max_workers=4).discover_datasets()) == 1
+    datasets = DataDiscovery(tmp_path, max_workers=4, recursive=True).discover_datasets()
+    assert len(datasets) == 2
+    paths = sorted(str(dataset.path) for dataset in datasets.values())
+    assert paths == sorted([
+        str(tmp_path / 'Hip_TRTIIH_SP_2_20250703_121853' / 'final_output.json'),
+        str(tmp_path / 'kitchen' / 'pb&j_20250626_173624' / 'final_output.json'),
+    ])
+    assert datasets == DataDiscovery(tmp_path, max_workers=1, recursive=True).discover_datasets()
+
+def test_incremental_refresh(tmp_path):
+    from src.config import ConfigManager
+    shutil.copytree('data/pb&j_20250626_173624', tmp_path / 'pb&j_20250626_173624')
+    manager = ConfigManager(tmp_path)
+    datasets = manager.config.datasets
+    received = []
+    manager.subscribe(received.append)
+    assert not manager.discovery.has_changes()
+    assert not manager.refresh_datasets()
+    
+    shutil.copytree('data/Hip_TRTIIH_SP_2_20250703_121853', tmp_path / 'Hip_TRTIIH_SP_2_20250703_121853')
+    changes = manager.refresh_datasets()
+    assert [dataset.document_id for dataset in changes.added.values()] == ['Hip_TRTIIH_SP_2_20250703_121853']
+    assert manager.config.datasets is datasets and len(datasets) == 2
+    
+    final_output = tmp_path / 'pb&j_20250626_173624' / 'final_output.json'
+    final_output.write_text(final_output.read_text() + '\n')
+    changes = manager.refresh_datasets()
+    assert list(changes.modified) == ['Which Sandwich?'] and not changes.added and not changes.removed
+    
+    shutil.rmtree(tmp_path / 'Hip_TRTIIH_SP_2_20250703_121853')
+    changes = manager.refresh_datasets()
+    assert [dataset.document_id for dataset in changes.removed.values()] == ['Hip_TRTIIH_SP_2_20250703_121853']
+    assert manager.config.default_dataset == 'Which Sandwich?'
+    assert len(received) == 3
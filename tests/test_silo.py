@@ -1,6 +1,8 @@
 import os
 import pytest
 from src.silo import Silo
+from src.columnar import RowSequence, match_rows, parse_number
+from src.document_cache import DocumentCache
 
 def test_load_document():
     silo = Silo()
@@ -25,4 +27,331 @@ def test_get_all_tables():
     tables = silo.get_all_tables()
     assert isinstance(tables, list)
     assert len(tables) > 0
-    assert 'table_id' in tables[0] 
\ No newline at end of file
+    assert 'table_id' in tables[0] 
+
+def test_lookup_indexes():
+    silo = Silo()
+    data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
+    silo.load_document('testdoc', data_path)
+    page = silo.get_page_by_id('page_4', 'testdoc')
+    assert page['doc_id'] == 'testdoc'
+    table = silo.get_table_by_title('b.l.t.  sandwich preparation measurements')
+    assert table['title'] == 'B.L.T. Sandwich Preparation Measurements'
+    assert table['page_id'] == 'page_4'
+    assert silo.get_table_by_id('table_1')['page_id'] == table['page_id']
+    assert silo.get_table_by_title('B.L.T. Sandwich Preparation Measurements', 'otherdoc') is None
+
+def test_lookup_indexes_follow_removal():
+    silo = Silo()
+    data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
+    silo.load_document('doc1', data_path)
+    silo.load_document('doc2', data_path)
+    assert silo.get_page_by_id('page_1')['doc_id'] == 'doc1'
+    silo.remove_document('doc1')
+    assert silo.get_page_by_id('page_1')['doc_id'] == 'doc2'
+    silo.clear()
+    assert silo.get_page_by_id('page_1') is None
+    assert silo.get_table_by_title('B.L.T. Sandwich Preparation Measurements') is None
+
+def test_iter_views():
+    silo = Silo()
+    data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
+    silo.load_document('testdoc', data_path)
+    pages = list(silo.iter_pages())
+    assert len(pages) == len(silo.get_all_pages())
+    assert pages[0]['doc_id'] == 'testdoc'
+    assert dict(pages[0]) == silo.get_all_pages()[0]
+    tables = list(silo.iter_tables('testdoc'))
+    assert [t['table_id'] for t in tables] == [t['table_id'] for t in silo.get_all_tables()]
+    assert tables[0]['page_id'] == tables[0].page_id
+    with pytest.raises(TypeError):
+        tables[0]['title'] = 'changed'
+    assert list(silo.iter_pages('missing')) == []
+
+def test_streaming_load():
+    data_path = os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')
+    eager = Silo()
+    eager.load_document('doc', data_path)
+    silo = Silo()
+    assert silo.load_document('doc', data_path, streaming=True) is True
+    info = silo.get_document_info('doc')
+    assert info.page_count == eager.get_document_info('doc').page_count
+    assert info.table_count == eager.get_document_info('doc').table_count
+    page = silo.documents['doc']['pages'][0]
+    assert not page.is_loaded
+    assert page['title'] == eager.documents['doc']['pages'][0]['title']
+    assert not page.is_loaded
+    assert dict(page) == eager.documents['doc']['pages'][0]
+    assert page.is_loaded
+    assert silo.get_all_tables() == eager.get_all_tables()
+
+def test_load_page_directory(tmp_path):
+    dataset_dir = os.path.join('data', 'pb&j_20250626_173624')
+    manifest_path = str(tmp_path / 'page_manifest.json')
+    eager = Silo()
+    eager.load_document('doc', os.path.join(dataset_dir, 'final_output.json'))
+    silo = Silo()
+    assert silo.load_page_directory('doc', dataset_dir, manifest_path) is True
+    assert os.path.exists(manifest_path)
+    assert silo.get_document_info('doc').table_count == eager.get_document_info('doc').table_count
+    assert not any(page.is_loaded for page in silo.documents['doc']['pages'])
+    title = 'B.L.T. Sandwich Preparation Measurements'
+    assert silo.get_table_by_title(title) == eager.get_table_by_title(title)
+    assert sum(page.is_loaded for page in silo.documents['doc']['pages']) == 1
+    # Second load is served from the manifest
+    again = Silo()
+    assert again.load_page_directory('doc', dataset_dir, manifest_path) is True
+    assert again.get_page_by_id('page_4')['title'] == eager.get_page_by_id('page_4')['title']
+
+def test_snapshot_round_trip(tmp_path):
+    silo = Silo()
+    silo.load_document('pbj', os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'))
+    silo.load_document('hip', os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'))
+    snapshot_path = str(tmp_path / 'corpus.silo')
+    silo.save_snapshot(snapshot_path)
+    restored = Silo()
+    assert restored.open_snapshot(snapshot_path) is True
+    assert restored.get_document_ids() == silo.get_document_ids()
+    assert not any(page.is_loaded for page in restored.documents['hip']['pages'])
+    assert restored.get_all_pages() == silo.get_all_pages()
+    assert restored.get_statistics()['total_tables'] == silo.get_statistics()['total_tables']
+
+def test_parallel_load_documents():
+    mappings = {
+        'pbj': os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'),
+        'hip': os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'),
+        'missing': os.path.join('data', 'missing', 'final_output.json'),
+    }
+    silo = Silo()
+    results = silo.load_documents(mappings, workers=2)
+    assert results == {'pbj': True, 'hip': True, 'missing': False}
+    assert silo.get_document_ids() == ['pbj', 'hip']
+    assert set(silo.load_timings) == set(mappings)
+    serial = Silo()
+    serial.load_documents(mappings)
+    assert silo.get_all_tables() == serial.get_all_tables()
+
+def test_change_events():
+    silo = Silo()
+    events = []
+    silo.subscribe(events.append)
+    data_path = os.path.join('data', 'pb&j_20250626_173624', 'final_output.json')
+    silo.load_document('doc1', data_path)
+    silo.load_document('doc1', data_path)
+    silo.clear()
+    assert [(e.kind, e.doc_id) for e in events] == [
+        ('document_added', 'doc1'),
+        ('document_removed', 'doc1'),
+        ('document_added', 'doc1'),
+        ('document_removed', 'doc1'),
+    ]
+    assert [e.version for e in events] == [1, 2, 3, 4]
+    assert silo.version == 4
+
+def test_columnar_tables():
+    data_path = os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')
+    columnar = Silo()
+    columnar.load_document('hip', data_path)
+    eager = Silo(columnar=False)
+    eager.load_document('hip', data_path)
+    assert columnar.get_all_tables() == eager.get_all_tables()
+    assert all(isinstance(table['rows'], list) for table in columnar.get_all_tables())
+    stored = [table['rows'] for table in columnar.iter_tables()]
+    assert any(isinstance(rows, RowSequence) for rows in stored)
+    view = columnar.get_table_by_id(eager.get_all_tables()[0]['table_id'], as_view=True)
+    rows = view['rows']
+    column = next(iter(rows[0]))
+    target = str(rows[0][column]).upper()
+    assert match_rows(rows, column, target) == match_rows(list(rows), column, target)
+    assert parse_number("+$2.00", "$") == 2.0
+    assert parse_number("1,250 mm", "mm") == 1250.0
+
+def test_string_interning():
+    data_path = os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')
+    # Parse the file twice, as two separate pipeline outputs would be
+    silo = Silo(document_cache=DocumentCache(max_bytes=0))
+    silo.load_document('first', data_path)
+    silo.load_document('second', data_path)
+    first, second = silo.get_all_tables()[0], silo.get_tables_by_document('second')[0]
+    assert first['metadata']['technical_category'] is second['metadata']['technical_category']
+    assert next(iter(first['rows'][0])) is next(iter(second['rows'][0]))
+    assert silo.intern_savings['second'] > silo.intern_savings['first'] > 0
+    assert silo.get_statistics()['intern_bytes_saved'] == sum(silo.intern_savings.values())
+    plain = Silo(intern_strings=False)
+    plain.load_document('first', data_path)
+    assert plain.get_all_tables() == silo.get_tables_by_document('first')
+    # Removing documents prunes their strings, so the pool does not only grow
+    pooled = silo.get_statistics()['interned_strings']
+    silo.remove_document('second')
+    assert silo.get_statistics()['interned_strings'] == pooled
+    silo.remove_document('first')
+    assert silo.get_statistics()['interned_strings'] < pooled // 10
+
+def test_memory_report():
+    from src.toolshed.discovery import KeywordDiscovery
+    silo = Silo()
+    silo.load_document('pbj', os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'))
+    silo.load_document('hip', os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'), streaming=True)
+    report = silo.memory_report()
+    pbj = report['documents']['pbj']
+    assert pbj['raw_content_bytes'] > 0 and pbj['table_row_bytes'] > 0
+    assert pbj['total_bytes'] == pbj['raw_content_bytes'] + pbj['table_row_bytes'] + pbj['other_bytes']
+    assert report['documents']['hip']['resident_pages'] == 0
+    assert report['caches'] == {}
+    KeywordDiscovery(silo).view_keywords()
+    report = silo.memory_report()
+    assert report['caches']['keyword_discovery'] > 0
+    assert report['total_bytes'] == (report['document_bytes'] + report['index_bytes']
+                                     + report['string_pool_bytes'] + report['decompressed_cache_bytes']
+                                     + report['document_cache_bytes'] + sum(report['caches'].values()))
+
+def test_memory_budget_eviction():
+    mappings = {
+        'pbj': os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'),
+        'hip': os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'),
+    }
+    reference = Silo()
+    reference.load_documents(mappings)
+    silo = Silo(memory_budget=1)
+    events = []
+    silo.subscribe(events.append)
+    silo.load_documents(mappings)
+    assert list(silo.documents) == ['hip']
+    assert silo.get_document_ids() == ['pbj', 'hip']
+    assert silo.get_document_info('pbj').page_count == reference.get_document_info('pbj').page_count
+    assert silo.get_tables_by_document('pbj') == reference.get_tables_by_document('pbj')
+    assert list(silo.documents) == ['pbj']
+    assert silo.get_table_by_id('table_1', 'hip') == reference.get_table_by_id('table_1', 'hip')
+    assert silo.residency == {'hits': 0, 'misses': 2, 'evictions': 3}
+    assert silo.get_page_by_id('page_1', 'hip')['doc_id'] == 'hip'
+    assert silo.residency['hits'] == 1
+    assert len(events) == 2
+    # Tool caches hold page IDs, so an evicted body is not kept alive by them
+    from src.toolshed.retrieval import PageRetriever
+    retriever = PageRetriever(silo)
+    assert retriever.get_page_by_number(2)['doc_id'] == 'hip'
+    resident = silo.memory_report()['caches']['page_retriever']
+    silo.get_tables_by_document('pbj')
+    assert 'hip' not in silo.documents
+    assert silo.memory_report()['caches']['page_retriever'] == resident
+    assert silo.remove_document('pbj') is True
+    assert silo.get_table_by_id('table_1', 'pbj') is None
+
+def test_memory_budget_counts_lazy_bodies():
+    silo = Silo(memory_budget=200_000)
+    silo.load_document('pbj', os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'))
+    silo.load_document('hip', os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'), streaming=True)
+    headers_only = silo.get_statistics()['residency']['resident_bytes']
+    assert list(silo.documents) == ['pbj', 'hip']
+    for page in silo.iter_pages('hip'):
+        page['raw_content']
+    # Bodies read after loading count towards the budget and push pbj out
+    assert silo.get_statistics()['residency']['resident_bytes'] > headers_only
+    assert list(silo.documents) == ['hip']
+
+def test_compressed_raw_content():
+    data_path = os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')
+    plain = Silo()
+    plain.load_document('hip', data_path)
+    for codec in ('zlib', 'lzma'):
+        silo = Silo(compression=codec, decompressed_cache_bytes=4096)
+        silo.load_document('hip', data_path)
+        assert silo.get_all_pages() == plain.get_all_pages()
+        assert silo.get_page_by_id('page_2', as_view=True)['raw_content'] == plain.get_page_by_id('page_2')['raw_content']
+        stats = silo.get_statistics()['compression']
+        assert stats['codec'] == codec and stats['size_bytes'] <= 4096 and stats['evictions'] > 0
+        report = silo.memory_report()['documents']['hip']
+        assert report['raw_content_bytes'] < plain.memory_report()['documents']['hip']['raw_content_bytes']
+    with pytest.raises(ValueError):
+        Silo(compression='bz3')
+
+def test_decompressed_cache_memory():
+    silo = Silo(compression='zlib', memory_budget=10_000_000)
+    silo.load_document('hip', os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'))
+    before = silo.memory_report()
+    resident = silo.get_statistics()['residency']['resident_bytes']
+    for page in silo.iter_pages('hip'):
+        page['raw_content']
+    # The shared cache is reported on its own line, not charged to the document
+    after = silo.memory_report()
+    assert after['decompressed_cache_bytes'] > 0
+    assert after['documents']['hip']['total_bytes'] == before['documents']['hip']['total_bytes']
+    assert silo.get_statistics()['residency']['resident_bytes'] == resident
+
+def test_load_from_zip_archive():
+    reference = Silo()
+    reference.load_document('hip', os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json'))
+    archive = os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853.zip')
+    for streaming in (False, True):
+        silo = Silo()
+        assert silo.load_document('hip', archive, streaming=streaming) is True
+        assert silo.get_all_pages() == reference.get_all_pages()
+    member = os.path.join('data', 'example_pbj_output.zip', 'pb&j_20250626_173624', 'final_output.json')
+    assert Silo().load_document('pbj', member) is True
+    silo = Silo()
+    assert silo.load_page_directory('hip', archive) is True
+    assert silo.get_page_by_id('page_3')['title'] == reference.get_page_by_id('page_3')['title']
+
+def test_reload_document(tmp_path):
+    import json
+    with open(os.path.join('data', 'Hip_TRTIIH_SP_2_20250703_121853', 'final_output.json')) as f:
+        data = json.load(f)
+    data_path = str(tmp_path / 'final_output.json')
+    with open(data_path, 'w') as f:
+        json.dump(data, f)
+    for streaming in (False, True):
+        silo = Silo(compression='zlib')
+        silo.load_document('hip', data_path, streaming=streaming)
+        kept = silo.documents['hip']['pages'][0]
+        events = []
+        silo.subscribe(events.append)
+        assert silo.reload_document('hip').has_changes is False
+        assert events == []
+        
+        changed = json.loads(json.dumps(data))
+        changed['pages'][3]['tables'][0]['title'] = 'Renamed Table'
+        changed['pages'][3]['processing_metadata'] = {'reprocessed': True}
+        removed = changed['pages'].pop(5)
+        with open(data_path, 'w') as f:
+            json.dump(changed, f)
+        diff = silo.reload_document('hip')
+        assert diff.changed_pages == ['page_12']
+        # Streamed page bodies cannot be re-read once the file changed, so
+        # every table of a changed page is reported
+        tables = data['pages'][3]['tables'][:1 if not streaming else None]
+        assert diff.changed_tables == [('page_12', table['table_id']) for table in tables]
+        assert diff.removed_pages == [removed['page_id']]
+        assert diff.added_pages == [] and diff.unchanged_pages == 24
+        assert [(e.kind, e.diff) for e in events] == [('document_changed', diff)]
+        assert silo.documents['hip']['pages'][0] is kept
+        if streaming:
+            kept.release()
+        assert silo.get_page_by_id(kept['page_id'], 'hip')['raw_content'] == data['pages'][0]['raw_content']
+        assert silo.get_table_by_title('Renamed Table')['page_id'] == 'page_12'
+        assert silo.get_page_by_id(removed['page_id']) is None
+        assert silo.get_document_info('hip').page_count == 25
+        with open(data_path, 'w') as f:
+            json.dump(data, f)
+    assert Silo().reload_document('missing') is None
+
+def test_shared_document_cache(tmp_path):
+    import json
+    import shutil
+    data_path = str(tmp_path / 'final_output.json')
+    shutil.copy(os.path.join('data', 'pb&j_20250626_173624', 'final_output.json'), data_path)
+    cache = DocumentCache()
+    first, second = Silo(document_cache=cache), Silo(columnar=False, intern_strings=False, document_cache=cache)
+    first.load_document('doc', data_path)
+    second.load_document('doc', data_path)
+    assert first.get_all_tables() == second.get_all_tables()
+    # Only the header fields dataset discovery reads are kept, not the pages
+    with open(data_path) as f:
+        data = json.load(f)
+    assert cache.get(data_path) == {name: data[name] for name in ('document_info', 'document_summary')}
+    assert cache.stats()['hits'] == 1 and cache.stats()['entries'] == 1
+    assert first.memory_report()['document_cache_bytes'] > 0
+    
+    with open(data_path, 'a') as f:
+        f.write('\n')
+    assert cache.get(data_path) is None
+    assert DocumentCache(max_bytes=0).load(data_path)['document_info'] == first.documents['doc']['document_info']